@@ -30,7 +30,35 @@ API_SERVICE_OPTS = [
     cfg.IntOpt('max_limit',
                default=1000,
                help='The maximum number of items returned in a single '
-                    'response from a collection resource.')
+                    'response from a collection resource.'),
+    cfg.IntOpt('max_wait_for_change',
+               default=60,
+               help='The maximum number of seconds a request can wait for '
+                    'a bay to change with the wait_for_change parameter.'),
+    cfg.IntOpt('wait_for_change_interval',
+               default=5,
+               help='The number of seconds between two checks of a bay '
+                    'while a request waits for it to change. Requests are '
+                    'woken up earlier by the bay update notifications of '
+                    'the conductor when notifications are enabled.'),
+    cfg.BoolOpt('enable_compression',
+                default=True,
+                help='Compress the responses with gzip or deflate when the '
+                     'client accepts it.'),
+    cfg.IntOpt('compression_min_size',
+               default=1024,
+               help='The minimum size in bytes of a response body for it '
+                    'to be compressed.'),
+    cfg.IntOpt('compression_level',
+               default=6,
+               min=1,
+               max=9,
+               help='The compression level, from 1 (fastest) to 9 '
+                    '(smallest).'),
+    cfg.IntOpt('max_batch_sign',
+               default=100,
+               help='The maximum number of certificate signing requests a '
+                    'single batch signing request can contain.'),
 ]
 
 CONF = cfg.CONF
@@ -59,4 +87,11 @@ def setup_app(config=None):
         **app_conf
     )
 
-    return auth.install(app, CONF, config.app.acl_public_routes)
+    app = auth.install(app, CONF, config.app.acl_public_routes)
+
+    if CONF.api.enable_compression:
+        app = middleware.CompressionMiddleware(
+            app, min_size=CONF.api.compression_min_size,
+            level=CONF.api.compression_level)
+
+    return app
@@ -23,6 +23,7 @@ app = {
     'debug': False,
     'hooks': [
         hooks.ContextHook(),
+        hooks.ObjectCacheHook(),
         hooks.RPCHook(),
         hooks.NoExceptionTracebackHook(),
     ],
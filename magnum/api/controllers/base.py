@@ -29,6 +29,24 @@ class APIBase(wtypes.Base):
     updated_at = wsme.wsattr(datetime.datetime, readonly=True)
     """The time in UTC at which the object is updated"""
 
+    # Fields whose setters look up referenced resources, mapped to the
+    # attribute holding their value. See from_view().
+    _view_attrs = {}
+
+    @classmethod
+    def from_view(cls, view):
+        """Build an API object straight from a read-only object view.
+
+        Values loaded from the database are trusted, so the setters listed
+        in _view_attrs are bypassed instead of re-resolving references.
+        """
+        obj = cls()
+        for field in obj.fields:
+            if hasattr(view, field):
+                setattr(obj, cls._view_attrs.get(field, field),
+                        getattr(view, field))
+        return obj
+
     def as_dict(self):
         """Render this object as a dict of its fields."""
         return dict((k, getattr(self, k))
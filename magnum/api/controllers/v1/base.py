@@ -39,6 +39,8 @@ class K8sResourceBase(base.APIBase):
 
     _bay_uuid = None
 
+    _view_attrs = {'bay_uuid': '_bay_uuid'}
+
     def _get_bay_uuid(self):
         return self._bay_uuid
 
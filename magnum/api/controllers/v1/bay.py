@@ -14,7 +14,9 @@
 #    under the License.
 
 import datetime
+import time
 
+from oslo_config import cfg
 import pecan
 from pecan import rest
 import wsme
@@ -26,8 +28,11 @@ from magnum.api.controllers.v1 import collection
 from magnum.api.controllers.v1 import types
 from magnum.api.controllers.v1 import utils as api_utils
 from magnum.api import expose
+from magnum.api import watch
 from magnum.common import exception
 from magnum.common import policy
+from magnum.common import utils
+from magnum.i18n import _
 from magnum import objects
 
 
@@ -54,6 +59,8 @@ class Bay(base.APIBase):
 
     _baymodel_id = None
 
+    _view_attrs = {'baymodel_id': '_baymodel_id'}
+
     def _get_baymodel_id(self):
         return self._baymodel_id
 
@@ -107,6 +114,10 @@ class Bay(base.APIBase):
     node_addresses = wsme.wsattr([wtypes.text], readonly=True)
     """Ip addresses of cluster slave nodes"""
 
+    # Fields kept in the non-expanded representation of a bay
+    _summary_fields = ['uuid', 'name', 'baymodel_id', 'node_count', 'status',
+                       'bay_create_timeout', 'master_count']
+
     def __init__(self, **kwargs):
         super(Bay, self).__init__()
 
@@ -119,11 +130,11 @@ class Bay(base.APIBase):
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
-    def _convert_with_links(bay, url, expand=True):
-        if not expand:
-            bay.unset_fields_except(['uuid', 'name', 'baymodel_id',
-                                     'node_count', 'status',
-                                     'bay_create_timeout', 'master_count'])
+    def _convert_with_links(bay, url, expand=True, fields=None):
+        if fields is not None:
+            bay.unset_fields_except(fields)
+        elif not expand:
+            bay.unset_fields_except(Bay._summary_fields)
 
         bay.links = [link.Link.make_link('self', url,
                                          'bays', bay.uuid),
@@ -164,10 +175,16 @@ class BayCollection(collection.Collection):
         self._type = 'bays'
 
     @staticmethod
-    def convert_with_links(rpc_bays, limit, url=None, expand=False, **kwargs):
+    def convert_with_links(rpc_bays, limit, url=None, expand=False,
+                           fields=None, **kwargs):
+        """Convert a list of :class:`magnum.objects.bay.BayView`."""
         collection = BayCollection()
-        collection.bays = [Bay.convert_with_links(p, expand)
+        host_url = pecan.request.host_url
+        collection.bays = [Bay._convert_with_links(Bay.from_view(p),
+                                                   host_url, expand, fields)
                            for p in rpc_bays]
+        if fields is not None:
+            kwargs['fields'] = ','.join(fields)
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
 
@@ -178,6 +195,18 @@ class BayCollection(collection.Collection):
         return sample
 
 
+class BayBulk(wtypes.Base):
+    """API representation of a bulk creation of bays."""
+
+    bay = wsme.wsattr(Bay, mandatory=True)
+    """The bay every created bay is built from. When it has a name, the
+       bays are named <name>-1 to <name>-<count>."""
+
+    count = wsme.wsattr(wtypes.IntegerType(minimum=1), mandatory=True)
+    """The number of bays to create. As every bay is created on the same
+       cluster, it cannot be more than 1."""
+
+
 class BaysController(rest.RestController):
     """REST controller for Bays."""
     def __init__(self):
@@ -185,11 +214,13 @@ class BaysController(rest.RestController):
 
     _custom_actions = {
         'detail': ['GET'],
+        'bulk': ['POST'],
     }
 
     def _get_bays_collection(self, marker, limit,
                              sort_key, sort_dir, expand=False,
-                             resource_url=None):
+                             resource_url=None, filters=None,
+                             fields=None):
 
         limit = api_utils.validate_limit(limit)
         sort_dir = api_utils.validate_sort_dir(sort_dir)
@@ -199,37 +230,64 @@ class BaysController(rest.RestController):
             marker_obj = objects.Bay.get_by_uuid(pecan.request.context,
                                                  marker)
 
+        # NOTE: only load the columns which are going to be rendered
+        columns = fields or (None if expand else Bay._summary_fields)
         bays = pecan.request.rpcapi.bay_list(
             pecan.request.context, limit,
             marker_obj, sort_key=sort_key,
-            sort_dir=sort_dir)
+            sort_dir=sort_dir, filters=filters, columns=columns)
+
+        not_modified = api_utils.check_etag(
+            api_utils.get_etag([b.as_dict() for b in bays]))
+        if not_modified:
+            return not_modified
 
         return BayCollection.convert_with_links(bays, limit,
                                                 url=resource_url,
                                                 expand=expand,
+                                                fields=fields,
                                                 sort_key=sort_key,
                                                 sort_dir=sort_dir)
 
+    @staticmethod
+    def _get_filters(name, status, baymodel_id):
+        return api_utils.get_filters(name=name,
+                                     status=api_utils.parse_list(status),
+                                     baymodel_id=baymodel_id)
+
     @policy.enforce_wsgi("bay")
     @expose.expose(BayCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   wtypes.text, wtypes.text, types.uuid, wtypes.text)
     def get_all(self, bay_uuid=None, marker=None, limit=None,
-                sort_key='id', sort_dir='asc'):
+                sort_key='id', sort_dir='asc', name=None, status=None,
+                baymodel_id=None, fields=None):
         """Retrieve a list of bays.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param name: only return bays with this name.
+        :param status: only return bays in one of these comma separated
+                       statuses.
+        :param baymodel_id: only return bays created from this baymodel.
+        :param fields: only return these comma separated fields of the
+                       bays, e.g. "uuid,status".
         """
+        filters = self._get_filters(name, status, baymodel_id)
+        fields = api_utils.parse_fields(fields, Bay)
         return self._get_bays_collection(marker, limit, sort_key,
-                                         sort_dir)
+                                         sort_dir, filters=filters,
+                                         fields=fields)
 
     @policy.enforce_wsgi("bay")
     @expose.expose(BayCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   wtypes.text, wtypes.text, types.uuid, wtypes.text)
     def detail(self, bay_uuid=None, marker=None, limit=None,
-               sort_key='id', sort_dir='asc'):
+               sort_key='id', sort_dir='asc', name=None, status=None,
+               baymodel_id=None, fields=None):
         """Retrieve a list of bays with detail.
 
         :param bay_uuid: UUID of a bay, to get only bays for that bay.
@@ -237,6 +295,12 @@ class BaysController(rest.RestController):
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param name: only return bays with this name.
+        :param status: only return bays in one of these comma separated
+                       statuses.
+        :param baymodel_id: only return bays created from this baymodel.
+        :param fields: only return these comma separated fields of the
+                       bays, e.g. "uuid,status".
         """
         # NOTE(lucasagomes): /detail should only work agaist collections
         parent = pecan.request.path.split('/')[:-1][-1]
@@ -245,18 +309,60 @@ class BaysController(rest.RestController):
 
         expand = True
         resource_url = '/'.join(['bays', 'detail'])
+        filters = self._get_filters(name, status, baymodel_id)
+        fields = api_utils.parse_fields(fields, Bay)
         return self._get_bays_collection(marker, limit,
                                          sort_key, sort_dir, expand,
-                                         resource_url)
+                                         resource_url, filters, fields)
+
+    @staticmethod
+    def _wait_for_change(rpc_bay, etag, timeout):
+        """Wait until the bay differs from the one known by the client.
+
+        The client knows the bay matching its If-None-Match header, or the
+        current bay when it does not send one.
+
+        :param rpc_bay: the current bay.
+        :param etag: the ETag of the current bay.
+        :param timeout: maximum number of seconds to wait.
+        :returns: a tuple of the latest bay and its ETag.
+        """
+        known = pecan.request.if_none_match or set([etag])
+        timeout = min(timeout, cfg.CONF.api.max_wait_for_change)
+        deadline = time.time() + timeout
+        context = pecan.request.context
+        while etag in known:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            watch.WATCHER.wait(rpc_bay.uuid, min(
+                remaining, cfg.CONF.api.wait_for_change_interval))
+            rpc_bay = objects.Bay.get_by_uuid(context, rpc_bay.uuid)
+            etag = api_utils.get_etag(rpc_bay.as_dict())
+        return rpc_bay, etag
 
     @policy.enforce_wsgi("bay", "get")
-    @expose.expose(Bay, types.uuid_or_name)
-    def get_one(self, bay_ident):
+    @expose.expose(Bay, types.uuid_or_name, int)
+    def get_one(self, bay_ident, wait_for_change=None):
         """Retrieve information about the given bay.
 
         :param bay_ident: UUID of a bay or logical name of the bay.
+        :param wait_for_change: Optional number of seconds to wait for the
+                                bay to change before returning it, capped
+                                by [api]max_wait_for_change. The bay is
+                                returned as soon as it differs from the one
+                                given by If-None-Match, or from the current
+                                one without that header.
         """
         rpc_bay = api_utils.get_rpc_resource('Bay', bay_ident)
+        etag = api_utils.get_etag(rpc_bay.as_dict())
+        if wait_for_change:
+            rpc_bay, etag = self._wait_for_change(rpc_bay, etag,
+                                                  wait_for_change)
+
+        not_modified = api_utils.check_etag(etag)
+        if not_modified:
+            return not_modified
 
         return Bay.convert_with_links(rpc_bay)
 
@@ -283,6 +389,45 @@ class BaysController(rest.RestController):
         pecan.response.location = link.build_url('bays', res_bay.uuid)
         return Bay.convert_with_links(res_bay)
 
+    @policy.enforce_wsgi("bay", "create")
+    @expose.expose(BayCollection, body=BayBulk, status_code=201)
+    def bulk(self, bulk):
+        """Create several bays from the same bay in one conductor call.
+
+        Every bay is in the response, in order. A bay which failed to be
+        created has the CREATE_FAILED status and the error as its
+        status_reason, and is not stored.
+
+        Every bay is created on the same cluster, so a bulk creation cannot
+        create more than one bay.
+
+        :param bulk: the bay to create and the number of copies.
+        """
+        if bulk.count > 1:
+            raise wsme.exc.ClientSideError(
+                _("Cannot create more than one bay at once"))
+
+        bay_dict = bulk.bay.as_dict()
+        context = pecan.request.context
+        bay_dict['project_id'] = context.project_id
+        bay_dict['user_id'] = context.user_id
+        if bay_dict.get('node_count', None) is None:
+            bay_dict['node_count'] = 1
+
+        new_bays = []
+        for index in range(1, bulk.count + 1):
+            values = dict(bay_dict)
+            # NOTE: every bay gets its own uuid, which also identifies the
+            # bays which fail to be created in the response
+            values['uuid'] = utils.generate_uuid()
+            if bay_dict.get('name'):
+                values['name'] = '%s-%d' % (bay_dict['name'], index)
+            new_bays.append(objects.Bay(context, **values))
+
+        res_bays = pecan.request.rpcapi.bay_create_bulk(
+            new_bays, bulk.bay.bay_create_timeout)
+        return BayCollection.convert_with_links(res_bays, None, expand=True)
+
     @policy.enforce_wsgi("bay", "update")
     @wsme.validate(types.uuid, [BayPatchType])
     @expose.expose(Bay, types.uuid_or_name, body=[BayPatchType])
@@ -111,6 +111,9 @@ class BayModel(base.APIBase):
     """Its comma separated list of ip for which proxies should not
        used in the bay"""
 
+    # Fields kept in the non-expanded representation of a baymodel
+    _summary_fields = ['uuid', 'name', 'image_id', 'apiserver_port', 'coe']
+
     def __init__(self, **kwargs):
         self.fields = []
         for field in objects.BayModel.fields:
@@ -121,10 +124,11 @@ class BayModel(base.APIBase):
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
-    def _convert_with_links(baymodel, url, expand=True):
-        if not expand:
-            baymodel.unset_fields_except(['uuid', 'name', 'image_id',
-                                          'apiserver_port', 'coe'])
+    def _convert_with_links(baymodel, url, expand=True, fields=None):
+        if fields is not None:
+            baymodel.unset_fields_except(fields)
+        elif not expand:
+            baymodel.unset_fields_except(BayModel._summary_fields)
 
         baymodel.links = [link.Link.make_link('self', url,
                                               'baymodels', baymodel.uuid),
@@ -134,10 +138,10 @@ class BayModel(base.APIBase):
         return baymodel
 
     @classmethod
-    def convert_with_links(cls, rpc_baymodel, expand=True):
+    def convert_with_links(cls, rpc_baymodel, expand=True, fields=None):
         baymodel = BayModel(**rpc_baymodel.as_dict())
         return cls._convert_with_links(baymodel, pecan.request.host_url,
-                                       expand)
+                                       expand, fields)
 
     @classmethod
     def sample(cls, expand=True):
@@ -175,10 +179,13 @@ class BayModelCollection(collection.Collection):
 
     @staticmethod
     def convert_with_links(rpc_baymodels, limit, url=None, expand=False,
-                           **kwargs):
+                           fields=None, **kwargs):
         collection = BayModelCollection()
-        collection.baymodels = [BayModel.convert_with_links(p, expand)
+        collection.baymodels = [BayModel.convert_with_links(p, expand,
+                                                            fields)
                                 for p in rpc_baymodels]
+        if fields is not None:
+            kwargs['fields'] = ','.join(fields)
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
 
@@ -198,7 +205,8 @@ class BayModelsController(rest.RestController):
 
     def _get_baymodels_collection(self, marker, limit,
                                   sort_key, sort_dir, expand=False,
-                                  resource_url=None):
+                                  resource_url=None, filters=None,
+                                  fields=None):
 
         limit = api_utils.validate_limit(limit)
         sort_dir = api_utils.validate_sort_dir(sort_dir)
@@ -208,13 +216,22 @@ class BayModelsController(rest.RestController):
             marker_obj = objects.BayModel.get_by_uuid(pecan.request.context,
                                                       marker)
 
+        # NOTE: only load the columns which are going to be rendered
+        columns = fields or (None if expand else BayModel._summary_fields)
         baymodels = objects.BayModel.list(pecan.request.context, limit,
                                           marker_obj, sort_key=sort_key,
-                                          sort_dir=sort_dir)
+                                          sort_dir=sort_dir,
+                                          filters=filters, columns=columns)
+
+        not_modified = api_utils.check_etag(
+            api_utils.get_etag([b.as_dict() for b in baymodels]))
+        if not_modified:
+            return not_modified
 
         return BayModelCollection.convert_with_links(baymodels, limit,
                                                      url=resource_url,
                                                      expand=expand,
+                                                     fields=fields,
                                                      sort_key=sort_key,
                                                      sort_dir=sort_dir)
 
@@ -232,26 +249,42 @@ class BayModelsController(rest.RestController):
         except glanceclient.exc.HTTPForbidden:
             raise exception.ImageNotAuthorized(image_id=image_ident)
 
+    @staticmethod
+    def _get_filters(name, coe):
+        return api_utils.get_filters(name=name, coe=coe)
+
     @policy.enforce_wsgi("baymodel")
     @expose.expose(BayModelCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   wtypes.text, wtypes.text, wtypes.text)
     def get_all(self, baymodel_uuid=None, marker=None, limit=None,
-                sort_key='id', sort_dir='asc'):
+                sort_key='id', sort_dir='asc', name=None, coe=None,
+                fields=None):
         """Retrieve a list of baymodels.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param name: only return baymodels with this name.
+        :param coe: only return baymodels for this container orchestration
+                    engine.
+        :param fields: only return these comma separated fields of the
+                       baymodels, e.g. "uuid,name".
         """
+        filters = self._get_filters(name, coe)
+        fields = api_utils.parse_fields(fields, BayModel)
         return self._get_baymodels_collection(marker, limit, sort_key,
-                                              sort_dir)
+                                              sort_dir, filters=filters,
+                                              fields=fields)
 
     @policy.enforce_wsgi("baymodel")
     @expose.expose(BayModelCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   wtypes.text, wtypes.text, wtypes.text)
     def detail(self, baymodel_uuid=None, marker=None, limit=None,
-               sort_key='id', sort_dir='asc'):
+               sort_key='id', sort_dir='asc', name=None, coe=None,
+               fields=None):
         """Retrieve a list of baymodels with detail.
 
         :param baymodel_uuid: UUID of a baymodel, to get only baymodels for
@@ -260,6 +293,11 @@ class BayModelsController(rest.RestController):
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param name: only return baymodels with this name.
+        :param coe: only return baymodels for this container orchestration
+                    engine.
+        :param fields: only return these comma separated fields of the
+                       baymodels, e.g. "uuid,name".
         """
         # NOTE(lucasagomes): /detail should only work agaist collections
         parent = pecan.request.path.split('/')[:-1][-1]
@@ -268,9 +306,11 @@ class BayModelsController(rest.RestController):
 
         expand = True
         resource_url = '/'.join(['baymodels', 'detail'])
+        filters = self._get_filters(name, coe)
+        fields = api_utils.parse_fields(fields, BayModel)
         return self._get_baymodels_collection(marker, limit,
                                               sort_key, sort_dir, expand,
-                                              resource_url)
+                                              resource_url, filters, fields)
 
     @policy.enforce_wsgi("baymodel", "get")
     @expose.expose(BayModel, types.uuid_or_name)
@@ -280,6 +320,12 @@ class BayModelsController(rest.RestController):
         :param baymodel_ident: UUID or logical name of a baymodel.
         """
         rpc_baymodel = api_utils.get_rpc_resource('BayModel', baymodel_ident)
+
+        not_modified = api_utils.check_etag(
+            api_utils.get_etag(rpc_baymodel.as_dict()))
+        if not_modified:
+            return not_modified
+
         return BayModel.convert_with_links(rpc_baymodel)
 
     @policy.enforce_wsgi("baymodel", "create")
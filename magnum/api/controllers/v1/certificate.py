@@ -14,6 +14,7 @@
 
 import datetime
 
+from oslo_config import cfg
 import pecan
 from pecan import rest
 import wsme
@@ -26,6 +27,7 @@ from magnum.api.controllers.v1 import types
 from magnum.api.controllers.v1 import utils as api_utils
 from magnum.common import exception
 from magnum.common import policy
+from magnum.i18n import _
 from magnum import objects
 
 
@@ -115,6 +117,42 @@ class Certificate(base.APIBase):
         return cls._convert_with_links(sample, 'http://localhost:9511', expand)
 
 
+class CertificateBatchResult(base.APIBase):
+    """API representation of a certificate signed within a batch."""
+
+    csr = wtypes.text
+    """"The Certificate Signing Request"""
+
+    pem = wtypes.text
+    """"The Signed Certificate, unset when the csr was not signed"""
+
+    error = wtypes.text
+    """Why the csr was not signed"""
+
+
+class CertificateBatch(base.APIBase):
+    """API representation of a batch of certificate signing requests."""
+
+    bay_uuid = wsme.wsattr(wtypes.text, mandatory=True)
+    """The bay UUID or name"""
+
+    csrs = wsme.wsattr([wtypes.StringType(min_length=1)], mandatory=True)
+    """The Certificate Signing Requests"""
+
+    certificates = wsme.wsattr([CertificateBatchResult], readonly=True)
+    """The certificates, in the order of the csrs. Each has either its pem
+       or the error its csr failed with."""
+
+    @classmethod
+    def convert(cls, bay_uuid, rpc_certs):
+        batch = CertificateBatch(bay_uuid=bay_uuid)
+        batch.certificates = [
+            CertificateBatchResult(csr=c.csr, pem=c.pem or wtypes.Unset,
+                                   error=c.error or wtypes.Unset)
+            for c in rpc_certs]
+        return batch
+
+
 class CertificateController(rest.RestController):
     """REST controller for Certificate."""
 
@@ -123,6 +161,7 @@ class CertificateController(rest.RestController):
 
     _custom_actions = {
         'detail': ['GET'],
+        'batch': ['POST'],
     }
 
     @policy.enforce_wsgi("certificate", "get")
@@ -153,3 +192,33 @@ class CertificateController(rest.RestController):
         new_cert = pecan.request.rpcapi.sign_certificate(certificate.get_bay(),
                                                          cert_obj)
         return Certificate.convert_with_links(new_cert)
+
+    @policy.enforce_wsgi("certificate", "create")
+    @wsme_pecan.wsexpose(CertificateBatch, body=CertificateBatch,
+                         status_code=201)
+    def batch(self, batch):
+        """Sign several certificates of a bay in one conductor call.
+
+        :param batch: the bay and the certificate signing requests.
+        """
+        if not 0 < len(batch.csrs) <= cfg.CONF.api.max_batch_sign:
+            raise wsme.exc.ClientSideError(
+                _("A batch must contain between 1 and %d certificate "
+                  "signing requests") % cfg.CONF.api.max_batch_sign)
+
+        try:
+            rpc_bay = api_utils.get_rpc_resource('Bay', batch.bay_uuid)
+        except exception.BayNotFound as e:
+            e.code = 400  # BadRequest
+            raise e
+
+        context = pecan.request.context
+        cert_objs = [objects.Certificate(context,
+                                         project_id=context.project_id,
+                                         user_id=context.user_id,
+                                         bay_uuid=rpc_bay.uuid,
+                                         csr=csr)
+                     for csr in batch.csrs]
+
+        new_certs = pecan.request.rpcapi.sign_certificates(rpc_bay, cert_objs)
+        return CertificateBatch.convert(rpc_bay.uuid, new_certs)
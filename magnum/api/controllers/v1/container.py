@@ -32,7 +32,7 @@ from magnum.common import exception
 from magnum.common import policy
 from magnum.i18n import _LE
 from magnum import objects
-from magnum.objects import fields
+from magnum.objects import fields as m_fields
 
 LOG = logging.getLogger(__name__)
 
@@ -92,6 +92,10 @@ class Container(base.APIBase):
     status = wtypes.text
     """The status of container"""
 
+    # Fields kept in the non-expanded representation of a container
+    _summary_fields = ['uuid', 'name', 'bay_uuid', 'image', 'command',
+                       'status']
+
     def __init__(self, **kwargs):
         self.fields = []
         for field in objects.Container.fields:
@@ -102,10 +106,11 @@ class Container(base.APIBase):
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
-    def _convert_with_links(container, url, expand=True):
-        if not expand:
-            container.unset_fields_except(['uuid', 'name', 'bay_uuid',
-                                           'image', 'command', 'status'])
+    def _convert_with_links(container, url, expand=True, fields=None):
+        if fields is not None:
+            container.unset_fields_except(fields)
+        elif not expand:
+            container.unset_fields_except(Container._summary_fields)
 
         container.links = [link.Link.make_link(
             'self', url,
@@ -117,10 +122,10 @@ class Container(base.APIBase):
         return container
 
     @classmethod
-    def convert_with_links(cls, rpc_container, expand=True):
+    def convert_with_links(cls, rpc_container, expand=True, fields=None):
         container = Container(**rpc_container.as_dict())
         return cls._convert_with_links(container, pecan.request.host_url,
-                                       expand)
+                                       expand, fields)
 
     @classmethod
     def sample(cls, expand=True):
@@ -146,10 +151,13 @@ class ContainerCollection(collection.Collection):
 
     @staticmethod
     def convert_with_links(rpc_containers, limit, url=None,
-                           expand=False, **kwargs):
+                           expand=False, fields=None, **kwargs):
         collection = ContainerCollection()
-        collection.containers = [Container.convert_with_links(p, expand)
+        collection.containers = [Container.convert_with_links(p, expand,
+                                                              fields)
                                  for p in rpc_containers]
+        if fields is not None:
+            kwargs['fields'] = ','.join(fields)
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
 
@@ -272,7 +280,8 @@ class ContainersController(rest.RestController):
 
     def _get_containers_collection(self, marker, limit,
                                    sort_key, sort_dir, expand=False,
-                                   resource_url=None):
+                                   resource_url=None, filters=None,
+                                   fields=None):
 
         limit = api_utils.validate_limit(limit)
         sort_dir = api_utils.validate_sort_dir(sort_dir)
@@ -282,44 +291,67 @@ class ContainersController(rest.RestController):
             marker_obj = objects.Container.get_by_uuid(pecan.request.context,
                                                        marker)
 
+        # NOTE: only load the columns which are going to be rendered
+        columns = fields or (None if expand else Container._summary_fields)
         containers = objects.Container.list(pecan.request.context, limit,
                                             marker_obj, sort_key=sort_key,
-                                            sort_dir=sort_dir)
-        for i, c in enumerate(containers):
-            try:
-                containers[i] = pecan.request.rpcapi.container_show(c.uuid)
-            except Exception as e:
-                LOG.exception(_LE("Error while list container %(uuid)s: "
-                                  "%(e)s."),
-                              {'uuid': c.uuid, 'e': e})
-                containers[i].status = fields.ContainerStatus.UNKNOWN
+                                            sort_dir=sort_dir,
+                                            filters=filters, columns=columns)
+        # NOTE: the status is refreshed from docker, which is only needed
+        # when it is rendered.
+        if fields is None or 'status' in fields:
+            for i, c in enumerate(containers):
+                try:
+                    containers[i] = pecan.request.rpcapi.container_show(
+                        c.uuid)
+                except Exception as e:
+                    LOG.exception(_LE("Error while list container %(uuid)s: "
+                                      "%(e)s."),
+                                  {'uuid': c.uuid, 'e': e})
+                    containers[i].status = m_fields.ContainerStatus.UNKNOWN
 
         return ContainerCollection.convert_with_links(containers, limit,
                                                       url=resource_url,
                                                       expand=expand,
+                                                      fields=fields,
                                                       sort_key=sort_key,
                                                       sort_dir=sort_dir)
 
+    @staticmethod
+    def _get_filters(bay_uuid, name):
+        return api_utils.get_filters(bay_uuid=bay_uuid, name=name)
+
     @policy.enforce_wsgi("container")
     @expose.expose(ContainerCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   types.uuid, wtypes.text, wtypes.text)
     def get_all(self, container_uuid=None, marker=None, limit=None,
-                sort_key='id', sort_dir='asc'):
+                sort_key='id', sort_dir='asc', bay_uuid=None, name=None,
+                fields=None):
         """Retrieve a list of containers.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param bay_uuid: only return containers in this bay.
+        :param name: only return containers with this name.
+        :param fields: only return these comma separated fields of the
+                       containers, e.g. "uuid,status".
         """
+        filters = self._get_filters(bay_uuid, name)
+        fields = api_utils.parse_fields(fields, Container)
         return self._get_containers_collection(marker, limit, sort_key,
-                                               sort_dir)
+                                               sort_dir, filters=filters,
+                                               fields=fields)
 
     @policy.enforce_wsgi("container")
     @expose.expose(ContainerCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   types.uuid, wtypes.text, wtypes.text)
     def detail(self, container_uuid=None, marker=None, limit=None,
-               sort_key='id', sort_dir='asc'):
+               sort_key='id', sort_dir='asc', bay_uuid=None, name=None,
+               fields=None):
         """Retrieve a list of containers with detail.
 
         :param container_uuid: UUID of a container, to get only containers
@@ -328,6 +360,10 @@ class ContainersController(rest.RestController):
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param bay_uuid: only return containers in this bay.
+        :param name: only return containers with this name.
+        :param fields: only return these comma separated fields of the
+                       containers, e.g. "uuid,status".
         """
         parent = pecan.request.path.split('/')[:-1][-1]
         if parent != "containers":
@@ -335,9 +371,11 @@ class ContainersController(rest.RestController):
 
         expand = True
         resource_url = '/'.join(['containers', 'detail'])
+        filters = self._get_filters(bay_uuid, name)
+        fields = api_utils.parse_fields(fields, Container)
         return self._get_containers_collection(marker, limit,
                                                sort_key, sort_dir, expand,
-                                               resource_url)
+                                               resource_url, filters, fields)
 
     @policy.enforce_wsgi("container", "get")
     @expose.expose(Container, types.uuid_or_name)
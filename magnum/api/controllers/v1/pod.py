@@ -60,6 +60,10 @@ class Pod(v1_base.K8sResourceBase):
     host = wtypes.text
     """The host of this pod"""
 
+    # Fields kept in the non-expanded representation of a pod
+    _summary_fields = ['uuid', 'name', 'desc', 'bay_uuid', 'images',
+                       'labels', 'status', 'host']
+
     def __init__(self, **kwargs):
         super(Pod, self).__init__()
 
@@ -72,10 +76,11 @@ class Pod(v1_base.K8sResourceBase):
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
-    def _convert_with_links(pod, url, expand=True):
-        if not expand:
-            pod.unset_fields_except(['uuid', 'name', 'desc', 'bay_uuid',
-                                     'images', 'labels', 'status', 'host'])
+    def _convert_with_links(pod, url, expand=True, fields=None):
+        if fields is not None:
+            pod.unset_fields_except(fields)
+        elif not expand:
+            pod.unset_fields_except(Pod._summary_fields)
 
         pod.links = [link.Link.make_link('self', url,
                                          'pods', pod.uuid),
@@ -150,10 +155,16 @@ class PodCollection(collection.Collection):
         self._type = 'pods'
 
     @staticmethod
-    def convert_with_links(rpc_pods, limit, url=None, expand=False, **kwargs):
+    def convert_with_links(rpc_pods, limit, url=None, expand=False,
+                           fields=None, **kwargs):
+        """Convert a list of :class:`magnum.objects.pod.PodView`."""
         collection = PodCollection()
-        collection.pods = [Pod.convert_with_links(p, expand)
+        host_url = pecan.request.host_url
+        collection.pods = [Pod._convert_with_links(Pod.from_view(p),
+                                                   host_url, expand, fields)
                            for p in rpc_pods]
+        if fields is not None:
+            kwargs['fields'] = ','.join(fields)
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
 
@@ -176,7 +187,8 @@ class PodsController(rest.RestController):
 
     def _get_pods_collection(self, marker, limit,
                              sort_key, sort_dir, expand=False,
-                             resource_url=None):
+                             resource_url=None, filters=None,
+                             fields=None):
 
         limit = api_utils.validate_limit(limit)
         sort_dir = api_utils.validate_sort_dir(sort_dir)
@@ -186,36 +198,71 @@ class PodsController(rest.RestController):
             marker_obj = objects.Pod.get_by_uuid(pecan.request.context,
                                                  marker)
 
+        # NOTE: only load the columns which are going to be rendered
+        columns = fields or (None if expand else Pod._summary_fields)
         pods = pecan.request.rpcapi.pod_list(pecan.request.context, limit,
                                              marker_obj, sort_key=sort_key,
-                                             sort_dir=sort_dir)
+                                             sort_dir=sort_dir,
+                                             filters=filters,
+                                             columns=columns)
+
+        not_modified = api_utils.check_etag(
+            api_utils.get_etag([p.as_dict() for p in pods]))
+        if not_modified:
+            return not_modified
 
         return PodCollection.convert_with_links(pods, limit,
                                                 url=resource_url,
                                                 expand=expand,
+                                                fields=fields,
                                                 sort_key=sort_key,
                                                 sort_dir=sort_dir)
 
+    @staticmethod
+    def _get_filters(bay_uuid, name, status, labels):
+        return api_utils.get_filters(bay_uuid=bay_uuid,
+                                     name=name,
+                                     status=status,
+                                     labels=api_utils.parse_labels(labels))
+
     @policy.enforce_wsgi("pod")
     @expose.expose(PodCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   types.uuid, wtypes.text, wtypes.text, wtypes.text,
+                   wtypes.text)
     def get_all(self, pod_uuid=None, marker=None, limit=None,
-                sort_key='id', sort_dir='asc'):
+                sort_key='id', sort_dir='asc',
+                bay_uuid=None, name=None, status=None, labels=None,
+                fields=None):
         """Retrieve a list of pods.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param bay_uuid: only return pods in this bay.
+        :param name: only return pods with this name.
+        :param status: only return pods with this status.
+        :param labels: only return pods with all of these labels, given as
+                       "key1=value1,key2=value2".
+        :param fields: only return these comma separated fields of the
+                       pods, e.g. "uuid,status".
         """
+        filters = self._get_filters(bay_uuid, name, status, labels)
+        fields = api_utils.parse_fields(fields, Pod)
         return self._get_pods_collection(marker, limit, sort_key,
-                                         sort_dir)
+                                         sort_dir, filters=filters,
+                                         fields=fields)
 
     @policy.enforce_wsgi("pod")
     @expose.expose(PodCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   types.uuid, wtypes.text, wtypes.text, wtypes.text,
+                   wtypes.text)
     def detail(self, pod_uuid=None, marker=None, limit=None,
-               sort_key='id', sort_dir='asc'):
+               sort_key='id', sort_dir='asc',
+               bay_uuid=None, name=None, status=None, labels=None,
+               fields=None):
         """Retrieve a list of pods with detail.
 
         :param pod_uuid: UUID of a pod, to get only pods for that pod.
@@ -223,6 +270,13 @@ class PodsController(rest.RestController):
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param bay_uuid: only return pods in this bay.
+        :param name: only return pods with this name.
+        :param status: only return pods with this status.
+        :param labels: only return pods with all of these labels, given as
+                       "key1=value1,key2=value2".
+        :param fields: only return these comma separated fields of the
+                       pods, e.g. "uuid,status".
         """
         # NOTE(lucasagomes): /detail should only work agaist collections
         parent = pecan.request.path.split('/')[:-1][-1]
@@ -231,9 +285,11 @@ class PodsController(rest.RestController):
 
         expand = True
         resource_url = '/'.join(['pods', 'detail'])
+        filters = self._get_filters(bay_uuid, name, status, labels)
+        fields = api_utils.parse_fields(fields, Pod)
         return self._get_pods_collection(marker, limit,
                                          sort_key, sort_dir, expand,
-                                         resource_url)
+                                         resource_url, filters, fields)
 
     @policy.enforce_wsgi("pod", "get")
     @expose.expose(Pod, types.uuid_or_name)
@@ -244,6 +300,11 @@ class PodsController(rest.RestController):
         """
         rpc_pod = api_utils.get_rpc_resource('Pod', pod_ident)
 
+        not_modified = api_utils.check_etag(
+            api_utils.get_etag(rpc_pod.as_dict()))
+        if not_modified:
+            return not_modified
+
         return Pod.convert_with_links(rpc_pod)
 
     @policy.enforce_wsgi("pod", "create")
@@ -60,6 +60,10 @@ class ReplicationController(v1_base.K8sResourceBase):
     links = wsme.wsattr([link.Link], readonly=True)
     """A list containing a self link and associated rc links"""
 
+    # Fields kept in the non-expanded representation of a rc
+    _summary_fields = ['uuid', 'name', 'images', 'bay_uuid', 'labels',
+                       'replicas']
+
     def __init__(self, **kwargs):
         super(ReplicationController, self).__init__()
 
@@ -72,10 +76,11 @@ class ReplicationController(v1_base.K8sResourceBase):
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
-    def _convert_with_links(rc, url, expand=True):
-        if not expand:
-            rc.unset_fields_except(['uuid', 'name', 'images', 'bay_uuid',
-                                    'labels', 'replicas'])
+    def _convert_with_links(rc, url, expand=True, fields=None):
+        if fields is not None:
+            rc.unset_fields_except(fields)
+        elif not expand:
+            rc.unset_fields_except(ReplicationController._summary_fields)
 
         rc.links = [link.Link.make_link('self', url,
                                         'rcs', rc.uuid),
@@ -180,10 +185,17 @@ class ReplicationControllerCollection(collection.Collection):
         self._type = 'rcs'
 
     @staticmethod
-    def convert_with_links(rpc_rcs, limit, url=None, expand=False, **kwargs):
+    def convert_with_links(rpc_rcs, limit, url=None, expand=False,
+                           fields=None, **kwargs):
+        """Convert a list of ReplicationControllerView."""
         collection = ReplicationControllerCollection()
-        collection.rcs = [ReplicationController.convert_with_links(p, expand)
-                          for p in rpc_rcs]
+        host_url = pecan.request.host_url
+        collection.rcs = [
+            ReplicationController._convert_with_links(
+                ReplicationController.from_view(p), host_url, expand, fields)
+            for p in rpc_rcs]
+        if fields is not None:
+            kwargs['fields'] = ','.join(fields)
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
 
@@ -206,7 +218,8 @@ class ReplicationControllersController(rest.RestController):
 
     def _get_rcs_collection(self, marker, limit,
                             sort_key, sort_dir, expand=False,
-                            resource_url=None):
+                            resource_url=None, filters=None,
+                            fields=None):
 
         limit = api_utils.validate_limit(limit)
         sort_dir = api_utils.validate_sort_dir(sort_dir)
@@ -217,38 +230,61 @@ class ReplicationControllersController(rest.RestController):
                 pecan.request.context,
                 marker)
 
+        # NOTE: only load the columns which are going to be rendered
+        columns = fields or (
+            None if expand else ReplicationController._summary_fields)
         rcs = pecan.request.rpcapi.rc_list(
             pecan.request.context, limit,
             marker_obj, sort_key=sort_key,
-            sort_dir=sort_dir)
+            sort_dir=sort_dir, filters=filters, columns=columns)
 
         return ReplicationControllerCollection.convert_with_links(
             rcs, limit,
             url=resource_url,
             expand=expand,
+            fields=fields,
             sort_key=sort_key,
             sort_dir=sort_dir)
 
+    @staticmethod
+    def _get_filters(bay_uuid, name, labels):
+        return api_utils.get_filters(bay_uuid=bay_uuid,
+                                     name=name,
+                                     labels=api_utils.parse_labels(labels))
+
     @policy.enforce_wsgi("rc")
     @expose.expose(ReplicationControllerCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   types.uuid, wtypes.text, wtypes.text, wtypes.text)
     def get_all(self, rc_uuid=None, marker=None, limit=None,
-                sort_key='id', sort_dir='asc'):
+                sort_key='id', sort_dir='asc',
+                bay_uuid=None, name=None, labels=None, fields=None):
         """Retrieve a list of ReplicationControllers.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param bay_uuid: only return ReplicationControllers in this bay.
+        :param name: only return ReplicationControllers with this name.
+        :param labels: only return ReplicationControllers with all of these
+                       labels, given as "key1=value1,key2=value2".
+        :param fields: only return these comma separated fields of the
+                       ReplicationControllers, e.g. "uuid,replicas".
         """
+        filters = self._get_filters(bay_uuid, name, labels)
+        fields = api_utils.parse_fields(fields, ReplicationController)
         return self._get_rcs_collection(marker, limit, sort_key,
-                                        sort_dir)
+                                        sort_dir, filters=filters,
+                                        fields=fields)
 
     @policy.enforce_wsgi("rc")
     @expose.expose(ReplicationControllerCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   types.uuid, wtypes.text, wtypes.text, wtypes.text)
     def detail(self, rc_uuid=None, marker=None, limit=None,
-               sort_key='id', sort_dir='asc'):
+               sort_key='id', sort_dir='asc',
+               bay_uuid=None, name=None, labels=None, fields=None):
         """Retrieve a list of ReplicationControllers with detail.
 
         :param rc_uuid: UUID of a ReplicationController, to get only
@@ -257,6 +293,12 @@ class ReplicationControllersController(rest.RestController):
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param bay_uuid: only return ReplicationControllers in this bay.
+        :param name: only return ReplicationControllers with this name.
+        :param labels: only return ReplicationControllers with all of these
+                       labels, given as "key1=value1,key2=value2".
+        :param fields: only return these comma separated fields of the
+                       ReplicationControllers, e.g. "uuid,replicas".
         """
         # NOTE(jay-lau-513): /detail should only work agaist collections
         parent = pecan.request.path.split('/')[:-1][-1]
@@ -265,9 +307,11 @@ class ReplicationControllersController(rest.RestController):
 
         expand = True
         resource_url = '/'.join(['rcs', 'detail'])
+        filters = self._get_filters(bay_uuid, name, labels)
+        fields = api_utils.parse_fields(fields, ReplicationController)
         return self._get_rcs_collection(marker, limit,
                                         sort_key, sort_dir, expand,
-                                        resource_url)
+                                        resource_url, filters, fields)
 
     @policy.enforce_wsgi("rc", "get")
     @expose.expose(ReplicationController, types.uuid_or_name)
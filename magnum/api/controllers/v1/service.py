@@ -59,6 +59,10 @@ class Service(v1_base.K8sResourceBase):
     links = wsme.wsattr([link.Link], readonly=True)
     """A list containing a self link and associated service links"""
 
+    # Fields kept in the non-expanded representation of a service
+    _summary_fields = ['uuid', 'name', 'bay_uuid', 'labels', 'selector',
+                       'ip', 'ports']
+
     def __init__(self, **kwargs):
         super(Service, self).__init__()
 
@@ -71,10 +75,11 @@ class Service(v1_base.K8sResourceBase):
             setattr(self, field, kwargs.get(field, wtypes.Unset))
 
     @staticmethod
-    def _convert_with_links(service, url, expand=True):
-        if not expand:
-            service.unset_fields_except(['uuid', 'name', 'bay_uuid', 'labels',
-                                         'selector', 'ip', 'ports'])
+    def _convert_with_links(service, url, expand=True, fields=None):
+        if fields is not None:
+            service.unset_fields_except(fields)
+        elif not expand:
+            service.unset_fields_except(Service._summary_fields)
 
         service.links = [link.Link.make_link('self', url,
                                              'services', service.uuid),
@@ -85,9 +90,10 @@ class Service(v1_base.K8sResourceBase):
         return service
 
     @classmethod
-    def convert_with_links(cls, rpc_service, expand=True):
+    def convert_with_links(cls, rpc_service, expand=True, fields=None):
         service = Service(**rpc_service.as_dict())
-        return cls._convert_with_links(service, pecan.request.host_url, expand)
+        return cls._convert_with_links(service, pecan.request.host_url,
+                                       expand, fields)
 
     @classmethod
     def sample(cls, expand=True):
@@ -158,10 +164,12 @@ class ServiceCollection(collection.Collection):
 
     @staticmethod
     def convert_with_links(rpc_services, limit, url=None,
-                           expand=False, **kwargs):
+                           expand=False, fields=None, **kwargs):
         collection = ServiceCollection()
-        collection.services = [Service.convert_with_links(p, expand)
+        collection.services = [Service.convert_with_links(p, expand, fields)
                                for p in rpc_services]
+        if fields is not None:
+            kwargs['fields'] = ','.join(fields)
         collection.next = collection.get_next(limit, url=url, **kwargs)
         return collection
 
@@ -184,7 +192,8 @@ class ServicesController(rest.RestController):
 
     def _get_services_collection(self, marker, limit,
                                  sort_key, sort_dir, expand=False,
-                                 resource_url=None):
+                                 resource_url=None, filters=None,
+                                 fields=None):
 
         limit = api_utils.validate_limit(limit)
         sort_dir = api_utils.validate_sort_dir(sort_dir)
@@ -194,38 +203,62 @@ class ServicesController(rest.RestController):
             marker_obj = objects.Service.get_by_uuid(pecan.request.context,
                                                      marker)
 
+        # NOTE: only load the columns which are going to be rendered
+        columns = fields or (None if expand else Service._summary_fields)
         services = pecan.request.rpcapi.service_list(pecan.request.context,
                                                      limit,
                                                      marker_obj,
                                                      sort_key=sort_key,
-                                                     sort_dir=sort_dir)
+                                                     sort_dir=sort_dir,
+                                                     filters=filters,
+                                                     columns=columns)
 
         return ServiceCollection.convert_with_links(services, limit,
                                                     url=resource_url,
                                                     expand=expand,
+                                                    fields=fields,
                                                     sort_key=sort_key,
                                                     sort_dir=sort_dir)
 
+    @staticmethod
+    def _get_filters(bay_uuid, name, labels):
+        return api_utils.get_filters(bay_uuid=bay_uuid,
+                                     name=name,
+                                     labels=api_utils.parse_labels(labels))
+
     @policy.enforce_wsgi("service")
     @expose.expose(ServiceCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   types.uuid, wtypes.text, wtypes.text, wtypes.text)
     def get_all(self, service_uuid=None, marker=None, limit=None,
-                sort_key='id', sort_dir='asc'):
+                sort_key='id', sort_dir='asc',
+                bay_uuid=None, name=None, labels=None, fields=None):
         """Retrieve a list of services.
 
         :param marker: pagination marker for large data sets.
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param bay_uuid: only return services in this bay.
+        :param name: only return services with this name.
+        :param labels: only return services with all of these labels, given
+                       as "key1=value1,key2=value2".
+        :param fields: only return these comma separated fields of the
+                       services, e.g. "uuid,ip".
         """
+        filters = self._get_filters(bay_uuid, name, labels)
+        fields = api_utils.parse_fields(fields, Service)
         return self._get_services_collection(marker, limit, sort_key,
-                                             sort_dir)
+                                             sort_dir, filters=filters,
+                                             fields=fields)
 
     @policy.enforce_wsgi("service")
     @expose.expose(ServiceCollection, types.uuid,
-                   types.uuid, int, wtypes.text, wtypes.text)
+                   types.uuid, int, wtypes.text, wtypes.text,
+                   types.uuid, wtypes.text, wtypes.text, wtypes.text)
     def detail(self, service_uuid=None, marker=None, limit=None,
-               sort_key='id', sort_dir='asc'):
+               sort_key='id', sort_dir='asc',
+               bay_uuid=None, name=None, labels=None, fields=None):
         """Retrieve a list of services with detail.
 
         :param service_uuid: UUID of a service, to get only
@@ -234,6 +267,12 @@ class ServicesController(rest.RestController):
         :param limit: maximum number of resources to return in a single result.
         :param sort_key: column to sort results by. Default: id.
         :param sort_dir: direction to sort. "asc" or "desc". Default: asc.
+        :param bay_uuid: only return services in this bay.
+        :param name: only return services with this name.
+        :param labels: only return services with all of these labels, given
+                       as "key1=value1,key2=value2".
+        :param fields: only return these comma separated fields of the
+                       services, e.g. "uuid,ip".
         """
         # NOTE(lucasagomes): /detail should only work agaist collections
         parent = pecan.request.path.split('/')[:-1][-1]
@@ -242,9 +281,11 @@ class ServicesController(rest.RestController):
 
         expand = True
         resource_url = '/'.join(['services', 'detail'])
+        filters = self._get_filters(bay_uuid, name, labels)
+        fields = api_utils.parse_fields(fields, Service)
         return self._get_services_collection(marker, limit,
                                              sort_key, sort_dir, expand,
-                                             resource_url)
+                                             resource_url, filters, fields)
 
     @policy.enforce_wsgi("service", "get")
     @expose.expose(Service, types.uuid_or_name)
@@ -13,12 +13,17 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
+
 import jsonpatch
 from oslo_config import cfg
+from oslo_serialization import jsonutils
+from oslo_utils import encodeutils
 import pecan
 import wsme
 
 from magnum.common import exception
+from magnum.common import object_cache
 from magnum.common import utils
 from magnum.i18n import _
 from magnum import objects
@@ -46,6 +51,91 @@ def validate_sort_dir(sort_dir):
     return sort_dir
 
 
+def get_filters(**kwargs):
+    """Build a DB filters dict from the given query parameters.
+
+    Parameters which were not passed in the query string are dropped.
+    """
+    return dict((k, v) for k, v in kwargs.items() if v is not None)
+
+
+def parse_labels(labels):
+    """Parse a labels filter of the form "key1=value1,key2=value2".
+
+    :param labels: the labels filter from the query string.
+    :returns: a dict of the labels, or None if no filter was given.
+    """
+    if labels is None:
+        return None
+
+    result = {}
+    for label in labels.split(','):
+        key, sep, value = label.partition('=')
+        key = key.strip()
+        if not sep or not key:
+            raise wsme.exc.ClientSideError(_("Invalid labels filter: %s. "
+                                             "Expected format is "
+                                             "'key1=value1,key2=value2'")
+                                           % labels)
+        result[key] = value.strip()
+    return result
+
+
+def parse_list(value):
+    """Parse a comma separated query parameter into a list.
+
+    :returns: the non-empty values, or None if there are none, e.g. for an
+              empty parameter.
+    """
+    if value is None:
+        return None
+
+    return [v.strip() for v in value.split(',') if v.strip()] or None
+
+
+def parse_fields(fields, resource_cls):
+    """Parse a sparse fieldset of the form "field1,field2".
+
+    :param fields: the fields parameter from the query string.
+    :param resource_cls: the API type the fields are selected from.
+    :returns: a list of the requested fields plus uuid, which the links
+              are built from, or None if no fieldset was given.
+    """
+    fields = parse_list(fields)
+    if not fields:
+        return None
+
+    invalid = set(fields) - set(resource_cls().fields)
+    if invalid:
+        raise wsme.exc.ClientSideError(_("Invalid fields: %s")
+                                       % ', '.join(sorted(invalid)))
+    if 'uuid' not in fields:
+        fields.append('uuid')
+    return fields
+
+
+def get_etag(data):
+    """Return a strong ETag for the given primitive data.
+
+    :param data: what the response is rendered from, e.g. the dict of an
+                 object or a list of those for a collection.
+    """
+    serialized = jsonutils.dumps(data, sort_keys=True)
+    return hashlib.sha256(encodeutils.safe_encode(serialized)).hexdigest()
+
+
+def check_etag(etag):
+    """Set the ETag of the response and match it against If-None-Match.
+
+    :param etag: the ETag of the resource which is about to be returned.
+    :returns: a 304 response to return instead of the resource if the
+              client already has the current representation, else None.
+    """
+    pecan.response.etag = etag
+    if etag in pecan.request.if_none_match:
+        return wsme.api.Response(None, status_code=304, return_type=None)
+
+
 def apply_jsonpatch(doc, patch):
     for p in patch:
         if p['op'] == 'add' and p['path'].count('/') == 1:
@@ -67,9 +157,12 @@ def get_rpc_resource(resource, resource_ident):
     resource = getattr(objects, resource)
 
     if utils.is_uuid_like(resource_ident):
-        return resource.get_by_uuid(pecan.request.context, resource_ident)
+        loader = resource.get_by_uuid
+    else:
+        loader = resource.get_by_name
 
-    return resource.get_by_name(pecan.request.context, resource_ident)
+    return object_cache.get_object(pecan.request.context, resource,
+                                   resource_ident, loader)
 
 
 def get_openstack_resource(manager, resource_ident, resource_type):
@@ -20,6 +20,7 @@ from oslo_utils import importutils
 from pecan import hooks
 
 from magnum.common import context
+from magnum.common import object_cache
 from magnum.conductor import api as conductor_api
 
 
@@ -84,6 +85,16 @@ class RPCHook(hooks.PecanHook):
         state.request.rpcapi = conductor_api.API(context=state.request.context)
 
 
+class ObjectCacheHook(hooks.PecanHook):
+    """Attach a request-scoped identity map to the request context.
+
+    Must run after ContextHook, which creates the context.
+    """
+
+    def before(self, state):
+        object_cache.install(state.request.context)
+
+
 class NoExceptionTracebackHook(hooks.PecanHook):
     """Workaround rpc.common: deserialize_remote_exception.
     deserialize_remote_exception builds rpc exception traceback into error
@@ -11,11 +11,14 @@
 # under the License.
 
 from magnum.api.middleware import auth_token
+from magnum.api.middleware import compression
 from magnum.api.middleware import parsable_error
 
 
 AuthTokenMiddleware = auth_token.AuthTokenMiddleware
+CompressionMiddleware = compression.CompressionMiddleware
 ParsableErrorMiddleware = parsable_error.ParsableErrorMiddleware
 
 __all__ = (AuthTokenMiddleware,
+           CompressionMiddleware,
            ParsableErrorMiddleware)
@@ -0,0 +1,86 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Middleware compressing the body of large responses with the encoding
+negotiated through the Accept-Encoding header of the request.
+"""
+
+import zlib
+
+import webob
+
+# NOTE: the wbits of zlib selecting the gzip and zlib container formats.
+# The "deflate" content coding of HTTP is the zlib format.
+ENCODINGS = {
+    'gzip': 16 + zlib.MAX_WBITS,
+    'deflate': zlib.MAX_WBITS,
+}
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/')
+
+
+class CompressionMiddleware(object):
+    """Compress response bodies with gzip or deflate.
+
+    :param app: The WSGI application to wrap.
+    :param min_size: Bodies smaller than this number of bytes are sent
+                     uncompressed.
+    :param level: The zlib compression level, from 1 (fastest) to 9 (best).
+    """
+
+    def __init__(self, app, min_size=1024, level=6):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+
+    def _is_compressible(self, response):
+        if response.content_length is None:
+            return False
+        if response.content_encoding is not None:
+            return False
+        content_type = response.content_type or ''
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _compress(self, response, encoding):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED,
+                                      ENCODINGS[encoding])
+        body = compressor.compress(response.body)
+        response.body = body + compressor.flush()
+        response.content_encoding = encoding
+        # NOTE: the compressed body is another byte representation of the
+        # resource, so it cannot share the strong ETag of the plain one.
+        # A weak ETag still matches the If-None-Match of either.
+        etag = response.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            response.headers['ETag'] = 'W/' + etag
+
+    def __call__(self, environ, start_response):
+        request = webob.Request(environ)
+        response = request.get_response(self.app)
+        if not self._is_compressible(response):
+            return response(environ, start_response)
+
+        # NOTE: the body depends on Accept-Encoding whether or not this
+        # request gets it compressed, and the size of a resource changes,
+        # so shared caches must key every compressible response on it.
+        vary = tuple(response.vary or ())
+        if 'Accept-Encoding' not in vary:
+            response.vary = vary + ('Accept-Encoding',)
+
+        encoding = None
+        if 'Accept-Encoding' in request.headers:
+            encoding = request.accept_encoding.best_match(list(ENCODINGS))
+        large_enough = response.content_length >= self.min_size
+        if encoding is not None and large_enough:
+            self._compress(response, encoding)
+        return response(environ, start_response)
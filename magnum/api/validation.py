@@ -17,6 +17,7 @@ import decorator
 import pecan
 
 from magnum.common import exception
+from magnum.common import object_cache
 from magnum import objects
 
 
@@ -24,9 +25,12 @@ def enforce_bay_types(*bay_types):
     @decorator.decorator
     def wrapper(func, *args, **kwargs):
         obj = args[1]
-        bay = objects.Bay.get_by_uuid(pecan.request.context, obj.bay_uuid)
-        baymodel = objects.BayModel.get_by_uuid(pecan.request.context,
-                                                bay.baymodel_id)
+        context = pecan.request.context
+        bay = object_cache.get_object(context, objects.Bay, obj.bay_uuid,
+                                      objects.Bay.get_by_uuid)
+        baymodel = object_cache.get_object(context, objects.BayModel,
+                                           bay.baymodel_id,
+                                           objects.BayModel.get_by_uuid)
         if baymodel.coe not in bay_types:
             raise exception.InvalidParameterValue(
                 'Cannot fulfill request with a %(bay_type)s bay, '
@@ -0,0 +1,104 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Wake up API requests waiting for a bay to change.
+
+The conductor emits a ``magnum.bay.update`` notification whenever it
+changes the status of a bay. Every API process listens for them in its own
+notification pool and wakes up the requests waiting on that bay. Waiters
+also wake up every ``[api]wait_for_change_interval`` seconds, so a change
+is still noticed when notifications are disabled or one is lost.
+"""
+
+import os
+import threading
+
+from oslo_config import cfg
+from oslo_log import log as logging
+import oslo_messaging as messaging
+
+from magnum.common import rpc
+from magnum.conductor import utils as conductor_utils
+from magnum.i18n import _LW
+
+LOG = logging.getLogger(__name__)
+
+
+class BayUpdateEndpoint(object):
+    """Notification endpoint waking up the waiters of updated bays."""
+
+    def __init__(self, watcher):
+        self.watcher = watcher
+
+    def info(self, ctxt, publisher_id, event_type, payload, metadata):
+        if event_type == conductor_utils.BAY_UPDATE_EVENT:
+            self.watcher.notify(payload.get('uuid'))
+
+
+class BayWatcher(object):
+    """Registry of the requests waiting for a bay to change."""
+
+    def __init__(self):
+        self._waiters = {}
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def start(self):
+        """Start listening for bay notifications, at most once."""
+        with self._lock:
+            if self._listener is not None or rpc.TRANSPORT is None:
+                return
+            # NOTE: each API process needs its own pool, otherwise the
+            # processes compete for the notifications of the topic.
+            pool = 'magnum-api.%s.%s' % (cfg.CONF.host, os.getpid())
+            targets = [messaging.Target(topic=topic)
+                       for topic in cfg.CONF.notification_topics]
+            try:
+                self._listener = messaging.get_notification_listener(
+                    rpc.TRANSPORT, targets, [BayUpdateEndpoint(self)],
+                    executor='eventlet', pool=pool)
+                self._listener.start()
+            except Exception:
+                self._listener = False
+                LOG.warning(_LW('Unable to listen for bay notifications, '
+                                'waiting for bay changes falls back to '
+                                'polling the database.'))
+
+    def wait(self, uuid, timeout):
+        """Block until the bay is notified or the timeout expires.
+
+        :param uuid: UUID of the bay to wait for.
+        :param timeout: maximum number of seconds to wait.
+        :returns: True if a notification was received for the bay.
+        """
+        self.start()
+        event = threading.Event()
+        with self._lock:
+            self._waiters.setdefault(uuid, set()).add(event)
+        try:
+            return event.wait(timeout)
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(uuid, set())
+                waiters.discard(event)
+                if not waiters:
+                    self._waiters.pop(uuid, None)
+
+    def notify(self, uuid):
+        """Wake up every request waiting for the bay."""
+        with self._lock:
+            waiters = self._waiters.pop(uuid, set())
+        for event in waiters:
+            event.set()
+
+
+WATCHER = BayWatcher()
@@ -22,6 +22,7 @@ from wsgiref import simple_server
 from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_reports import guru_meditation_report as gmr
+from six.moves import socketserver
 
 from magnum.api import app as api_app
 from magnum.common import service
@@ -32,6 +33,16 @@ from magnum import version
 LOG = logging.getLogger(__name__)
 
 
+class ThreadedWSGIServer(socketserver.ThreadingMixIn,
+                         simple_server.WSGIServer):
+    """WSGI server handling each request in its own thread.
+
+    Requests waiting for a bay to change with wait_for_change must not
+    block the other requests.
+    """
+    daemon_threads = True
+
+
 def main():
     service.prepare_service(sys.argv)
 
@@ -41,7 +52,8 @@ def main():
 
     # Create the WSGI server and start it
     host, port = cfg.CONF.api.host, cfg.CONF.api.port
-    srv = simple_server.make_server(host, port, app)
+    srv = simple_server.make_server(host, port, app,
+                                    server_class=ThreadedWSGIServer)
 
     LOG.info(_LI('Starting server in PID %s') % os.getpid())
     LOG.debug("Configuration:")
@@ -26,6 +26,8 @@ from oslo_service import service
 from magnum.common import rpc_service
 from magnum.common import service as magnum_service
 from magnum.common import short_id
+from magnum.common.x509 import operations as x509
+from magnum.conductor import discovery
 from magnum.conductor.handlers import bay_conductor
 from magnum.conductor.handlers import ca_conductor
 from magnum.conductor.handlers import conductor_listener
@@ -69,6 +71,9 @@ def main():
                   {'atomic_template': cfg.CONF.bay.k8s_atomic_template_path,
                    'coreos_template': cfg.CONF.bay.k8s_coreos_template_path})
 
+    discovery.prefill()
+    x509.prefill_key_pool()
+
     server = rpc_service.Service.create(cfg.CONF.conductor.topic,
                                         conductor_id, endpoints)
     launcher = service.launch(cfg.CONF, server)
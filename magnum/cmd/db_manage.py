@@ -13,10 +13,15 @@
 
 """Starter script for magnum-db-manage."""
 
+import datetime
+
 from oslo_config import cfg
 from oslo_log import log as logging
+from oslo_utils import timeutils
 
+from magnum.db import api as dbapi
 from magnum.db import migration
+from magnum.i18n import _LI
 
 
 LOG = logging.getLogger(__name__)
@@ -40,6 +45,15 @@ def do_revision():
                        autogenerate=CONF.command.autogenerate)
 
 
+def do_purge():
+    age = datetime.timedelta(days=CONF.command.older_than)
+    before = timeutils.utcnow() - age
+    batch_size = CONF.command.batch_size or CONF.database.purge_batch_size
+    count = dbapi.get_instance().purge_deleted_rows(before, batch_size)
+    LOG.info(_LI('Purged %(count)d rows deleted more than %(days)d days '
+                 'ago'), {'count': count, 'days': CONF.command.older_than})
+
+
 def add_command_parsers(subparsers):
     parser = subparsers.add_parser('version')
     parser.set_defaults(func=do_version)
@@ -57,6 +71,15 @@ def add_command_parsers(subparsers):
     parser.add_argument('--autogenerate', action='store_true')
     parser.set_defaults(func=do_revision)
 
+    parser = subparsers.add_parser('purge')
+    parser.add_argument('--older-than', type=int, required=True,
+                        help='Only purge rows deleted more than this '
+                             'number of days ago.')
+    parser.add_argument('--batch-size', type=int,
+                        help='Maximum number of rows removed per '
+                             'transaction.')
+    parser.set_defaults(func=do_purge)
+
 
 def main():
     command_opt = cfg.SubCommandOpt('command',
@@ -13,9 +13,11 @@
 #    under the License.
 
 from barbicanclient import client as barbican_client
+from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import excutils
 
+from magnum.common import cache
 from magnum.common.cert_manager import cert_manager
 from magnum.common import clients
 from magnum.common import context
@@ -26,6 +28,21 @@ from magnum.i18n import _LW
 
 LOG = logging.getLogger(__name__)
 
+barbican_cert_manager_opts = [
+    cfg.IntOpt('cert_cache_size',
+               default=100,
+               help=_('Maximum number of certificate containers retrieved '
+                      'from Barbican kept in memory. Set to 0 to disable '
+                      'the cache.')),
+    cfg.IntOpt('cert_cache_ttl',
+               default=3600,
+               help=_('Number of seconds a certificate container retrieved '
+                      'from Barbican stays cached in memory.')),
+]
+
+cfg.CONF.register_opts(barbican_cert_manager_opts, group='certificates')
+cfg.CONF.import_group('client_cache', 'magnum.common.magnum_keystoneclient')
+
 
 class Cert(cert_manager.Cert):
     """Representation of a Cert based on the Barbican CertificateContainer."""
@@ -58,16 +75,39 @@ class Cert(cert_manager.Cert):
 
 
 _ADMIN_OSC = None
+_CERTS = None
+
+
+def _expires_soon(osc):
+    auth_ref = osc.keystone().admin_client.auth_ref
+    return auth_ref is None or auth_ref.will_expire_soon(
+        cfg.CONF.client_cache.stale_duration)
 
 
 def get_admin_clients():
+    """Return the admin clients, renewed when their token expires soon."""
     global _ADMIN_OSC
-    if not _ADMIN_OSC:
+    if not _ADMIN_OSC or _expires_soon(_ADMIN_OSC):
         _ADMIN_OSC = clients.OpenStackClients(
             context.RequestContext(is_admin=True))
     return _ADMIN_OSC
 
 
+def _get_cert_cache():
+    global _CERTS
+    if _CERTS is None:
+        _CERTS = cache.TTLCache(cfg.CONF.certificates.cert_cache_size,
+                                cfg.CONF.certificates.cert_cache_ttl)
+    return _CERTS
+
+
+def reset_cache():
+    """Drop the admin clients and the cached certificate containers."""
+    global _ADMIN_OSC, _CERTS
+    _ADMIN_OSC = None
+    _CERTS = None
+
+
 class CertManager(cert_manager.CertManager):
     """Certificate Manager that wraps the Barbican client API."""
     @staticmethod
@@ -166,6 +206,15 @@ class CertManager(cert_manager.CertManager):
                  certificate data
         :raises Exception: if certificate retrieval fails
         """
+        # NOTE: the content of a container never changes, so the retrieved
+        # Cert, which keeps the secret payloads once they are read, is
+        # reused along with the consumers it was registered for.
+        consumer = None if check_only else (service_name, resource_ref)
+        certs = _get_cert_cache()
+        entry = certs.get(cert_ref)
+        if entry is not None and (consumer is None or consumer in entry[1]):
+            return entry[0]
+
         connection = get_admin_clients().barbican()
 
         LOG.info(_LI(
@@ -182,11 +231,17 @@ class CertManager(cert_manager.CertManager):
                     name=service_name,
                     url=resource_ref
                 )
-            return Cert(cert_container)
+            cert = Cert(cert_container)
         except Exception:
             with excutils.save_and_reraise_exception():
                 LOG.exception(_LE("Error getting {0}").format(cert_ref))
 
+        consumers = set(entry[1]) if entry is not None else set()
+        if consumer is not None:
+            consumers.add(consumer)
+        certs.set(cert_ref, (cert, frozenset(consumers)))
+        return cert
+
     @staticmethod
     def delete_cert(cert_ref, service_name='Magnum', resource_ref=None,
                     **kwargs):
@@ -198,6 +253,7 @@ class CertManager(cert_manager.CertManager):
 
         :raises Exception: if deregistration fails
         """
+        _get_cert_cache().pop(cert_ref)
         connection = get_admin_clients().barbican()
 
         LOG.info(_LI(
@@ -222,6 +278,7 @@ class CertManager(cert_manager.CertManager):
         :param cert_ref: the UUID of the cert to delete
         :raises Exception: if certificate deletion fails
         """
+        _get_cert_cache().pop(cert_ref)
         connection = get_admin_clients().barbican()
 
         LOG.info(_LI(
@@ -19,6 +19,7 @@ from magnum.sur.client import SenlinSURClient as senlinclient
 from oslo_config import cfg
 from oslo_log import log as logging
 
+from magnum.common import cache
 from magnum.common import exception
 from magnum.common import magnum_keystoneclient
 from magnum.i18n import _
@@ -87,6 +88,32 @@ cfg.CONF.register_opts(heat_client_opts, group='heat_client')
 cfg.CONF.register_opts(glance_client_opts, group='glance_client')
 cfg.CONF.register_opts(barbican_client_opts, group='barbican_client')
 
+_ENDPOINTS = None
+_CLIENTS = None
+
+
+def _get_endpoint_cache():
+    global _ENDPOINTS
+    if _ENDPOINTS is None:
+        _ENDPOINTS = cache.TTLCache(cfg.CONF.client_cache.max_size,
+                                    cfg.CONF.client_cache.endpoint_ttl)
+    return _ENDPOINTS
+
+
+def _get_client_cache():
+    global _CLIENTS
+    if _CLIENTS is None:
+        _CLIENTS = cache.TTLCache(cfg.CONF.client_cache.max_size)
+    return _CLIENTS
+
+
+def reset_cache():
+    """Drop the cached endpoints and clients and reload the settings."""
+    global _ENDPOINTS, _CLIENTS
+    _ENDPOINTS = None
+    _CLIENTS = None
+    magnum_keystoneclient.reset_cache()
+
 
 class OpenStackClients(object):
     """Convenience class to create and cache client instances."""
@@ -100,7 +127,19 @@ class OpenStackClients(object):
         self._senlin = None
 
     def url_for(self, **kwargs):
-        return self.keystone().client.service_catalog.url_for(**kwargs)
+        if not cfg.CONF.client_cache.enabled:
+            return self.keystone().client.service_catalog.url_for(**kwargs)
+
+        # NOTE: endpoints may be templated with the project, so they are
+        # only shared between the requests of the same project or trust.
+        key = (self.context.project_id, self.context.trust_id,
+               self.context.is_admin, tuple(sorted(kwargs.items())))
+        endpoints = _get_endpoint_cache()
+        url = endpoints.get(key)
+        if url is None:
+            url = self.keystone().client.service_catalog.url_for(**kwargs)
+            endpoints.set(key, url)
+        return url
 
     def magnum_url(self):
         endpoint_type = self._get_client_option('magnum', 'endpoint_type')
@@ -127,6 +166,23 @@ class OpenStackClients(object):
     def _get_client_option(self, client, option):
         return getattr(getattr(cfg.CONF, '%s_client' % client), option)
 
+    def _get_shared_client(self, service, endpoint, factory):
+        """Return the client of a service, shared between requests.
+
+        Clients are shared between the OpenStackClients of every request
+        authenticated with the same token, as they carry no other state.
+        """
+        if not cfg.CONF.client_cache.enabled:
+            return factory()
+
+        key = (service, endpoint, self.auth_token)
+        clients = _get_client_cache()
+        client = clients.get(key)
+        if client is None:
+            client = factory()
+            clients.set(key, client)
+        return client
+
     @exception.wrap_keystone_exception
     def heat(self):
         if self._heat:
@@ -149,7 +205,8 @@ class OpenStackClients(object):
             'key_file': self._get_client_option('heat', 'key_file'),
             'insecure': self._get_client_option('heat', 'insecure')
         }
-        self._heat = heatclient.Client(**args)
+        self._heat = self._get_shared_client(
+            'heat', endpoint, lambda: heatclient.Client(**args))
 
         return self._heat
 
@@ -170,7 +227,8 @@ class OpenStackClients(object):
             'username': None,
             'password': None,
         }
-        self._glance = glanceclient.Client(**args)
+        self._glance = self._get_shared_client(
+            'glance', endpoint, lambda: glanceclient.Client(**args))
 
         return self._glance
 
@@ -184,9 +242,13 @@ class OpenStackClients(object):
         endpoint = self.url_for(service_type='key-manager',
                                 endpoint_type=endpoint_type,
                                 region_name=region_name)
-        session = self.keystone().client.session
-        self._barbican = barbicanclient.Client(session=session,
-                                               endpoint=endpoint)
+
+        def factory():
+            session = self.keystone().client.session
+            return barbicanclient.Client(session=session, endpoint=endpoint)
+
+        self._barbican = self._get_shared_client('barbican', endpoint,
+                                                 factory)
 
         return self._barbican
 
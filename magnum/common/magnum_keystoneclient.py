@@ -20,6 +20,7 @@ from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import importutils
 
+from magnum.common import cache
 from magnum.common import context as magnum_context
 from magnum.common import exception
 from magnum.i18n import _
@@ -34,9 +35,65 @@ trust_opts = [
                 help=_('Subset of trustor roles to be delegated to magnum.')),
 ]
 cfg.CONF.register_opts(trust_opts)
+
+client_cache_opts = [
+    cfg.BoolOpt('enabled',
+                default=True,
+                help=_('Share authenticated Keystone clients, resolved '
+                       'endpoints and OpenStack service clients between '
+                       'the operations of a process.')),
+    cfg.IntOpt('max_size',
+               default=100,
+               help=_('Maximum number of cached Keystone clients, and of '
+                      'cached service clients.')),
+    cfg.IntOpt('stale_duration',
+               default=300,
+               help=_('Number of seconds before the expiry of its token a '
+                      'cached Keystone client is no longer used.')),
+    cfg.IntOpt('endpoint_ttl',
+               default=600,
+               help=_('Number of seconds an endpoint resolved from the '
+                      'service catalog is cached.')),
+]
+cfg.CONF.register_opts(client_cache_opts, group='client_cache')
 cfg.CONF.import_opt('auth_uri', 'keystonemiddleware.auth_token',
                     group='keystone_authtoken')
 
+_CLIENTS = None
+
+
+def _get_cache():
+    global _CLIENTS
+    if _CLIENTS is None:
+        _CLIENTS = cache.TTLCache(cfg.CONF.client_cache.max_size)
+    return _CLIENTS
+
+
+def reset_cache():
+    """Drop the cached Keystone clients and reload the cache settings."""
+    global _CLIENTS
+    _CLIENTS = None
+
+
+def _get_cached_client(key):
+    """Return the client cached under key unless its token expires soon."""
+    if key is None or not cfg.CONF.client_cache.enabled:
+        return None
+    client = _get_cache().get(key)
+    if client is None:
+        return None
+    auth_ref = client.auth_ref
+    if auth_ref is None or auth_ref.will_expire_soon(
+            cfg.CONF.client_cache.stale_duration):
+        _get_cache().pop(key)
+        return None
+    return client
+
+
+def _cache_client(key, client):
+    if key is not None and cfg.CONF.client_cache.enabled:
+        _get_cache().set(key, client)
+
 
 class KeystoneClientV3(object):
     """Keystone client wrapper so we can encapsulate logic in one place."""
@@ -84,17 +141,53 @@ class KeystoneClientV3(object):
     @property
     def admin_client(self):
         if not self._admin_client:
-            # Create admin client connection to v3 API
-            admin_creds = self._service_admin_creds()
-            c = kc_v3.Client(**admin_creds)
-            if c.authenticate():
-                self._admin_client = c
-            else:
-                LOG.error(_LE("Admin client authentication failed"))
-                raise exception.AuthorizationFailure()
+            key = ('admin', self.v3_endpoint)
+            c = _get_cached_client(key)
+            if c is None:
+                # Create admin client connection to v3 API
+                admin_creds = self._service_admin_creds()
+                c = kc_v3.Client(**admin_creds)
+                if not c.authenticate():
+                    LOG.error(_LE("Admin client authentication failed"))
+                    raise exception.AuthorizationFailure()
+                _cache_client(key, c)
+            self._admin_client = c
         return self._admin_client
 
+    def _client_cache_key(self):
+        """Identify the credentials the client of the context uses."""
+        if self.context.trust_id is not None:
+            return ('trust', self.v3_endpoint, self.context.trust_id)
+        if self.context.auth_token is not None:
+            return ('token', self.v3_endpoint, self.context.auth_token,
+                    self.context.project_id)
+        return None
+
     def _v3_client_init(self):
+        key = self._client_cache_key()
+        client = _get_cached_client(key)
+        if client is None:
+            client = self._v3_client_create()
+            # If we are authenticating with a trust set the context
+            # auth_token with the trust scoped token
+            if self.context.trust_id is not None:
+                # Sanity check
+                if not client.auth_ref.trust_scoped:
+                    LOG.error(_LE("trust token re-scoping failed!"))
+                    raise exception.AuthorizationFailure()
+            _cache_client(key, client)
+
+        if self.context.trust_id is not None:
+            # All OK so update the context with the token
+            self.context.auth_token = client.auth_ref.auth_token
+            self.context.auth_url = self.v3_endpoint
+            self.context.user = client.auth_ref.user_id
+            self.context.project_id = client.auth_ref.project_id
+            self.context.user_name = client.auth_ref.username
+
+        return client
+
+    def _v3_client_create(self):
         kwargs = {
             'auth_url': self.v3_endpoint,
             'endpoint': self.v3_endpoint
@@ -132,20 +225,6 @@ class KeystoneClientV3(object):
         client = kc_v3.Client(**kwargs)
         if 'auth_ref' not in kwargs:
             client.authenticate()
-        # If we are authenticating with a trust set the context auth_token
-        # with the trust scoped token
-        if 'trust_id' in kwargs:
-            # Sanity check
-            if not client.auth_ref.trust_scoped:
-                LOG.error(_LE("trust token re-scoping failed!"))
-                raise exception.AuthorizationFailure()
-            # All OK so update the context with the token
-            self.context.auth_token = client.auth_ref.auth_token
-            self.context.auth_url = self.v3_endpoint
-            self.context.user = client.auth_ref.user_id
-            self.context.project_id = client.auth_ref.project_id
-            self.context.user_name = client.auth_ref.username
-
         return client
 
     def _service_admin_creds(self):
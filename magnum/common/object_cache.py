@@ -0,0 +1,64 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Request-scoped identity map of Magnum objects.
+
+The API installs an empty map on the request context of every HTTP
+request, and the conductor does the same for every RPC call it serves.
+Objects loaded through :func:`get_object` with that context are then read
+from the database only once for the lifetime of the request, and every
+caller gets the same instance.
+
+Contexts without a map, such as the admin contexts used by periodic
+tasks, always go to the database.
+"""
+
+
+class ObjectCache(object):
+    """Identity map of the objects loaded while serving one request."""
+
+    def __init__(self):
+        self._objects = {}
+
+    def get(self, context, obj_cls, ident, loader):
+        name = obj_cls.__name__
+        obj = self._objects.get((name, ident))
+        if obj is None:
+            obj = loader(context, ident)
+            self._objects[(name, ident)] = obj
+            # NOTE: an object looked up by name is also found by uuid later
+            uuid = getattr(obj, 'uuid', None)
+            if uuid is not None:
+                self._objects.setdefault((name, uuid), obj)
+        return obj
+
+
+def install(context):
+    """Attach an empty identity map to the context."""
+    context.object_cache = ObjectCache()
+    return context
+
+
+def get_object(context, obj_cls, ident, loader):
+    """Return the object identified by ident, loading it at most once.
+
+    :param context: The request context holding the identity map.
+    :param obj_cls: The class of the object, which scopes the identifier.
+    :param ident: The identifier passed to the loader, e.g. a uuid or name.
+    :param loader: A callable taking (context, ident), e.g.
+                   ``objects.Bay.get_by_uuid``.
+    :returns: The loaded object.
+    """
+    cache = getattr(context, 'object_cache', None)
+    if not isinstance(cache, ObjectCache):
+        return loader(context, ident)
+    return cache.get(context, obj_cls, ident, loader)
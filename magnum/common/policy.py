@@ -20,9 +20,57 @@ from oslo_config import cfg
 from oslo_policy import policy
 import pecan
 
+from magnum.common import cache
+from magnum.i18n import _
+
+
+policy_opts = [
+    cfg.IntOpt('policy_cache_size',
+               default=1024,
+               help=_('Maximum number of policy decisions cached in '
+                      'memory. The cache is flushed whenever the policy '
+                      'rules are reloaded. Set to 0 to disable the '
+                      'cache.')),
+]
 
 _ENFORCER = None
+_DECISIONS = None
+_DECISIONS_GENERATION = None
 CONF = cfg.CONF
+CONF.register_opts(policy_opts)
+
+# NOTE: the keys of RequestContext.to_dict() which are not credentials:
+# the tokens, the request id which would make every cache key unique and
+# the user identity string which is only derived from the other keys.
+NON_CREDENTIAL_ATTRS = ('auth_token', 'auth_token_info', 'request_id',
+                        'user_identity')
+
+# NOTE: the attributes of the context the policy rules may check, that is
+# every key of RequestContext.to_dict() but NON_CREDENTIAL_ATTRS. They
+# are read directly from the context, which is cheaper than to_dict().
+CREDENTIAL_ATTRS = ('user_id', 'project_id', 'domain_id', 'domain_name',
+                    'user_name', 'project_name', 'tenant', 'user', 'domain',
+                    'user_domain', 'project_domain', 'resource_uuid',
+                    'auth_url', 'is_admin', 'is_public_api', 'read_only',
+                    'show_deleted', 'all_tenants', 'trust_id')
+
+
+class _Enforcer(policy.Enforcer):
+    """Enforcer counting the changes of its rules.
+
+    Every change of the rules goes through set_rules, including the reload
+    of a touched policy file and the merge of the policy.d files into the
+    current rules, which keeps the same Rules object.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.rules_generation = 0
+        super(_Enforcer, self).__init__(*args, **kwargs)
+
+    def set_rules(self, rules, overwrite=True, use_conf=False):
+        super(_Enforcer, self).set_rules(rules, overwrite=overwrite,
+                                         use_conf=use_conf)
+        self.rules_generation += 1
 
 
 # we can get a policy enforcer by this init.
@@ -50,15 +98,42 @@ def init(policy_file=None, rules=None,
     global _ENFORCER
     if not _ENFORCER:
         # http://docs.openstack.org/developer/oslo.policy/usage.html
-        _ENFORCER = policy.Enforcer(CONF,
-                                    policy_file=policy_file,
-                                    rules=rules,
-                                    default_rule=default_rule,
-                                    use_conf=use_conf,
-                                    overwrite=overwrite)
+        _ENFORCER = _Enforcer(CONF,
+                              policy_file=policy_file,
+                              rules=rules,
+                              default_rule=default_rule,
+                              use_conf=use_conf,
+                              overwrite=overwrite)
     return _ENFORCER
 
 
+def _get_decisions(enforcer):
+    """Return the cached decisions, flushed if the rules were reloaded."""
+    global _DECISIONS, _DECISIONS_GENERATION
+    # NOTE: this stats the policy files and reloads those which were
+    # touched, which changes the rules generation of the enforcer.
+    enforcer.load_rules()
+    generation = enforcer.rules_generation
+    if _DECISIONS is None or _DECISIONS_GENERATION != generation:
+        _DECISIONS = cache.TTLCache(CONF.policy_cache_size)
+        _DECISIONS_GENERATION = generation
+    return _DECISIONS
+
+
+def reset_cache():
+    """Drop the cached policy decisions and reload the cache settings."""
+    global _DECISIONS, _DECISIONS_GENERATION
+    _DECISIONS = None
+    _DECISIONS_GENERATION = None
+
+
+def _get_credentials(context):
+    credentials = dict((attr, getattr(context, attr, None))
+                       for attr in CREDENTIAL_ATTRS)
+    credentials['roles'] = tuple(sorted(context.roles or []))
+    return credentials
+
+
 def enforce(context, action=None, target=None,
             do_raise=True, exc=None, *args, **kwargs):
 
@@ -84,12 +159,27 @@ def enforce(context, action=None, target=None,
                  expression.
     """
     enforcer = init()
-    credentials = context.to_dict()
-    if target is None:
-        target = {'project_id': context.project_id,
-                  'user_id': context.user_id}
-    return enforcer.enforce(action, target, credentials,
-                            do_raise=do_raise, exc=exc, *args, **kwargs)
+    if target is not None:
+        return enforcer.enforce(action, target, context.to_dict(),
+                                do_raise=do_raise, exc=exc, *args, **kwargs)
+
+    # NOTE: the default target is derived from the context, so the
+    # decision only depends on the action and the credentials and can be
+    # cached. Only granted decisions are cached, denials go through the
+    # enforcer to raise the requested exception.
+    credentials = _get_credentials(context)
+    target = {'project_id': context.project_id,
+              'user_id': context.user_id}
+    decisions = _get_decisions(enforcer)
+    key = (action, tuple(sorted(credentials.items())))
+    result = decisions.get(key)
+    if result is None:
+        result = enforcer.enforce(action, target, credentials,
+                                  do_raise=do_raise, exc=exc,
+                                  *args, **kwargs)
+        if result:
+            decisions.set(key, result)
+    return result
 
 
 # NOTE(Shaohe Feng): This decorator MUST appear first (the outermost
@@ -0,0 +1,101 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Pools of items generated ahead of time in the background."""
+
+import collections
+import threading
+import time
+
+import eventlet
+from oslo_config import cfg
+from oslo_log import log as logging
+
+from magnum.i18n import _LW
+
+LOG = logging.getLogger(__name__)
+
+
+class BackgroundPool(object):
+    """Items generated ahead of time and refilled in the background.
+
+    :param generate: callable returning a new item.
+    :param size_opt: name of the option holding the number of items kept
+                     ready. A size of 0 disables the pool.
+    :param group: group of the options.
+    :param ttl_opt: name of the option holding the number of seconds an
+                    item stays usable, or None to keep the items until
+                    they are used.
+    :param description: what the items are, for the logs.
+    """
+
+    def __init__(self, generate, size_opt, group=None, ttl_opt=None,
+                 description='item'):
+        self.generate = generate
+        self.size_opt = size_opt
+        self.group = group
+        self.ttl_opt = ttl_opt
+        self.description = description
+        self._items = collections.deque()
+        self._lock = threading.Lock()
+        self._refilling = False
+
+    def _get_option(self, name):
+        conf = getattr(cfg.CONF, self.group) if self.group else cfg.CONF
+        return getattr(conf, name)
+
+    @property
+    def size(self):
+        return self._get_option(self.size_opt)
+
+    def _pop(self):
+        expired = None
+        if self.ttl_opt:
+            expired = time.time() - self._get_option(self.ttl_opt)
+        with self._lock:
+            while self._items:
+                created, item = self._items.popleft()
+                if expired is None or created > expired:
+                    return item
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self):
+        """Return an unused item, generating one if none is ready."""
+        item = self._pop()
+        if item is None:
+            item = self.generate()
+        self.refill()
+        return item
+
+    def refill(self):
+        """Start filling the pool in the background, if not already."""
+        with self._lock:
+            if self._refilling or len(self._items) >= self.size:
+                return
+            self._refilling = True
+        eventlet.spawn_n(self._refill)
+
+    def _refill(self):
+        try:
+            while len(self._items) < self.size:
+                item = self.generate()
+                with self._lock:
+                    self._items.append((time.time(), item))
+        except Exception as e:
+            LOG.warning(_LW('Unable to fill the %(description)s pool: '
+                            '%(error)s'),
+                        {'description': self.description, 'error': e})
+        finally:
+            with self._lock:
+                self._refilling = False
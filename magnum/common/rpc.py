@@ -22,6 +22,7 @@ __all__ = [
     'get_allowed_exmods',
     'RequestContextSerializer',
     'get_client',
+    'get_shared_client',
     'get_server',
     'get_notifier',
     'TRANSPORT_ALIASES',
@@ -33,11 +34,14 @@ from oslo_serialization import jsonutils
 
 from magnum.common import context as magnum_context
 from magnum.common import exception
+from magnum.common import object_cache
 
 
 CONF = cfg.CONF
 TRANSPORT = None
 NOTIFIER = None
+# The clients shared by the process, built on TRANSPORT
+_SHARED_CLIENTS = {}
 
 ALLOWED_EXMODS = [
     exception.__name__,
@@ -58,6 +62,7 @@ TRANSPORT_ALIASES = {
 
 def init(conf):
     global TRANSPORT, NOTIFIER
+    _SHARED_CLIENTS.clear()
     exmods = get_allowed_exmods()
     TRANSPORT = messaging.get_transport(conf,
                                         allowed_remote_exmods=exmods,
@@ -72,6 +77,7 @@ def cleanup():
     assert NOTIFIER is not None
     TRANSPORT.cleanup()
     TRANSPORT = NOTIFIER = None
+    _SHARED_CLIENTS.clear()
 
 
 def set_defaults(control_exchange):
@@ -115,7 +121,10 @@ class RequestContextSerializer(messaging.Serializer):
         return context.to_dict()
 
     def deserialize_context(self, context):
-        return magnum_context.RequestContext.from_dict(context)
+        # NOTE: every RPC call gets its own context, so the identity map
+        # lives for the duration of the call.
+        return object_cache.install(
+            magnum_context.RequestContext.from_dict(context))
 
 
 def get_transport_url(url_str=None):
@@ -131,6 +140,23 @@ def get_client(target, version_cap=None, serializer=None):
                                serializer=serializer)
 
 
+def get_shared_client(topic, server=None, timeout=None, serializer=None):
+    """Return the client shared by the process for the given target.
+
+    An RPC client keeps no per-request state, the context is given on
+    each call, so one client per target is reused by all the callers.
+    """
+    key = (topic, server, timeout)
+    client = _SHARED_CLIENTS.get(key)
+    if client is None:
+        target = messaging.Target(topic=topic, server=server)
+        client = get_client(target, serializer=serializer)
+        if timeout is not None:
+            client = client.prepare(timeout=timeout)
+        _SHARED_CLIENTS[key] = client
+    return client
+
+
 def get_server(target, endpoints, serializer=None):
     assert TRANSPORT is not None
     serializer = RequestContextSerializer(serializer)
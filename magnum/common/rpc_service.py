@@ -54,6 +54,15 @@ CONF = cfg.CONF
 CONF.register_opts(periodic_opts)
 
 
+def _create_client(transport, topic, server, timeout):
+    serializer = rpc.RequestContextSerializer(
+        objects_base.MagnumObjectSerializer())
+    target = messaging.Target(topic=topic, server=server)
+    return messaging.RPCClient(transport, target,
+                               serializer=serializer,
+                               timeout=timeout)
+
+
 class Service(service.Service):
 
     def __init__(self, topic, server, handlers):
@@ -84,20 +93,15 @@ class Service(service.Service):
 class API(object):
     def __init__(self, transport=None, context=None, topic=None, server=None,
                  timeout=None):
-        serializer = rpc.RequestContextSerializer(
-            objects_base.MagnumObjectSerializer())
-        if transport is None:
-            exmods = rpc.get_allowed_exmods()
-            transport = messaging.get_transport(cfg.CONF,
-                                                allowed_remote_exmods=exmods,
-                                                aliases=TRANSPORT_ALIASES)
         self._context = context
         if topic is None:
             topic = ''
-        target = messaging.Target(topic=topic, server=server)
-        self._client = messaging.RPCClient(transport, target,
-                                           serializer=serializer,
-                                           timeout=timeout)
+        if transport is None:
+            self._client = rpc.get_shared_client(
+                topic, server, timeout,
+                serializer=objects_base.MagnumObjectSerializer())
+        else:
+            self._client = _create_client(transport, topic, server, timeout)
 
     def _call(self, method, *args, **kwargs):
         return self._client.call(self._context, method, *args, **kwargs)
@@ -48,6 +48,27 @@ x509_opts = [
                default=365 * 5,
                help=_('Number of days for which a certificate is valid.')),
     cfg.IntOpt('rsa_key_size',
-               default=2048, help=_('Size of generated private key. '))]
+               default=2048, help=_('Size of generated private key. ')),
+    cfg.IntOpt('max_concurrent_operations',
+               default=4,
+               help=_('Maximum number of key generations and certificate '
+                      'signings run at the same time in native threads, '
+                      'which do not block the other requests of the '
+                      'service. Set to 0 to run them in the calling green '
+                      'thread.')),
+    cfg.IntOpt('key_pool_size',
+               default=2,
+               help=_('Number of private keys generated ahead of time and '
+                      'kept in memory for new certificates. Set to 0 to '
+                      'generate every key on demand.')),
+    cfg.IntOpt('ca_key_cache_size',
+               default=100,
+               help=_('Maximum number of decrypted bay CA private keys kept '
+                      'in memory to sign node certificates. Set to 0 to '
+                      'disable the cache.')),
+    cfg.IntOpt('ca_key_cache_ttl',
+               default=60,
+               help=_('Number of seconds a decrypted bay CA private key '
+                      'stays cached in memory.'))]
 
 cfg.CONF.register_opts(x509_opts, group='x509')
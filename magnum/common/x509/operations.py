@@ -21,13 +21,84 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives import serialization
 from cryptography import x509
 from cryptography.x509 import Extension
+from eventlet import semaphore
+from eventlet import tpool
 from oslo_config import cfg
 
+from magnum.common import pool
 from magnum.common.x509 import validator
 
 
 cfg.CONF.import_group('x509', 'magnum.common.x509.config')
 
+_SEMAPHORE = None
+
+
+def _execute(func, *args, **kwargs):
+    """Run a CPU bound operation without blocking the green threads.
+
+    OpenSSL releases the GIL while it generates keys and signs, so the
+    operation runs in a native thread while the hub keeps serving the other
+    green threads. At most max_concurrent_operations run at a time.
+    """
+    global _SEMAPHORE
+    if cfg.CONF.x509.max_concurrent_operations <= 0:
+        return func(*args, **kwargs)
+    if _SEMAPHORE is None:
+        _SEMAPHORE = semaphore.Semaphore(
+            cfg.CONF.x509.max_concurrent_operations)
+    with _SEMAPHORE:
+        return tpool.execute(func, *args, **kwargs)
+
+
+def _generate_private_key(key_size):
+    return rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=key_size,
+        backend=default_backend()
+    )
+
+
+class KeyPool(pool.BackgroundPool):
+    """Private keys generated ahead of time and refilled in the background.
+
+    :param key_size: size of the RSA keys of the pool.
+    """
+
+    def __init__(self, key_size):
+        super(KeyPool, self).__init__(self._generate, 'key_pool_size',
+                                      group='x509',
+                                      description='private key')
+        self.key_size = key_size
+
+    def _generate(self):
+        return _execute(_generate_private_key, self.key_size)
+
+
+_KEY_POOLS = {}
+
+
+def _get_key_pool(key_size):
+    key_pool = _KEY_POOLS.get(key_size)
+    if key_pool is None:
+        key_pool = _KEY_POOLS.setdefault(key_size, KeyPool(key_size))
+    return key_pool
+
+
+def get_private_key():
+    """Return a new private key of x509.rsa_key_size bits."""
+    return _get_key_pool(cfg.CONF.x509.rsa_key_size).get()
+
+
+def prefill_key_pool():
+    """Start generating the keys of the pool of x509.rsa_key_size."""
+    _get_key_pool(cfg.CONF.x509.rsa_key_size).refill()
+
+
+def reset_key_pool():
+    """Drop the pooled private keys."""
+    _KEY_POOLS.clear()
+
 
 def generate_ca_certificate(subject_name, encryption_password=None):
     """Generate CA Certificate
@@ -36,9 +107,11 @@ def generate_ca_certificate(subject_name, encryption_password=None):
     :param encryption_password: encryption passsword for private key
     :returns: generated private key and certificate pair
     """
-    return _generate_self_signed_certificate(
+    return _execute(
+        _generate_self_signed_certificate,
         subject_name,
         _build_ca_extentions(),
+        get_private_key(),
         encryption_password=encryption_password
     )
 
@@ -55,10 +128,11 @@ def generate_client_certificate(issuer_name, subject_name, ca_key,
     :param ca_key_password: private key password for given ca key
     :returns: generated private key and certificate pair
     """
-    return _generate_certificate(issuer_name, subject_name,
-                                 _build_client_extentions(), ca_key=ca_key,
-                                 encryption_password=encryption_password,
-                                 ca_key_password=ca_key_password)
+    return _execute(_generate_certificate, issuer_name, subject_name,
+                    _build_client_extentions(), get_private_key(),
+                    ca_key=ca_key,
+                    encryption_password=encryption_password,
+                    ca_key_password=ca_key_password)
 
 
 def _build_client_extentions():
@@ -88,20 +162,16 @@ def _build_ca_extentions():
     return [basic_constraints, key_usage]
 
 
-def _generate_self_signed_certificate(subject_name, extensions,
+def _generate_self_signed_certificate(subject_name, extensions, private_key,
                                       encryption_password=None):
     return _generate_certificate(subject_name, subject_name, extensions,
+                                 private_key,
                                  encryption_password=encryption_password)
 
 
-def _generate_certificate(issuer_name, subject_name, extensions, ca_key=None,
-                          encryption_password=None, ca_key_password=None):
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=cfg.CONF.x509.rsa_key_size,
-        backend=default_backend()
-    )
-
+def _generate_certificate(issuer_name, subject_name, extensions, private_key,
+                          ca_key=None, encryption_password=None,
+                          ca_key_password=None):
     # subject name is set as common name
     csr = x509.CertificateSigningRequestBuilder()
     csr = csr.subject_name(x509.Name([
@@ -132,7 +202,7 @@ def _generate_certificate(issuer_name, subject_name, extensions, ca_key=None,
 
     keypairs = {
         'private_key': private_key,
-        'certificate': sign(
+        'certificate': _sign(
             csr,
             issuer_name,
             ca_key,
@@ -142,6 +212,22 @@ def _generate_certificate(issuer_name, subject_name, extensions, ca_key=None,
     return keypairs
 
 
+def load_private_key(private_key, password=None):
+    """Load a pem encoded private key
+
+    :param private_key: pem encoded private key
+    :param password: password of the private key
+    :returns: private key object
+    """
+    return _execute(_load_private_key, private_key, password=password)
+
+
+def _load_private_key(private_key, password=None):
+    return serialization.load_pem_private_key(private_key,
+                                              password=password,
+                                              backend=default_backend())
+
+
 def sign(csr, issuer_name, ca_key, ca_key_password=None,
          skip_validation=False):
     """Sign a given csr
@@ -153,10 +239,15 @@ def sign(csr, issuer_name, ca_key, ca_key_password=None,
     :param skip_validation: skip csr validation if true
     :returns: generated certificate
     """
+    return _execute(_sign, csr, issuer_name, ca_key,
+                    ca_key_password=ca_key_password,
+                    skip_validation=skip_validation)
+
+
+def _sign(csr, issuer_name, ca_key, ca_key_password=None,
+          skip_validation=False):
     if not isinstance(ca_key, rsa.RSAPrivateKey):
-        ca_key = serialization.load_pem_private_key(ca_key,
-                                                    password=ca_key_password,
-                                                    backend=default_backend())
+        ca_key = _load_private_key(ca_key, password=ca_key_password)
     if not isinstance(csr, x509.CertificateSigningRequest):
         csr = x509.load_pem_x509_csr(csr, backend=default_backend())
 
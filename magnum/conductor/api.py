@@ -34,9 +34,10 @@ class API(rpc_service.API):
     def baymodel_create(self, context, baymodel):
         return baymodel.create(context)
 
-    def baymodel_list(self, context, limit, marker, sort_key, sort_dir):
+    def baymodel_list(self, context, limit, marker, sort_key, sort_dir,
+                      filters=None):
         return objects.BayModel.list(context, limit, marker,
-                                     sort_key, sort_dir)
+                                     sort_key, sort_dir, filters=filters)
 
     def baymodel_delete(self, context, uuid):
         baymodel = objects.BayModel.get_by_uuid(uuid)
@@ -51,8 +52,15 @@ class API(rpc_service.API):
         return self._call('bay_create', bay=bay,
                           bay_create_timeout=bay_create_timeout)
 
-    def bay_list(self, context, limit, marker, sort_key, sort_dir):
-        return objects.Bay.list(context, limit, marker, sort_key, sort_dir)
+    def bay_create_bulk(self, bays, bay_create_timeout):
+        return self._call('bay_create_bulk', bays=bays,
+                          bay_create_timeout=bay_create_timeout)
+
+    def bay_list(self, context, limit, marker, sort_key, sort_dir,
+                 filters=None, columns=None):
+        return objects.Bay.list_views(context, limit, marker, sort_key,
+                                      sort_dir, filters=filters,
+                                      columns=columns)
 
     def bay_delete(self, uuid):
         return self._call('bay_delete', uuid=uuid)
@@ -71,8 +79,10 @@ class API(rpc_service.API):
     def service_update(self, service):
         return self._call('service_update', service=service)
 
-    def service_list(self, context, limit, marker, sort_key, sort_dir):
-        return objects.Service.list(context, limit, marker, sort_key, sort_dir)
+    def service_list(self, context, limit, marker, sort_key, sort_dir,
+                     filters=None, columns=None):
+        return objects.Service.list(context, limit, marker, sort_key, sort_dir,
+                                    filters=filters, columns=columns)
 
     def service_delete(self, uuid):
         return self._call('service_delete', uuid=uuid)
@@ -85,8 +95,11 @@ class API(rpc_service.API):
     def pod_create(self, pod):
         return self._call('pod_create', pod=pod)
 
-    def pod_list(self, context, limit, marker, sort_key, sort_dir):
-        return objects.Pod.list(context, limit, marker, sort_key, sort_dir)
+    def pod_list(self, context, limit, marker, sort_key, sort_dir,
+                 filters=None, columns=None):
+        return objects.Pod.list_views(context, limit, marker, sort_key,
+                                      sort_dir, filters=filters,
+                                      columns=columns)
 
     def pod_update(self, pod):
         return self._call('pod_update', pod=pod)
@@ -105,9 +118,13 @@ class API(rpc_service.API):
     def rc_update(self, rc):
         return self._call('rc_update', rc=rc)
 
-    def rc_list(self, context, limit, marker, sort_key, sort_dir):
-        return objects.ReplicationController.list(context, limit, marker,
-                                                  sort_key, sort_dir)
+    def rc_list(self, context, limit, marker, sort_key, sort_dir,
+                filters=None, columns=None):
+        return objects.ReplicationController.list_views(context, limit,
+                                                        marker, sort_key,
+                                                        sort_dir,
+                                                        filters=filters,
+                                                        columns=columns)
 
     def rc_delete(self, uuid):
         return self._call('rc_delete', uuid=uuid)
@@ -120,9 +137,10 @@ class API(rpc_service.API):
     def container_create(self, container):
         return self._call('container_create', container=container)
 
-    def container_list(self, context, limit, marker, sort_key, sort_dir):
+    def container_list(self, context, limit, marker, sort_key, sort_dir,
+                       filters=None):
         return objects.Container.list(context, limit, marker, sort_key,
-                                      sort_dir)
+                                      sort_dir, filters=filters)
 
     def container_delete(self, container_uuid):
         return self._call('container_delete', container_uuid=container_uuid)
@@ -167,6 +185,10 @@ class API(rpc_service.API):
     def sign_certificate(self, bay, certificate):
         return self._call('sign_certificate', bay=bay, certificate=certificate)
 
+    def sign_certificates(self, bay, certificates):
+        return self._call('sign_certificates', bay=bay,
+                          certificates=certificates)
+
     def get_ca_certificate(self, bay):
         return self._call('get_ca_certificate', bay=bay)
 
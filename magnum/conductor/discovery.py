@@ -0,0 +1,191 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Discovery URLs the nodes of new bays find each other with.
+
+Getting a discovery URL takes a request to a discovery service. To keep
+that request off the bay creation path, the conductor keeps a pool of
+URLs for each cluster size and refills it in the background.
+"""
+
+import abc
+import threading
+import uuid
+
+from oslo_config import cfg
+import requests
+import six
+from stevedore import driver
+
+from magnum.common import exception
+from magnum.common import pool
+from magnum.i18n import _
+
+discovery_opts = [
+    cfg.StrOpt('etcd_discovery_backend',
+               default='public',
+               help=_('Backend providing the etcd discovery URLs, "public" '
+                      'for the service of '
+                      'etcd_discovery_service_endpoint_format or "etcd" '
+                      'for a self-hosted etcd.')),
+    cfg.StrOpt('etcd_discovery_url',
+               default=None,
+               help=_('Url of the self-hosted etcd used by the "etcd" '
+                      'discovery backend, e.g. http://etcd.local:2379.')),
+    cfg.IntOpt('discovery_request_timeout',
+               default=10,
+               help=_('Number of seconds to wait for a discovery service '
+                      'to respond.')),
+    cfg.IntOpt('discovery_pool_size',
+               default=5,
+               help=_('Number of discovery URLs kept ready for each '
+                      'cluster size. Set to 0 to disable the pool.')),
+    cfg.IntOpt('discovery_url_ttl',
+               default=3600,
+               help=_('Number of seconds a pooled discovery URL stays '
+                      'usable.')),
+    cfg.ListOpt('discovery_pool_sizes',
+                default=['1'],
+                help=_('Cluster sizes whose discovery URL pools are filled '
+                       'when the conductor starts.')),
+]
+
+cfg.CONF.register_opts(discovery_opts, group='bay')
+
+
+@six.add_metaclass(abc.ABCMeta)
+class EtcdDiscoveryBackend(object):
+    """Provider of etcd discovery URLs."""
+
+    @abc.abstractmethod
+    def new_discovery_url(self, size):
+        """Return a new discovery URL for a cluster of the given size."""
+
+
+class PublicEtcdDiscoveryBackend(EtcdDiscoveryBackend):
+    """Discovery URLs from a discovery service such as discovery.etcd.io."""
+
+    def new_discovery_url(self, size):
+        discovery_endpoint = (
+            cfg.CONF.bay.etcd_discovery_service_endpoint_format %
+            {'size': size})
+        discovery_url = requests.get(
+            discovery_endpoint,
+            timeout=cfg.CONF.bay.discovery_request_timeout).text
+        if not discovery_url:
+            raise exception.InvalidDiscoveryURL(
+                discovery_url=discovery_url,
+                discovery_endpoint=discovery_endpoint)
+        return discovery_url
+
+
+class SelfHostedEtcdDiscoveryBackend(EtcdDiscoveryBackend):
+    """Discovery URLs allocated in the keyspace of a self-hosted etcd."""
+
+    def new_discovery_url(self, size):
+        endpoint = cfg.CONF.bay.etcd_discovery_url
+        if not endpoint:
+            raise exception.ConfigInvalid(
+                error_msg=_('etcd_discovery_url is required by the etcd '
+                            'discovery backend.'))
+        discovery_url = '%s/v2/keys/discovery/%s' % (endpoint.rstrip('/'),
+                                                     uuid.uuid4().hex)
+        resp = requests.put(discovery_url + '/_config/size',
+                            data={'value': size},
+                            timeout=cfg.CONF.bay.discovery_request_timeout)
+        if not resp.ok:
+            raise exception.InvalidDiscoveryURL(
+                discovery_url=discovery_url,
+                discovery_endpoint=endpoint)
+        return discovery_url
+
+
+_BACKEND = None
+
+
+def get_backend():
+    global _BACKEND
+    if not _BACKEND:
+        _BACKEND = driver.DriverManager(
+            'magnum.discovery.backend',
+            cfg.CONF.bay.etcd_discovery_backend,
+            invoke_on_load=True).driver
+    return _BACKEND
+
+
+def _new_swarm_discovery_url():
+    token_id = requests.post(
+        cfg.CONF.bay.public_swarm_discovery_url,
+        timeout=cfg.CONF.bay.discovery_request_timeout).text
+    return 'token://%s' % token_id
+
+
+class DiscoveryURLPool(pool.BackgroundPool):
+    """Discovery URLs fetched ahead of time and refilled in the background.
+
+    :param fetch: callable returning a new discovery URL.
+    """
+
+    def __init__(self, fetch):
+        super(DiscoveryURLPool, self).__init__(
+            fetch, 'discovery_pool_size', group='bay',
+            ttl_opt='discovery_url_ttl', description='discovery URL')
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(key, fetch):
+    with _POOLS_LOCK:
+        url_pool = _POOLS.get(key)
+        if url_pool is None:
+            url_pool = _POOLS[key] = DiscoveryURLPool(fetch)
+    return url_pool
+
+
+def _get_etcd_pool(size):
+    def fetch():
+        return get_backend().new_discovery_url(size)
+    return _get_pool(('etcd', size), fetch)
+
+
+def _get_swarm_pool():
+    return _get_pool(('swarm',), _new_swarm_discovery_url)
+
+
+def get_etcd_discovery_url(size):
+    """Return a new etcd discovery URL for a cluster of the given size."""
+    return _get_etcd_pool(size).get()
+
+
+def get_swarm_discovery_url():
+    """Return a new token of the public swarm discovery service."""
+    return _get_swarm_pool().get()
+
+
+def prefill():
+    """Start filling the pools of the configured cluster sizes."""
+    for size in cfg.CONF.bay.discovery_pool_sizes:
+        _get_etcd_pool(int(size)).refill()
+    swarm_enabled = ('magnum_vm_atomic_swarm' in
+                     cfg.CONF.bay.enabled_definitions)
+    if cfg.CONF.bay.public_swarm_discovery and swarm_enabled:
+        _get_swarm_pool().refill()
+
+
+def reset():
+    """Drop the pooled discovery URLs and the loaded backend."""
+    global _BACKEND
+    _BACKEND = None
+    with _POOLS_LOCK:
+        _POOLS.clear()
@@ -17,6 +17,7 @@ from heatclient import exc
 from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_service import loopingcall
+import six
 
 from magnum.common import clients
 from magnum.common import exception
@@ -58,12 +59,17 @@ cfg.CONF.register_opts(bay_heat_opts, group='bay_heat')
 LOG = logging.getLogger(__name__)
 
 
-def _extract_template_definition(context, bay, scale_manager=None):
+def _get_template_definition(context, bay):
     baymodel = conductor_utils.retrieve_baymodel(context, bay)
     cluster_distro = baymodel.cluster_distro
     cluster_coe = baymodel.coe
     definition = TDef.get_template_definition('vm', cluster_distro,
                                               cluster_coe)
+    return baymodel, definition
+
+
+def _extract_template_definition(context, bay, scale_manager=None):
+    baymodel, definition = _get_template_definition(context, bay)
     return definition.extract_definition(context, baymodel, bay,
                                          scale_manager=scale_manager)
 
@@ -95,14 +101,15 @@ def _create_stack(context, osc, bay, bay_create_timeout):
 
 
 def _update_stack(context, osc, bay, scale_manager=None):
-    template_path, heat_params = _extract_template_definition(
-        context, bay, scale_manager=scale_manager)
+    baymodel, definition = _get_template_definition(context, bay)
+    heat_params = definition.get_scale_params(context, baymodel, bay,
+                                              scale_manager=scale_manager)
 
-    tpl_files, template = template_utils.get_template_contents(template_path)
+    # NOTE: with existing, Heat patches the stack: the template, the files
+    # and the parameters which are not sent keep their current values.
     fields = {
         'parameters': heat_params,
-        'template': template,
-        'files': dict(list(tpl_files.items()))
+        'existing': True
     }
 
     return osc.heat().stacks.update(bay.stack_id, **fields)
@@ -117,11 +124,7 @@ class Handler(object):
 
     # Bay Operations
 
-    def bay_create(self, context, bay, bay_create_timeout):
-        LOG.debug('bay_heat bay_create')
-
-        osc = clients.OpenStackClients(context)
-
+    def _create_bay(self, context, osc, bay, bay_create_timeout):
         try:
             #created_stack = _create_stack(context, osc, bay,
             #                              bay_create_timeout)
@@ -139,6 +142,42 @@ class Handler(object):
 
         return bay
 
+    def bay_create(self, context, bay, bay_create_timeout):
+        LOG.debug('bay_heat bay_create')
+
+        osc = clients.OpenStackClients(context)
+        return self._create_bay(context, osc, bay, bay_create_timeout)
+
+    def bay_create_bulk(self, context, bays, bay_create_timeout):
+        """Create the bays of a bulk creation.
+
+        Bays are created on the single cluster of the SUR cluster functions
+        and all get its stack id, so a bulk creation is limited to one bay.
+        The bay is returned in a list. If it fails to be created, it is not
+        stored and comes back with the CREATE_FAILED status and the error as
+        its status_reason.
+        """
+        LOG.debug('bay_heat bay_create_bulk')
+
+        if len(bays) > 1:
+            raise exception.InvalidParameterValue(
+                err=_('a bulk creation cannot create more than one bay.'))
+
+        osc = clients.OpenStackClients(context)
+
+        def create(bay):
+            try:
+                return self._create_bay(context, osc, bay,
+                                        bay_create_timeout)
+            except Exception as e:
+                LOG.exception(_LE('Unable to create bay %(name)s: %(e)s'),
+                              {'name': bay.name, 'e': e})
+                bay.status = bay_status.CREATE_FAILED
+                bay.status_reason = six.text_type(e)
+                return bay
+
+        return [create(bay) for bay in bays]
+
     def _validate_properties(self, delta):
         update_disallowed_properties = delta - self._update_allowed_properties
         if update_disallowed_properties:
@@ -174,6 +213,7 @@ class Handler(object):
         LOG.debug('bay_heat bay_delete')
         osc = clients.OpenStackClients(context)
         bay = objects.Bay.get_by_uuid(context, uuid)
+        cert_manager.invalidate_bay_ca(bay)
         stack_id = bay.stack_id
         # NOTE(sdake): This will execute a stack_delete operation.  This will
         # Ignore HTTPNotFound exceptions (stack wasn't present).  In the case
@@ -231,6 +271,8 @@ class HeatPoller(object):
             except exception.BayNotFound:
                 LOG.info(_LI('The bay %s has been deleted by others.')
                          % self.bay.uuid)
+            self.bay.status = stack.stack_status
+            conductor_utils.notify_bay_update(self.context, self.bay)
             raise loopingcall.LoopingCallDone()
         if (stack.stack_status in [bay_status.CREATE_COMPLETE,
                                    bay_status.UPDATE_COMPLETE]):
@@ -242,6 +284,7 @@ class HeatPoller(object):
                 bay_attr='node_count')
             self.bay.node_count = stack.parameters[stack_nc_param]
             self.bay.save()
+            conductor_utils.notify_bay_update(self.context, self.bay)
             raise loopingcall.LoopingCallDone()
         elif stack.stack_status != self.bay.status:
             self.bay.status = stack.stack_status
@@ -250,6 +293,7 @@ class HeatPoller(object):
                 bay_attr='node_count')
             self.bay.node_count = stack.parameters[stack_nc_param]
             self.bay.save()
+            conductor_utils.notify_bay_update(self.context, self.bay)
         if stack.stack_status == bay_status.CREATE_FAILED:
             LOG.error(_LE('Unable to create bay, stack_id: %(stack_id)s, '
                           'reason: %(reason)s') %
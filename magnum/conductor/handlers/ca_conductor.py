@@ -15,6 +15,7 @@
 """Magnum CA RPC handler."""
 
 from oslo_log import log as logging
+import six
 
 from magnum.conductor.handlers.common import cert_manager
 from magnum import objects
@@ -38,6 +39,20 @@ class Handler(object):
         certificate.pem = signed_cert
         return certificate
 
+    def sign_certificates(self, context, bay, certificates):
+        """Sign the CSRs of several certificates of a bay in one call.
+
+        Each certificate gets either its pem or the error its CSR failed
+        with, so that one invalid CSR does not fail the others.
+        """
+        LOG.debug("Signing %d x509 certificates", len(certificates))
+        results = cert_manager.sign_node_certificates(
+            bay, [certificate.csr for certificate in certificates])
+        for certificate, (pem, error) in zip(certificates, results):
+            certificate.pem = pem
+            certificate.error = six.text_type(error) if error else None
+        return certificates
+
     def get_ca_certificate(self, context, bay):
         ca_cert = cert_manager.get_bay_ca_certificate(bay)
         certificate = objects.Certificate.from_object_bay(bay)
@@ -12,17 +12,37 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import eventlet
+from oslo_config import cfg
 from oslo_log import log as logging
 import six
 
+from magnum.common import cache
 from magnum.common import cert_manager
 from magnum.common import short_id
 from magnum.common.x509 import operations as x509
+from magnum.i18n import _LW
 
 CONDUCTOR_CLIENT_NAME = six.u('Magnum-Conductor')
 
 LOG = logging.getLogger(__name__)
 
+_CA_KEYS = None
+
+
+def _get_ca_key_cache():
+    global _CA_KEYS
+    if _CA_KEYS is None:
+        _CA_KEYS = cache.TTLCache(cfg.CONF.x509.ca_key_cache_size,
+                                  cfg.CONF.x509.ca_key_cache_ttl)
+    return _CA_KEYS
+
+
+def reset_cache():
+    """Drop the cached CA keys and reload the cache settings."""
+    global _CA_KEYS
+    _CA_KEYS = None
+
 
 def _generate_ca_cert(issuer_name):
     """Generate and store ca_cert
@@ -90,8 +110,53 @@ def get_bay_ca_certificate(bay):
     return ca_cert.get_certificate()
 
 
-def sign_node_certificate(bay, csr):
+def _get_bay_ca_key(bay):
+    """Return the decrypted private key of the CA of a bay
+
+    The loaded key is kept in memory for x509.ca_key_cache_ttl seconds so
+    that the nodes of a bay signing their certificates at once do not each
+    fetch and decrypt it.
+    """
+    entry = _get_ca_key_cache().get(bay.uuid)
+    if entry is not None and entry[0] == bay.ca_cert_ref:
+        return entry[1]
+
     ca_cert = cert_manager.get_backend().CertManager.get_cert(bay.ca_cert_ref)
-    node_cert = x509.sign(csr, bay.name, ca_cert.get_private_key(),
-                          ca_cert.get_private_key_passphrase())
+    ca_key = x509.load_private_key(ca_cert.get_private_key(),
+                                   ca_cert.get_private_key_passphrase())
+    _get_ca_key_cache().set(bay.uuid, (bay.ca_cert_ref, ca_key))
+    return ca_key
+
+
+def invalidate_bay_ca(bay):
+    """Drop the cached CA key of a bay"""
+    _get_ca_key_cache().pop(bay.uuid)
+
+
+def sign_node_certificate(bay, csr):
+    node_cert = x509.sign(csr, bay.name, _get_bay_ca_key(bay))
     return node_cert
+
+
+def sign_node_certificates(bay, csrs):
+    """Sign several CSRs of the nodes of a bay
+
+    The CA key is loaded once and the signatures run concurrently, at most
+    x509.max_concurrent_operations at a time.
+
+    :param bay: The bay whose CA signs the CSRs
+    :param csrs: pem encoded CSRs
+    :returns: a (certificate, error) pair for each CSR, in order
+    """
+    ca_key = _get_bay_ca_key(bay)
+
+    def sign(csr):
+        try:
+            return x509.sign(csr, bay.name, ca_key), None
+        except Exception as e:
+            LOG.warning(_LW('Unable to sign a certificate of bay %(bay)s: '
+                            '%(e)s'), {'bay': bay.uuid, 'e': e})
+            return None, e
+
+    pool = eventlet.GreenPool(max(cfg.CONF.x509.max_concurrent_operations, 1))
+    return list(pool.imap(sign, csrs))
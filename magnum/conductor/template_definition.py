@@ -22,6 +22,7 @@ import six
 
 from magnum.common import exception
 from magnum.common import paths
+from magnum.conductor import discovery
 from magnum.i18n import _
 from magnum.i18n import _LW
 
@@ -119,6 +120,18 @@ class ParameterMapping(object):
             params[self.heat_param] = value
 
 
+def get_stack_outputs(stack):
+    """Index the outputs of a Heat stack by their key.
+
+    :param stack: the Heat stack to read the outputs of.
+    :returns: a dict of the output values by output key.
+    """
+    outputs = dict()
+    for output in stack.outputs:
+        outputs.setdefault(output['output_key'], output['output_value'])
+    return outputs
+
+
 class OutputMapping(object):
     """An OutputMapping is an association of a Heat output with a key
     Magnum understands.
@@ -128,21 +141,28 @@ class OutputMapping(object):
         self.bay_attr = bay_attr
         self.heat_output = heat_output
 
-    def set_output(self, stack, bay):
+    def set_output(self, stack, bay, outputs=None):
         if self.bay_attr is None:
             return
 
-        output_value = self.get_output_value(stack)
+        output_value = self.get_output_value(stack, outputs)
         if output_value is not None:
             setattr(bay, self.bay_attr, output_value)
 
     def matched(self, output_key):
         return self.heat_output == output_key
 
-    def get_output_value(self, stack):
-        for output in stack.outputs:
-            if output['output_key'] == self.heat_output:
-                return output['output_value']
+    def get_output_value(self, stack, outputs=None):
+        """Return the value of the output in the stack.
+
+        :param stack: the Heat stack to read the output of.
+        :param outputs: the outputs of the stack as indexed by
+                        get_stack_outputs, to save indexing them again.
+        """
+        if outputs is None:
+            outputs = get_stack_outputs(stack)
+        if self.heat_output in outputs:
+            return outputs[self.heat_output]
 
         LOG.warning(_LW('stack does not have output_key %s'), self.heat_output)
         return None
@@ -155,11 +175,14 @@ class TemplateDefinition(object):
     parameters.
     '''
     definitions = None
+    instances = None
     provides = list()
 
     def __init__(self):
         self.param_mappings = list()
         self.output_mappings = list()
+        self.heat_param_map = dict()
+        self.output_map = dict()
 
     @staticmethod
     def load_entry_points():
@@ -247,8 +270,23 @@ class TemplateDefinition(object):
         :return: class
         '''
 
-        definition_map = cls.get_template_definitions()
         bay_type = (server_type, os, coe)
+        enabled_definitions = tuple(cfg.CONF.bay.enabled_definitions)
+        # NOTE: the definitions hold no state of their own, so a single
+        # instance of each is shared by all the bays of its type.
+        if cls.instances is None:
+            cls.instances = dict()
+        key = (bay_type, enabled_definitions)
+        definition = cls.instances.get(key)
+        if definition is None:
+            definition = cls.instances[key] = cls._new_template_definition(
+                bay_type, enabled_definitions)
+        return definition
+
+    @classmethod
+    def _new_template_definition(cls, bay_type, enabled_definitions):
+        server_type, os, coe = bay_type
+        definition_map = cls.get_template_definitions()
 
         if bay_type not in definition_map:
             raise exception.BayTypeNotSupported(
@@ -257,7 +295,7 @@ class TemplateDefinition(object):
                 coe=coe)
         type_definitions = definition_map[bay_type]
 
-        for name in cfg.CONF.bay.enabled_definitions:
+        for name in enabled_definitions:
             if name in type_definitions:
                 return type_definitions[name]()
 
@@ -267,17 +305,16 @@ class TemplateDefinition(object):
     def add_parameter(self, *args, **kwargs):
         param = ParameterMapping(*args, **kwargs)
         self.param_mappings.append(param)
+        self.heat_param_map.setdefault(
+            (param.bay_attr, param.baymodel_attr), param.heat_param)
 
     def add_output(self, *args, **kwargs):
         output = OutputMapping(*args, **kwargs)
         self.output_mappings.append(output)
+        self.output_map.setdefault(output.heat_output, output)
 
-    def get_output(self, *args, **kwargs):
-        for output in self.output_mappings:
-            if output.matched(*args, **kwargs):
-                return output
-
-        return None
+    def get_output(self, output_key):
+        return self.output_map.get(output_key)
 
     def get_params(self, context, baymodel, bay, **kwargs):
         """Pulls template parameters from Baymodel and/or Bay.
@@ -299,6 +336,27 @@ class TemplateDefinition(object):
 
         return template_params
 
+    def get_scale_params(self, context, baymodel, bay, **kwargs):
+        """Pulls the template parameters changed by scaling the Bay.
+
+        Scaling a Bay only updates these parameters, the others keep the
+        values they have in the stack.
+
+        :param context: Context to pull template parameters for
+        :param baymodel: Baymodel to pull template parameters from
+        :param bay: Bay to pull template parameters from
+        :param scale_manager: The ScaleManager of the scaling operation
+
+        :return: dict of template parameters
+        """
+        template_params = dict()
+
+        for mapping in self.param_mappings:
+            if mapping.bay_attr == 'node_count':
+                mapping.set_param(template_params, baymodel, bay)
+
+        return template_params
+
     def get_heat_param(self, bay_attr=None, baymodel_attr=None):
         """Returns stack param name  using bay and baymodel attributes
         :param bay_attr bay attribute from which it maps to stack attribute
@@ -307,16 +365,12 @@ class TemplateDefinition(object):
 
         :return stack parameter name or None
         """
-        for mapping in self.param_mappings:
-            if (mapping.bay_attr == bay_attr and
-                    mapping.baymodel_attr == baymodel_attr):
-                return mapping.heat_param
-
-        return None
+        return self.heat_param_map.get((bay_attr, baymodel_attr))
 
     def update_outputs(self, stack, bay):
+        outputs = get_stack_outputs(stack)
         for output in self.output_mappings:
-            output.set_output(stack, bay)
+            output.set_output(stack, bay, outputs)
 
     @abc.abstractproperty
     def template_path(self):
@@ -391,25 +445,20 @@ class AtomicK8sTemplateDefinition(BaseTemplateDefinition):
         if hasattr(bay, 'discovery_url') and bay.discovery_url:
             discovery_url = bay.discovery_url
         else:
-            discovery_endpoint = (
-                cfg.CONF.bay.etcd_discovery_service_endpoint_format %
-                {'size': bay.master_count})
-            discovery_url = requests.get(discovery_endpoint).text
-            if not discovery_url:
-                raise exception.InvalidDiscoveryURL(
-                    discovery_url=discovery_url,
-                    discovery_endpoint=discovery_endpoint)
-            else:
-                bay.discovery_url = discovery_url
+            discovery_url = discovery.get_etcd_discovery_url(bay.master_count)
+            bay.discovery_url = discovery_url
         return discovery_url
 
+    def _get_minions_to_remove(self, scale_mgr):
+        hosts = self.get_output('kube_minions')
+        return scale_mgr.get_removal_nodes(hosts)
+
     def get_params(self, context, baymodel, bay, **kwargs):
         extra_params = kwargs.pop('extra_params', {})
         scale_mgr = kwargs.pop('scale_manager', None)
         if scale_mgr:
-            hosts = self.get_output('kube_minions')
             extra_params['minions_to_remove'] = (
-                scale_mgr.get_removal_nodes(hosts))
+                self._get_minions_to_remove(scale_mgr))
 
         extra_params['discovery_url'] = self.get_discovery_url(bay)
 
@@ -418,6 +467,17 @@ class AtomicK8sTemplateDefinition(BaseTemplateDefinition):
                                       extra_params=extra_params,
                                       **kwargs)
 
+    def get_scale_params(self, context, baymodel, bay, **kwargs):
+        scale_mgr = kwargs.pop('scale_manager', None)
+        template_params = super(AtomicK8sTemplateDefinition,
+                                self).get_scale_params(context, baymodel,
+                                                       bay, **kwargs)
+        if scale_mgr:
+            template_params['minions_to_remove'] = (
+                self._get_minions_to_remove(scale_mgr))
+
+        return template_params
+
     @property
     def template_path(self):
         return cfg.CONF.bay.k8s_atomic_template_path
@@ -437,7 +497,9 @@ class CoreOSK8sTemplateDefinition(AtomicK8sTemplateDefinition):
     def get_token():
         discovery_url = cfg.CONF.bay.coreos_discovery_token_url
         if discovery_url:
-            coreos_token_url = requests.get(discovery_url)
+            coreos_token_url = requests.get(
+                discovery_url,
+                timeout=cfg.CONF.bay.discovery_request_timeout)
             token = str(coreos_token_url.text.split('/')[3])
         else:
             token = uuid.uuid4().hex
@@ -481,8 +543,7 @@ class AtomicSwarmTemplateDefinition(BaseTemplateDefinition):
 
     @staticmethod
     def get_public_token():
-        token_id = requests.post(cfg.CONF.bay.public_swarm_discovery_url).text
-        return 'token://%s' % token_id
+        return discovery.get_swarm_discovery_url()
 
     @staticmethod
     def parse_discovery_url(bay):
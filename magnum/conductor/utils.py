@@ -12,16 +12,45 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from oslo_log import log as logging
+
 from magnum.common import clients
+from magnum.common import object_cache
+from magnum.common import rpc
+from magnum.i18n import _LW
 from magnum import objects
 
+LOG = logging.getLogger(__name__)
+
+BAY_UPDATE_EVENT = 'magnum.bay.update'
+
 
 def retrieve_bay(context, obj):
-    return objects.Bay.get_by_uuid(context, obj.bay_uuid)
+    return object_cache.get_object(context, objects.Bay, obj.bay_uuid,
+                                   objects.Bay.get_by_uuid)
 
 
 def retrieve_baymodel(context, bay):
-    return objects.BayModel.get_by_uuid(context, bay.baymodel_id)
+    return object_cache.get_object(context, objects.BayModel,
+                                   bay.baymodel_id,
+                                   objects.BayModel.get_by_uuid)
+
+
+def notify_bay_update(context, bay):
+    """Emit a notification that the status of the bay has changed.
+
+    The API wakes up clients waiting on the bay with ``wait_for_change``
+    when it receives this notification. Notifications are best effort,
+    a failure to send one never fails the caller.
+    """
+    payload = {'uuid': bay.uuid, 'status': bay.status}
+    try:
+        rpc.get_notifier(service='conductor').info(
+            context, BAY_UPDATE_EVENT, payload)
+    except Exception:
+        LOG.warning(_LW('Failed to send %(event)s notification for bay '
+                        '%(uuid)s'), {'event': BAY_UPDATE_EVENT,
+                                      'uuid': bay.uuid})
 
 
 def object_has_stack(context, obj):
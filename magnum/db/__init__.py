@@ -21,7 +21,27 @@ from magnum.common import paths
 sql_opts = [
     cfg.StrOpt('mysql_engine',
                default='InnoDB',
-               help='MySQL engine to use.')
+               help='MySQL engine to use.'),
+    cfg.BoolOpt('use_slave_for_lists',
+                default=False,
+                help='Serve collection queries from the database configured '
+                     'in slave_connection. Listings may then lag behind '
+                     'the primary by the replication delay.'),
+    cfg.BoolOpt('use_slave_for_gets',
+                default=False,
+                help='Serve single resource lookups by id, uuid or name '
+                     'from the database configured in slave_connection. '
+                     'Only enable this when the replication delay is '
+                     'acceptable for read-modify-write callers.'),
+    cfg.IntOpt('purge_deleted_after_days',
+               default=7,
+               help='Number of days soft-deleted bays and bay resources are '
+                    'kept before the conductor purges them. Set to 0 to '
+                    'disable the periodic purge.'),
+    cfg.IntOpt('purge_batch_size',
+               default=1000,
+               help='Maximum number of soft-deleted rows removed in a '
+                    'single purge transaction.'),
 ]
 
 _DEFAULT_SQL_CONNECTION = 'sqlite:///' + paths.state_path_def('magnum.sqlite')
@@ -42,7 +42,8 @@ class Connection(object):
 
     @abc.abstractmethod
     def get_bay_list(self, context, filters=None, limit=None,
-                     marker=None, sort_key=None, sort_dir=None):
+                     marker=None, sort_key=None, sort_dir=None,
+                     columns=None):
         """Get matching bays.
 
         Return a list of the specified columns for all bays that match the
@@ -57,6 +58,8 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param columns: Columns to load. Others are deferred until
+                        accessed. Defaults to None, loading all columns.
         :returns: A list of tuples of the specified columns.
         """
 
@@ -159,7 +162,7 @@ class Connection(object):
     @abc.abstractmethod
     def get_baymodel_list(self, context, filters=None,
                           limit=None, marker=None, sort_key=None,
-                          sort_dir=None):
+                          sort_dir=None, columns=None):
         """Get matching baymodels.
 
         Return a list of the specified columns for all baymodels that match the
@@ -174,6 +177,8 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param columns: Columns to load. Others are deferred until
+                        accessed. Defaults to None, loading all columns.
         :returns: A list of tuples of the specified columns.
         """
 
@@ -242,7 +247,7 @@ class Connection(object):
     @abc.abstractmethod
     def get_container_list(self, context, filters=None,
                            limit=None, marker=None, sort_key=None,
-                           sort_dir=None):
+                           sort_dir=None, columns=None):
         """Get matching containers.
 
         Return a list of the specified columns for all containers that match
@@ -257,6 +262,8 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param columns: Columns to load. Others are deferred until
+                        accessed. Defaults to None, loading all columns.
         :returns: A list of tuples of the specified columns.
         """
 
@@ -397,7 +404,8 @@ class Connection(object):
         """
     @abc.abstractmethod
     def get_pod_list(self, context, filters=None, limit=None,
-                     marker=None, sort_key=None, sort_dir=None):
+                     marker=None, sort_key=None, sort_dir=None,
+                     columns=None):
         """Get matching pods.
 
         Return a list of the specified columns for all pods that match the
@@ -412,6 +420,8 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param columns: Columns to load. Others are deferred until
+                        accessed. Defaults to None, loading all columns.
         :returns: A list of tuples of the specified columns.
         """
 
@@ -485,7 +495,8 @@ class Connection(object):
 
     @abc.abstractmethod
     def get_service_list(self, context, filters=None, limit=None,
-                         marker=None, sort_key=None, sort_dir=None):
+                         marker=None, sort_key=None, sort_dir=None,
+                         columns=None):
         """Get matching services.
 
         Return a list of the specified columns for all services that match the
@@ -500,6 +511,8 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param columns: Columns to load. Others are deferred until
+                        accessed. Defaults to None, loading all columns.
         :returns: A list of tuples of the specified columns.
         """
 
@@ -575,7 +588,8 @@ class Connection(object):
 
     @abc.abstractmethod
     def get_rc_list(self, context, filters=None, limit=None,
-                    marker=None, sort_key=None, sort_dir=None):
+                    marker=None, sort_key=None, sort_dir=None,
+                    columns=None):
         """Get matching ReplicationControllers.
 
         Return a list of the specified columns for all rcs that match the
@@ -590,6 +604,8 @@ class Connection(object):
         :param sort_key: Attribute by which results should be sorted.
         :param sort_dir: direction in which results should be sorted.
                          (asc, desc)
+        :param columns: Columns to load. Others are deferred until
+                        accessed. Defaults to None, loading all columns.
         :returns: A list of tuples of the specified columns.
         """
 
@@ -743,3 +759,17 @@ class Connection(object):
                          (asc, desc)
         :returns: A list of tuples of the specified columns.
         """
+
+    @abc.abstractmethod
+    def purge_deleted_rows(self, before, batch_size):
+        """Permanently remove soft-deleted rows.
+
+        Bays, pods, services, replication controllers and containers are
+        only marked as deleted by their destroy methods. This removes the
+        rows which were deleted before the given time, in batches, so that
+        each transaction stays short.
+
+        :param before: A datetime; rows deleted earlier are removed.
+        :param batch_size: Maximum number of rows removed per transaction.
+        :returns: The number of rows removed.
+        """
@@ -0,0 +1,36 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+"""Add soft delete columns to bay and its child resources
+
+Revision ID: baf371fd3ac0
+Revises: f763c6c44ea9
+Create Date: 2015-09-16 15:02:43.121845
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'baf371fd3ac0'
+down_revision = 'f763c6c44ea9'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+TABLES = ['bay', 'container', 'pod', 'service', 'replicationcontroller']
+
+
+def upgrade():
+    for table in TABLES:
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(),
+                                       nullable=True))
+        op.add_column(table, sa.Column('deleted', sa.Integer(),
+                                       nullable=True, server_default='0'))
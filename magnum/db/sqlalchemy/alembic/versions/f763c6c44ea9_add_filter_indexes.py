@@ -0,0 +1,40 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+"""Add indexes on the columns used to filter collections
+
+Revision ID: f763c6c44ea9
+Revises: 5518af8dbc21
+Create Date: 2015-09-14 10:21:47.316262
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'f763c6c44ea9'
+down_revision = '5518af8dbc21'
+
+from alembic import op
+
+
+INDEXES = {
+    'bay': ['project_id', 'name', 'baymodel_id', 'status'],
+    'baymodel': ['project_id', 'name'],
+    'container': ['project_id', 'name', 'bay_uuid'],
+    'pod': ['project_id', 'name', 'bay_uuid', 'status'],
+    'service': ['project_id', 'name', 'bay_uuid'],
+    'replicationcontroller': ['project_id', 'name', 'bay_uuid'],
+}
+
+
+def upgrade():
+    for table, columns in INDEXES.items():
+        for column in columns:
+            op.create_index('ix_%s_%s' % (table, column), table, [column])
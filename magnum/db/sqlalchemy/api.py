@@ -14,12 +14,15 @@
 
 """SQLAlchemy storage backend."""
 
+import json
+
 from oslo_config import cfg
 from oslo_db import exception as db_exc
 from oslo_db.sqlalchemy import session as db_session
 from oslo_db.sqlalchemy import utils as db_utils
 from oslo_log import log
 from oslo_utils import timeutils
+from sqlalchemy import orm
 from sqlalchemy.orm.exc import MultipleResultsFound
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -40,18 +43,20 @@ _FACADE = None
 def _create_facade_lazily():
     global _FACADE
     if _FACADE is None:
+        # NOTE: the facade picks up [database] slave_connection itself and
+        # falls back to the primary engine when it is not set.
         _FACADE = db_session.EngineFacade.from_config(CONF)
     return _FACADE
 
 
-def get_engine():
+def get_engine(use_slave=False):
     facade = _create_facade_lazily()
-    return facade.get_engine()
+    return facade.get_engine(use_slave=use_slave)
 
 
-def get_session(**kwargs):
+def get_session(use_slave=False, **kwargs):
     facade = _create_facade_lazily()
-    return facade.get_session(**kwargs)
+    return facade.get_session(use_slave=use_slave, **kwargs)
 
 
 def get_backend():
@@ -63,10 +68,18 @@ def model_query(model, *args, **kwargs):
     """Query helper for simpler session usage.
 
     :param session: if present, the session to use
+    :param use_slave: if True, the query is run against the slave database
+                      when no session is given
+    :param read_deleted: if True, soft-deleted rows are returned as well.
+                         Models without soft delete columns ignore it.
     """
 
-    session = kwargs.get('session') or get_session()
+    use_slave = kwargs.get('use_slave', False)
+    session = kwargs.get('session') or get_session(use_slave=use_slave)
     query = session.query(model, *args)
+    read_deleted = kwargs.get('read_deleted', False)
+    if not read_deleted and hasattr(model, 'deleted'):
+        query = query.filter(model.deleted == 0)
     return query
 
 
@@ -88,6 +101,46 @@ def add_identity_filter(query, value):
         raise exception.InvalidIdentity(identity=value)
 
 
+def add_labels_filter(query, column, labels):
+    """Adds a filter matching all the given labels to a query.
+
+    Labels are stored as a json-encoded dict, so every label is matched
+    against its serialized ``"key": "value"`` pair.
+
+    :param query: Initial query to add filter to.
+    :param column: The json-encoded labels column.
+    :param labels: A dict of the labels to match.
+    :return: Modified query.
+    """
+    for key, value in labels.items():
+        pair = '%s: %s' % (json.dumps(key), json.dumps(value))
+        pair = (pair.replace('\\', '\\\\').replace('%', '\\%')
+                .replace('_', '\\_'))
+        query = query.filter(column.like('%' + pair + '%', escape='\\'))
+    return query
+
+
+def add_column_projection(query, model, columns):
+    """Restricts the columns loaded by a query.
+
+    Only the primary key and the requested columns of the model are
+    loaded, all the other columns are deferred until they are accessed.
+
+    :param query: Initial query to add the projection to.
+    :param model: The model the query is issued against.
+    :param columns: Names of the columns to load. Names which are not
+                    columns of the model are ignored. If None, all the
+                    columns are loaded.
+    :return: Modified query.
+    """
+    if columns is None:
+        return query
+    table_columns = model.__table__.columns
+    names = set(c for c in columns if c in table_columns)
+    names.add('id')
+    return query.options(orm.load_only(*names))
+
+
 def _paginate_query(model, limit=None, marker=None, sort_key=None,
                     sort_dir=None, query=None):
     if not query:
@@ -150,10 +203,12 @@ class Connection(api.Connection):
         return query
 
     def get_bay_list(self, context, filters=None, limit=None, marker=None,
-                     sort_key=None, sort_dir=None):
-        query = model_query(models.Bay)
+                     sort_key=None, sort_dir=None, columns=None):
+        query = model_query(models.Bay,
+                            use_slave=CONF.database.use_slave_for_lists)
         query = self._add_tenant_filters(context, query)
         query = self._add_bays_filters(query, filters)
+        query = add_column_projection(query, models.Bay, columns)
         return _paginate_query(models.Bay, limit, marker,
                                sort_key, sort_dir, query)
 
@@ -171,7 +226,8 @@ class Connection(api.Connection):
         return bay
 
     def get_bay_by_id(self, context, bay_id):
-        query = model_query(models.Bay)
+        query = model_query(models.Bay,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(id=bay_id)
         try:
@@ -180,7 +236,8 @@ class Connection(api.Connection):
             raise exception.BayNotFound(bay=bay_id)
 
     def get_bay_by_name(self, context, bay_name):
-        query = model_query(models.Bay)
+        query = model_query(models.Bay,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(name=bay_name)
         try:
@@ -192,7 +249,8 @@ class Connection(api.Connection):
             raise exception.BayNotFound(bay=bay_name)
 
     def get_bay_by_uuid(self, context, bay_uuid):
-        query = model_query(models.Bay)
+        query = model_query(models.Bay,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(uuid=bay_uuid)
         try:
@@ -202,26 +260,22 @@ class Connection(api.Connection):
 
     def destroy_bay(self, bay_id):
         def destroy_bay_resources(session, bay_uuid):
-            """Checks whether the bay does not have resources."""
+            """Soft-deletes the resources which belong to the bay."""
             query = model_query(models.Pod, session=session)
             query = self._add_pods_filters(query, {'bay_uuid': bay_uuid})
-            if query.count() != 0:
-                query.delete()
+            query.soft_delete(synchronize_session=False)
 
             query = model_query(models.Service, session=session)
             query = self._add_services_filters(query, {'bay_uuid': bay_uuid})
-            if query.count() != 0:
-                query.delete()
+            query.soft_delete(synchronize_session=False)
 
             query = model_query(models.ReplicationController, session=session)
             query = self._add_rcs_filters(query, {'bay_uuid': bay_uuid})
-            if query.count() != 0:
-                query.delete()
+            query.soft_delete(synchronize_session=False)
 
             query = model_query(models.Container, session=session)
             query = self._add_containers_filters(query, {'bay_uuid': bay_uuid})
-            if query.count() != 0:
-                query.delete()
+            query.soft_delete(synchronize_session=False)
 
         session = get_session()
         with session.begin():
@@ -234,7 +288,7 @@ class Connection(api.Connection):
                 raise exception.BayNotFound(bay=bay_id)
 
             destroy_bay_resources(session, bay_ref['uuid'])
-            query.delete()
+            query.soft_delete(synchronize_session=False)
 
     def update_bay(self, bay_id, values):
         # NOTE(dtantsur): this can lead to very strange errors
@@ -312,6 +366,8 @@ class Connection(api.Connection):
                 external_network_id=filters['external_network_id'])
         if 'dns_nameserver' in filters:
             query = query.filter_by(dns_nameserver=filters['dns_nameserver'])
+        if 'coe' in filters:
+            query = query.filter_by(coe=filters['coe'])
         if 'project_id' in filters:
             query = query.filter_by(project_id=filters['project_id'])
         if 'user_id' in filters:
@@ -320,10 +376,12 @@ class Connection(api.Connection):
         return query
 
     def get_baymodel_list(self, context, filters=None, limit=None, marker=None,
-                          sort_key=None, sort_dir=None):
-        query = model_query(models.BayModel)
+                          sort_key=None, sort_dir=None, columns=None):
+        query = model_query(models.BayModel,
+                            use_slave=CONF.database.use_slave_for_lists)
         query = self._add_tenant_filters(context, query)
         query = self._add_baymodels_filters(query, filters)
+        query = add_column_projection(query, models.BayModel, columns)
         return _paginate_query(models.BayModel, limit, marker,
                                sort_key, sort_dir, query)
 
@@ -341,7 +399,8 @@ class Connection(api.Connection):
         return baymodel
 
     def get_baymodel_by_id(self, context, baymodel_id):
-        query = model_query(models.BayModel)
+        query = model_query(models.BayModel,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(id=baymodel_id)
         try:
@@ -350,7 +409,8 @@ class Connection(api.Connection):
             raise exception.BayModelNotFound(baymodel=baymodel_id)
 
     def get_baymodel_by_uuid(self, context, baymodel_uuid):
-        query = model_query(models.BayModel)
+        query = model_query(models.BayModel,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(uuid=baymodel_uuid)
         try:
@@ -359,7 +419,8 @@ class Connection(api.Connection):
             raise exception.BayModelNotFound(baymodel=baymodel_uuid)
 
     def get_baymodel_by_name(self, context, baymodel_name):
-        query = model_query(models.BayModel)
+        query = model_query(models.BayModel,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(name=baymodel_name)
         try:
@@ -422,6 +483,8 @@ class Connection(api.Connection):
             query = query.filter_by(name=filters['name'])
         if 'image' in filters:
             query = query.filter_by(image=filters['image'])
+        if 'bay_uuid' in filters:
+            query = query.filter_by(bay_uuid=filters['bay_uuid'])
         if 'project_id' in filters:
             query = query.filter_by(project_id=filters['project_id'])
         if 'user_id' in filters:
@@ -430,10 +493,13 @@ class Connection(api.Connection):
         return query
 
     def get_container_list(self, context, filters=None, limit=None,
-                           marker=None, sort_key=None, sort_dir=None):
-        query = model_query(models.Container)
+                           marker=None, sort_key=None, sort_dir=None,
+                           columns=None):
+        query = model_query(models.Container,
+                            use_slave=CONF.database.use_slave_for_lists)
         query = self._add_tenant_filters(context, query)
         query = self._add_containers_filters(query, filters)
+        query = add_column_projection(query, models.Container, columns)
         return _paginate_query(models.Container, limit, marker,
                                sort_key, sort_dir, query)
 
@@ -451,7 +517,8 @@ class Connection(api.Connection):
         return container
 
     def get_container_by_id(self, context, container_id):
-        query = model_query(models.Container)
+        query = model_query(models.Container,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(id=container_id)
         try:
@@ -460,7 +527,8 @@ class Connection(api.Connection):
             raise exception.ContainerNotFound(container=container_id)
 
     def get_container_by_uuid(self, context, container_uuid):
-        query = model_query(models.Container)
+        query = model_query(models.Container,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(uuid=container_uuid)
         try:
@@ -469,7 +537,8 @@ class Connection(api.Connection):
             raise exception.ContainerNotFound(container=container_uuid)
 
     def get_container_by_name(self, context, container_name):
-        query = model_query(models.Container)
+        query = model_query(models.Container,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(name=container_name)
         try:
@@ -486,7 +555,7 @@ class Connection(api.Connection):
         with session.begin():
             query = model_query(models.Container, session=session)
             query = add_identity_filter(query, container_id)
-            count = query.delete()
+            count = query.soft_delete(synchronize_session=False)
             if count != 1:
                 raise exception.ContainerNotFound(container_id)
 
@@ -536,7 +605,8 @@ class Connection(api.Connection):
 
     def get_node_list(self, context, filters=None, limit=None, marker=None,
                       sort_key=None, sort_dir=None):
-        query = model_query(models.Node)
+        query = model_query(models.Node,
+                            use_slave=CONF.database.use_slave_for_lists)
         query = self._add_tenant_filters(context, query)
         query = self._add_nodes_filters(query, filters)
         return _paginate_query(models.Node, limit, marker,
@@ -560,7 +630,8 @@ class Connection(api.Connection):
         return node
 
     def get_node_by_id(self, context, node_id):
-        query = model_query(models.Node)
+        query = model_query(models.Node,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(id=node_id)
         try:
@@ -569,7 +640,8 @@ class Connection(api.Connection):
             raise exception.NodeNotFound(node=node_id)
 
     def get_node_by_uuid(self, context, node_uuid):
-        query = model_query(models.Node)
+        query = model_query(models.Node,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(uuid=node_uuid)
         try:
@@ -628,14 +700,19 @@ class Connection(api.Connection):
             query = query.filter_by(name=filters['name'])
         if 'status' in filters:
             query = query.filter_by(status=filters['status'])
+        if 'labels' in filters:
+            query = add_labels_filter(query, models.Pod.labels,
+                                      filters['labels'])
 
         return query
 
     def get_pod_list(self, context, filters=None, limit=None, marker=None,
-                     sort_key=None, sort_dir=None):
-        query = model_query(models.Pod)
+                     sort_key=None, sort_dir=None, columns=None):
+        query = model_query(models.Pod,
+                            use_slave=CONF.database.use_slave_for_lists)
         query = self._add_tenant_filters(context, query)
         query = self._add_pods_filters(query, filters)
+        query = add_column_projection(query, models.Pod, columns)
         return _paginate_query(models.Pod, limit, marker,
                                sort_key, sort_dir, query)
 
@@ -653,7 +730,8 @@ class Connection(api.Connection):
         return pod
 
     def get_pod_by_id(self, context, pod_id):
-        query = model_query(models.Pod)
+        query = model_query(models.Pod,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(id=pod_id)
         try:
@@ -662,7 +740,8 @@ class Connection(api.Connection):
             raise exception.PodNotFound(pod=pod_id)
 
     def get_pod_by_uuid(self, context, pod_uuid):
-        query = model_query(models.Pod)
+        query = model_query(models.Pod,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(uuid=pod_uuid)
         try:
@@ -671,7 +750,9 @@ class Connection(api.Connection):
             raise exception.PodNotFound(pod=pod_uuid)
 
     def get_pod_by_name(self, pod_name):
-        query = model_query(models.Pod).filter_by(name=pod_name)
+        query = model_query(models.Pod,
+                            use_slave=CONF.database.use_slave_for_gets)
+        query = query.filter_by(name=pod_name)
         try:
             return query.one()
         except MultipleResultsFound:
@@ -681,7 +762,9 @@ class Connection(api.Connection):
             raise exception.PodNotFound(pod=pod_name)
 
     def get_pods_by_bay_uuid(self, bay_uuid):
-        query = model_query(models.Pod).filter_by(bay_uuid=bay_uuid)
+        query = model_query(models.Pod,
+                            use_slave=CONF.database.use_slave_for_gets)
+        query = query.filter_by(bay_uuid=bay_uuid)
         try:
             return query.all()
         except NoResultFound:
@@ -692,7 +775,7 @@ class Connection(api.Connection):
         with session.begin():
             query = model_query(models.Pod, session=session)
             query = add_identity_filter(query, pod_id)
-            count = query.delete()
+            count = query.soft_delete(synchronize_session=False)
             if count != 1:
                 raise exception.PodNotFound(pod_id)
 
@@ -732,14 +815,19 @@ class Connection(api.Connection):
             query = query.filter_by(ip=filters['ip'])
         if 'ports' in filters:
             query = query.filter_by(ports=filters['ports'])
+        if 'labels' in filters:
+            query = add_labels_filter(query, models.Service.labels,
+                                      filters['labels'])
 
         return query
 
     def get_service_list(self, context, filters=None, limit=None, marker=None,
-                         sort_key=None, sort_dir=None):
-        query = model_query(models.Service)
+                         sort_key=None, sort_dir=None, columns=None):
+        query = model_query(models.Service,
+                            use_slave=CONF.database.use_slave_for_lists)
         query = self._add_tenant_filters(context, query)
         query = self._add_services_filters(query, filters)
+        query = add_column_projection(query, models.Service, columns)
         return _paginate_query(models.Service, limit, marker,
                                sort_key, sort_dir, query)
 
@@ -757,7 +845,8 @@ class Connection(api.Connection):
         return service
 
     def get_service_by_id(self, context, service_id):
-        query = model_query(models.Service)
+        query = model_query(models.Service,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(id=service_id)
         try:
@@ -766,7 +855,8 @@ class Connection(api.Connection):
             raise exception.ServiceNotFound(service=service_id)
 
     def get_service_by_uuid(self, context, service_uuid):
-        query = model_query(models.Service)
+        query = model_query(models.Service,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(uuid=service_uuid)
         try:
@@ -777,14 +867,17 @@ class Connection(api.Connection):
     def get_services_by_bay_uuid(self, context, bay_uuid):
         # First verify whether the Bay exists
         self.get_bay_by_uuid(context, bay_uuid)
-        query = model_query(models.Service).filter_by(bay_uuid=bay_uuid)
+        query = model_query(models.Service,
+                            use_slave=CONF.database.use_slave_for_gets)
+        query = query.filter_by(bay_uuid=bay_uuid)
         try:
             return query.all()
         except NoResultFound:
             raise exception.ServiceNotFound(bay=bay_uuid)
 
     def get_service_by_name(self, context, service_name):
-        query = model_query(models.Service)
+        query = model_query(models.Service,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(name=service_name)
         try:
@@ -800,7 +893,7 @@ class Connection(api.Connection):
         with session.begin():
             query = model_query(models.Service, session=session)
             query = add_identity_filter(query, service_id)
-            count = query.delete()
+            count = query.soft_delete(synchronize_session=False)
             if count != 1:
                 raise exception.ServiceNotFound(service_id)
 
@@ -838,14 +931,21 @@ class Connection(api.Connection):
             query = query.filter_by(name=filters['name'])
         if 'replicas' in filters:
             query = query.filter_by(replicas=filters['replicas'])
+        if 'labels' in filters:
+            query = add_labels_filter(query,
+                                      models.ReplicationController.labels,
+                                      filters['labels'])
 
         return query
 
     def get_rc_list(self, context, filters=None, limit=None, marker=None,
-                    sort_key=None, sort_dir=None):
-        query = model_query(models.ReplicationController)
+                    sort_key=None, sort_dir=None, columns=None):
+        query = model_query(models.ReplicationController,
+                            use_slave=CONF.database.use_slave_for_lists)
         query = self._add_tenant_filters(context, query)
         query = self._add_rcs_filters(query, filters)
+        query = add_column_projection(query, models.ReplicationController,
+                                      columns)
         return _paginate_query(models.ReplicationController, limit, marker,
                                sort_key, sort_dir, query)
 
@@ -864,7 +964,8 @@ class Connection(api.Connection):
         return rc
 
     def get_rc_by_id(self, context, rc_id):
-        query = model_query(models.ReplicationController)
+        query = model_query(models.ReplicationController,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(id=rc_id)
         try:
@@ -873,7 +974,8 @@ class Connection(api.Connection):
             raise exception.ReplicationControllerNotFound(rc=rc_id)
 
     def get_rc_by_uuid(self, context, rc_uuid):
-        query = model_query(models.ReplicationController)
+        query = model_query(models.ReplicationController,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(uuid=rc_uuid)
         try:
@@ -884,15 +986,17 @@ class Connection(api.Connection):
     def get_rcs_by_bay_uuid(self, context, bay_uuid):
         # First verify whether the Bay exists
         self.get_bay_by_uuid(context, bay_uuid)
-        query = model_query(models.ReplicationController).filter_by(
-            bay_uuid=bay_uuid)
+        query = model_query(models.ReplicationController,
+                            use_slave=CONF.database.use_slave_for_gets)
+        query = query.filter_by(bay_uuid=bay_uuid)
         try:
             return query.all()
         except NoResultFound:
             raise exception.ReplicationControllerNotFound(bay=bay_uuid)
 
     def get_rc_by_name(self, context, rc_name):
-        query = model_query(models.ReplicationController)
+        query = model_query(models.ReplicationController,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(name=rc_name)
         try:
@@ -908,7 +1012,7 @@ class Connection(api.Connection):
         with session.begin():
             query = model_query(models.ReplicationController, session=session)
             query = add_identity_filter(query, rc_id)
-            count = query.delete()
+            count = query.soft_delete(synchronize_session=False)
             if count != 1:
                 raise exception.ReplicationControllerNotFound(rc_id)
 
@@ -946,7 +1050,8 @@ class Connection(api.Connection):
         return x509keypair
 
     def get_x509keypair_by_id(self, context, x509keypair_id):
-        query = model_query(models.X509KeyPair)
+        query = model_query(models.X509KeyPair,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(id=x509keypair_id)
         try:
@@ -955,7 +1060,8 @@ class Connection(api.Connection):
             raise exception.X509KeyPairNotFound(x509keypair=x509keypair_id)
 
     def get_x509keypair_by_name(self, context, x509keypair_name):
-        query = model_query(models.X509KeyPair)
+        query = model_query(models.X509KeyPair,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(name=x509keypair_name)
         try:
@@ -968,7 +1074,8 @@ class Connection(api.Connection):
             raise exception.X509KeyPairNotFound(x509keypair=x509keypair_name)
 
     def get_x509keypair_by_uuid(self, context, x509keypair_uuid):
-        query = model_query(models.X509KeyPair)
+        query = model_query(models.X509KeyPair,
+                            use_slave=CONF.database.use_slave_for_gets)
         query = self._add_tenant_filters(context, query)
         query = query.filter_by(uuid=x509keypair_uuid)
         try:
@@ -1026,8 +1133,33 @@ class Connection(api.Connection):
 
     def get_x509keypair_list(self, context, filters=None, limit=None,
                              marker=None, sort_key=None, sort_dir=None):
-        query = model_query(models.X509KeyPair)
+        query = model_query(models.X509KeyPair,
+                            use_slave=CONF.database.use_slave_for_lists)
         query = self._add_tenant_filters(context, query)
         query = self._add_x509keypairs_filters(query, filters)
         return _paginate_query(models.X509KeyPair, limit, marker,
                                sort_key, sort_dir, query)
+
+    def purge_deleted_rows(self, before, batch_size):
+        # NOTE: the child resources go first so that a bay row is never
+        # removed while rows still pointing at it are left behind.
+        purged = 0
+        for model in (models.Pod, models.Service,
+                      models.ReplicationController, models.Container,
+                      models.Bay):
+            while True:
+                session = get_session()
+                with session.begin():
+                    query = session.query(model.id)
+                    query = query.filter(model.deleted != 0)
+                    query = query.filter(model.deleted_at < before)
+                    ids = [row.id for row in query.limit(batch_size)]
+                    if ids:
+                        query = model_query(model, session=session,
+                                            read_deleted=True)
+                        query = query.filter(model.id.in_(ids))
+                        query.delete(synchronize_session=False)
+                purged += len(ids)
+                if len(ids) < batch_size:
+                    break
+        return purged
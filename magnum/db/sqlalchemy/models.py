@@ -94,7 +94,7 @@ class MagnumBase(models.TimestampMixin,
 Base = declarative_base(cls=MagnumBase)
 
 
-class Bay(Base):
+class Bay(Base, models.SoftDeleteMixin):
     """Represents a bay."""
 
     __tablename__ = 'bay'
@@ -103,17 +103,17 @@ class Bay(Base):
         table_args()
     )
     id = Column(Integer, primary_key=True)
-    project_id = Column(String(255))
+    project_id = Column(String(255), index=True)
     user_id = Column(String(255))
     uuid = Column(String(36))
-    name = Column(String(255))
-    baymodel_id = Column(String(255))
+    name = Column(String(255), index=True)
+    baymodel_id = Column(String(255), index=True)
     stack_id = Column(String(255))
     api_address = Column(String(255))
     node_addresses = Column(JSONEncodedList)
     node_count = Column(Integer())
     master_count = Column(Integer())
-    status = Column(String(20))
+    status = Column(String(20), index=True)
     status_reason = Column(Text)
     discovery_url = Column(String(255))
     master_addresses = Column(JSONEncodedList)
@@ -150,9 +150,9 @@ class BayModel(Base):
     )
     id = Column(Integer, primary_key=True)
     uuid = Column(String(36))
-    project_id = Column(String(255))
+    project_id = Column(String(255), index=True)
     user_id = Column(String(255))
-    name = Column(String(255))
+    name = Column(String(255), index=True)
     image_id = Column(String(255))
     flavor_id = Column(String(255))
     master_flavor_id = Column(String(255))
@@ -170,7 +170,7 @@ class BayModel(Base):
     no_proxy = Column(String(255))
 
 
-class Container(Base):
+class Container(Base, models.SoftDeleteMixin):
     """Represents a container."""
 
     __tablename__ = 'container'
@@ -179,13 +179,13 @@ class Container(Base):
         table_args()
     )
     id = Column(Integer, primary_key=True)
-    project_id = Column(String(255))
+    project_id = Column(String(255), index=True)
     user_id = Column(String(255))
     uuid = Column(String(36))
-    name = Column(String(255))
+    name = Column(String(255), index=True)
     image = Column(String(255))
     command = Column(String(255))
-    bay_uuid = Column(String(36))
+    bay_uuid = Column(String(36), index=True)
     status = Column(String(20))
 
 
@@ -208,7 +208,7 @@ class Node(Base):
     ironic_node_id = Column(String(36))
 
 
-class Pod(Base):
+class Pod(Base, models.SoftDeleteMixin):
     """Represents a pod."""
 
     __tablename__ = 'pod'
@@ -218,18 +218,18 @@ class Pod(Base):
     )
     id = Column(Integer, primary_key=True)
     uuid = Column(String(36))
-    name = Column(String(255))
+    name = Column(String(255), index=True)
     desc = Column(String(255))
-    bay_uuid = Column(String(36))
+    bay_uuid = Column(String(36), index=True)
     images = Column(JSONEncodedList)
     labels = Column(JSONEncodedDict)
-    status = Column(String(255))
-    project_id = Column(String(255))
+    status = Column(String(255), index=True)
+    project_id = Column(String(255), index=True)
     user_id = Column(String(255))
     host = Column(String(255))
 
 
-class Service(Base):
+class Service(Base, models.SoftDeleteMixin):
     """Represents a software service."""
 
     __tablename__ = 'service'
@@ -239,17 +239,17 @@ class Service(Base):
     )
     id = Column(Integer, primary_key=True)
     uuid = Column(String(36))
-    name = Column(String(255))
-    bay_uuid = Column(String(36))
+    name = Column(String(255), index=True)
+    bay_uuid = Column(String(36), index=True)
     labels = Column(JSONEncodedDict)
     selector = Column(JSONEncodedDict)
     ip = Column(String(36))
     ports = Column(JSONEncodedList)
-    project_id = Column(String(255))
+    project_id = Column(String(255), index=True)
     user_id = Column(String(255))
 
 
-class ReplicationController(Base):
+class ReplicationController(Base, models.SoftDeleteMixin):
     """Represents a pod replication controller."""
 
     __tablename__ = 'replicationcontroller'
@@ -260,12 +260,12 @@ class ReplicationController(Base):
     )
     id = Column(Integer, primary_key=True)
     uuid = Column(String(36))
-    name = Column(String(255))
-    bay_uuid = Column(String(36))
+    name = Column(String(255), index=True)
+    bay_uuid = Column(String(36), index=True)
     images = Column(JSONEncodedList)
     labels = Column(JSONEncodedDict)
     replicas = Column(Integer())
-    project_id = Column(String(255))
+    project_id = Column(String(255), index=True)
     user_id = Column(String(255))
 
 
@@ -45,13 +45,46 @@ class MagnumObject(ovoo_base.VersionedObject):
     def as_dict(self):
         return dict((k, getattr(self, k))
                     for k in self.fields
-                    if hasattr(self, k))
+                    if self.obj_attr_is_set(k))
 
 
 class MagnumObjectDictCompat(ovoo_base.VersionedObjectDictCompat):
     pass
 
 
+class MagnumObjectView(object):
+    """Base class for read-only views of database entities.
+
+    A view is a light alternative to a versioned object for read paths
+    which only render data: it has no context, no change tracking and
+    keeps its values in __slots__. Subclasses list their fields in
+    __slots__. Versioned objects are still required for any mutation.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, db_obj, columns=None):
+        for field in self.__slots__:
+            if columns is None or field in columns:
+                object.__setattr__(self, field, db_obj[field])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'%s' object is read-only"
+                             % self.__class__.__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError("'%s' object is read-only"
+                             % self.__class__.__name__)
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+    def as_dict(self):
+        return dict((k, getattr(self, k))
+                    for k in self.__slots__
+                    if hasattr(self, k))
+
+
 class MagnumPersistentObject(object):
     """Mixin class for Persistent objects.
     This adds the fields that we use in common for all persistent objects.
@@ -51,18 +51,25 @@ class Bay(base.MagnumPersistentObject, base.MagnumObject,
     }
 
     @staticmethod
-    def _from_db_object(bay, db_bay):
-        """Converts a database entity to a formal object."""
+    def _from_db_object(bay, db_bay, columns=None):
+        """Converts a database entity to a formal object.
+
+        :param columns: if given, only these fields are copied from the
+                        database entity and the others are left unset.
+        """
         for field in bay.fields:
+            if columns is not None and field not in columns:
+                continue
             bay[field] = db_bay[field]
 
         bay.obj_reset_changes()
         return bay
 
     @staticmethod
-    def _from_db_object_list(db_objects, cls, context):
+    def _from_db_object_list(db_objects, cls, context, columns=None):
         """Converts a list of database entities to a list of formal objects."""
-        return [Bay._from_db_object(cls(context), obj) for obj in db_objects]
+        return [Bay._from_db_object(cls(context), obj, columns)
+                for obj in db_objects]
 
     @base.remotable_classmethod
     def get(cls, context, bay_id):
@@ -115,7 +122,7 @@ class Bay(base.MagnumPersistentObject, base.MagnumObject,
 
     @base.remotable_classmethod
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None, filters=None):
+             sort_key=None, sort_dir=None, filters=None, columns=None):
         """Return a list of Bay objects.
 
         :param context: Security context.
@@ -127,6 +134,8 @@ class Bay(base.MagnumPersistentObject, base.MagnumObject,
                         'node_count', 'stack_id', 'api_address',
                         'node_addresses', 'project_id', 'user_id',
                         'status'(should be a status list), 'master_count'.
+        :param columns: fields to load from the database. The other fields
+                        of the returned objects are left unset.
         :returns: a list of :class:`Bay` object.
 
         """
@@ -134,8 +143,27 @@ class Bay(base.MagnumPersistentObject, base.MagnumObject,
                                          marker=marker,
                                          sort_key=sort_key,
                                          sort_dir=sort_dir,
-                                         filters=filters)
-        return Bay._from_db_object_list(db_bays, cls, context)
+                                         filters=filters,
+                                         columns=columns)
+        return Bay._from_db_object_list(db_bays, cls, context, columns)
+
+    @classmethod
+    def list_views(cls, context, limit=None, marker=None,
+                   sort_key=None, sort_dir=None, filters=None, columns=None):
+        """Return a list of read-only views of bays.
+
+        Takes the same arguments as :meth:`list`, but skips building
+        versioned objects. Use it for paths which only render bays.
+
+        :returns: a list of :class:`BayView` object.
+        """
+        db_bays = cls.dbapi.get_bay_list(context, limit=limit,
+                                         marker=marker,
+                                         sort_key=sort_key,
+                                         sort_dir=sort_dir,
+                                         filters=filters,
+                                         columns=columns)
+        return [BayView(db_bay, columns) for db_bay in db_bays]
 
     @base.remotable
     def create(self, context=None):
@@ -205,3 +233,9 @@ class Bay(base.MagnumPersistentObject, base.MagnumObject,
         for field in self.fields:
             if self.obj_attr_is_set(field) and self[field] != current[field]:
                 self[field] = current[field]
+
+
+class BayView(base.MagnumObjectView):
+    """Read-only view of a bay, see :class:`Bay`."""
+
+    __slots__ = tuple(Bay.fields)
@@ -13,14 +13,57 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from oslo_config import cfg
 from oslo_versionedobjects import fields
 
+from magnum.common import cache
 from magnum.common import exception
 from magnum.common import utils
 from magnum.db import api as dbapi
 from magnum.objects import base
 
 
+baymodel_opts = [
+    cfg.IntOpt('cache_ttl',
+               default=60,
+               help='Number of seconds a baymodel looked up by uuid is '
+                    'cached in memory. Changes made by other processes are '
+                    'seen after at most this delay. Set to 0 to disable '
+                    'the cache.'),
+    cfg.IntOpt('cache_size',
+               default=1000,
+               help='Maximum number of baymodels cached in memory.'),
+]
+
+CONF = cfg.CONF
+CONF.register_opts(baymodel_opts, group='baymodel')
+
+_CACHE = None
+
+
+def _get_cache():
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = cache.TTLCache(CONF.baymodel.cache_size,
+                                CONF.baymodel.cache_ttl)
+    return _CACHE
+
+
+def reset_cache():
+    """Drop the cached baymodels and reload the cache settings."""
+    global _CACHE
+    _CACHE = None
+
+
+def _is_visible(context, values):
+    # NOTE: mirrors the tenant filters applied by the database lookup
+    if context.is_admin and context.all_tenants:
+        return True
+    if context.project_id:
+        return values['project_id'] == context.project_id
+    return values['user_id'] == context.user_id
+
+
 @base.MagnumObjectRegistry.register
 class BayModel(base.MagnumPersistentObject, base.MagnumObject,
                base.MagnumObjectDictCompat):
@@ -53,19 +96,25 @@ class BayModel(base.MagnumPersistentObject, base.MagnumObject,
     }
 
     @staticmethod
-    def _from_db_object(baymodel, db_baymodel):
-        """Converts a database entity to a formal object."""
+    def _from_db_object(baymodel, db_baymodel, columns=None):
+        """Converts a database entity to a formal object.
+
+        :param columns: if given, only these fields are copied from the
+                        database entity and the others are left unset.
+        """
         for field in baymodel.fields:
+            if columns is not None and field not in columns:
+                continue
             baymodel[field] = db_baymodel[field]
 
         baymodel.obj_reset_changes()
         return baymodel
 
     @staticmethod
-    def _from_db_object_list(db_objects, cls, context):
+    def _from_db_object_list(db_objects, cls, context, columns=None):
         """Converts a list of database entities to a list of formal objects."""
-        return [BayModel._from_db_object(cls(context), obj) for obj in
-                db_objects]
+        return [BayModel._from_db_object(cls(context), obj, columns)
+                for obj in db_objects]
 
     @base.remotable_classmethod
     def get(cls, context, baymodel_id):
@@ -96,13 +145,24 @@ class BayModel(base.MagnumPersistentObject, base.MagnumObject,
     def get_by_uuid(cls, context, uuid):
         """Find a baymodel based on uuid and return a :class:`BayModel` object.
 
+        The baymodel is served from a process-local cache for up to
+        [baymodel] cache_ttl seconds.
+
         :param uuid: the uuid of a baymodel.
         :param context: Security context
         :returns: a :class:`BayModel` object.
         """
-        db_baymodel = cls.dbapi.get_baymodel_by_uuid(context, uuid)
-        baymodel = BayModel._from_db_object(cls(context), db_baymodel)
-        return baymodel
+        if CONF.baymodel.cache_ttl <= 0:
+            db_baymodel = cls.dbapi.get_baymodel_by_uuid(context, uuid)
+            return BayModel._from_db_object(cls(context), db_baymodel)
+
+        values = _get_cache().get(uuid)
+        if values is None or not _is_visible(context, values):
+            db_baymodel = cls.dbapi.get_baymodel_by_uuid(context, uuid)
+            values = dict((field, db_baymodel[field])
+                          for field in cls.fields)
+            _get_cache().set(uuid, values)
+        return BayModel._from_db_object(cls(context), values)
 
     @base.remotable_classmethod
     def get_by_name(cls, context, name):
@@ -118,7 +178,7 @@ class BayModel(base.MagnumPersistentObject, base.MagnumObject,
 
     @base.remotable_classmethod
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, filters=None, columns=None):
         """Return a list of BayModel objects.
 
         :param context: Security context.
@@ -126,14 +186,23 @@ class BayModel(base.MagnumPersistentObject, base.MagnumObject,
         :param marker: pagination marker for large data sets.
         :param sort_key: column to sort results by.
         :param sort_dir: direction to sort. "asc" or "desc".
+        :param filters: filter dict, can include 'name', 'image_id',
+                        'flavor_id', 'master_flavor_id', 'keypair_id',
+                        'external_network_id', 'dns_nameserver', 'coe',
+                        'project_id' and 'user_id'.
+        :param columns: fields to load from the database. The other fields
+                        of the returned objects are left unset.
         :returns: a list of :class:`BayModel` object.
 
         """
         db_baymodels = cls.dbapi.get_baymodel_list(context, limit=limit,
                                                    marker=marker,
                                                    sort_key=sort_key,
-                                                   sort_dir=sort_dir)
-        return BayModel._from_db_object_list(db_baymodels, cls, context)
+                                                   sort_dir=sort_dir,
+                                                   filters=filters,
+                                                   columns=columns)
+        return BayModel._from_db_object_list(db_baymodels, cls, context,
+                                             columns)
 
     @base.remotable
     def create(self, context=None):
@@ -163,6 +232,7 @@ class BayModel(base.MagnumPersistentObject, base.MagnumObject,
                         object, e.g.: BayModel(context)
         """
         self.dbapi.destroy_baymodel(self.uuid)
+        _get_cache().pop(self.uuid)
         self.obj_reset_changes()
 
     @base.remotable
@@ -181,6 +251,7 @@ class BayModel(base.MagnumPersistentObject, base.MagnumObject,
         """
         updates = self.obj_get_changes()
         self.dbapi.update_baymodel(self.uuid, updates)
+        _get_cache().pop(self.uuid)
 
         self.obj_reset_changes()
 
@@ -199,6 +270,7 @@ class BayModel(base.MagnumPersistentObject, base.MagnumObject,
                         A context should be set when instantiating the
                         object, e.g.: BayModel(context)
         """
+        _get_cache().pop(self.uuid)
         current = self.__class__.get_by_uuid(self._context, uuid=self.uuid)
         for field in self.fields:
             if self.obj_attr_is_set(field) and self[field] != current[field]:
@@ -22,7 +22,8 @@ from magnum.objects import base
 class Certificate(base.MagnumPersistentObject, base.MagnumObject,
                   base.MagnumObjectDictCompat):
     # Version 1.0: Initial version
-    VERSION = '1.0'
+    # Version 1.1: Add error field
+    VERSION = '1.1'
 
     fields = {
         'project_id': fields.StringField(nullable=True),
@@ -30,6 +31,7 @@ class Certificate(base.MagnumPersistentObject, base.MagnumObject,
         'bay_uuid': fields.StringField(nullable=True),
         'csr': fields.StringField(nullable=True),
         'pem': fields.StringField(nullable=True),
+        'error': fields.StringField(nullable=True),
     }
 
     @classmethod
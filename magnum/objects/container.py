@@ -42,18 +42,24 @@ class Container(base.MagnumPersistentObject, base.MagnumObject,
     }
 
     @staticmethod
-    def _from_db_object(container, db_container):
-        """Converts a database entity to a formal object."""
+    def _from_db_object(container, db_container, columns=None):
+        """Converts a database entity to a formal object.
+
+        :param columns: if given, only these fields are copied from the
+                        database entity and the others are left unset.
+        """
         for field in container.fields:
+            if columns is not None and field not in columns:
+                continue
             container[field] = db_container[field]
 
         container.obj_reset_changes()
         return container
 
     @staticmethod
-    def _from_db_object_list(db_objects, cls, context):
+    def _from_db_object_list(db_objects, cls, context, columns=None):
         """Converts a list of database entities to a list of formal objects."""
-        return [Container._from_db_object(cls(context), obj)
+        return [Container._from_db_object(cls(context), obj, columns)
                 for obj in db_objects]
 
     @base.remotable_classmethod
@@ -93,7 +99,7 @@ class Container(base.MagnumPersistentObject, base.MagnumObject,
 
     @base.remotable_classmethod
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, filters=None, columns=None):
         """Return a list of Container objects.
 
         :param context: Security context.
@@ -101,14 +107,21 @@ class Container(base.MagnumPersistentObject, base.MagnumObject,
         :param marker: pagination marker for large data sets.
         :param sort_key: column to sort results by.
         :param sort_dir: direction to sort. "asc" or "desc".
+        :param filters: filter dict, can include 'name', 'image', 'bay_uuid',
+                        'project_id' and 'user_id'.
+        :param columns: fields to load from the database. The other fields
+                        of the returned objects are left unset.
         :returns: a list of :class:`Container` object.
 
         """
         db_containers = cls.dbapi.get_container_list(context, limit=limit,
                                                      marker=marker,
                                                      sort_key=sort_key,
-                                                     sort_dir=sort_dir)
-        return Container._from_db_object_list(db_containers, cls, context)
+                                                     sort_dir=sort_dir,
+                                                     filters=filters,
+                                                     columns=columns)
+        return Container._from_db_object_list(db_containers, cls, context,
+                                              columns)
 
     @base.remotable
     def create(self, context=None):
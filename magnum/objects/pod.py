@@ -44,23 +44,30 @@ class Pod(base.MagnumPersistentObject, base.MagnumObject,
     }
 
     @staticmethod
-    def _from_db_object(pod, db_pod):
-        """Converts a database entity to a formal object."""
+    def _from_db_object(pod, db_pod, columns=None):
+        """Converts a database entity to a formal object.
+
+        :param columns: if given, only these fields are copied from the
+                        database entity and the others are left unset.
+        """
         for field in pod.fields:
             # ignore manifest_url as it was used for create pod
             if field == 'manifest_url':
                 continue
             if field == 'manifest':
                 continue
+            if columns is not None and field not in columns:
+                continue
             pod[field] = db_pod[field]
 
         pod.obj_reset_changes()
         return pod
 
     @staticmethod
-    def _from_db_object_list(db_objects, cls, context):
+    def _from_db_object_list(db_objects, cls, context, columns=None):
         """Converts a list of database entities to a list of formal objects."""
-        return [Pod._from_db_object(cls(context), obj) for obj in db_objects]
+        return [Pod._from_db_object(cls(context), obj, columns)
+                for obj in db_objects]
 
     @base.remotable_classmethod
     def get_by_id(cls, context, pod_id):
@@ -110,7 +117,7 @@ class Pod(base.MagnumPersistentObject, base.MagnumObject,
 
     @base.remotable_classmethod
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, filters=None, columns=None):
         """Return a list of Pod objects.
 
         :param context: Security context.
@@ -118,14 +125,39 @@ class Pod(base.MagnumPersistentObject, base.MagnumObject,
         :param marker: pagination marker for large data sets.
         :param sort_key: column to sort results by.
         :param sort_dir: direction to sort. "asc" or "desc".
+        :param filters: filter dict, can include 'bay_uuid', 'name',
+                        'status' and 'labels' (a dict of labels which must
+                        all match).
+        :param columns: fields to load from the database. The other fields
+                        of the returned objects are left unset.
         :returns: a list of :class:`Pod` object.
 
         """
         db_pods = cls.dbapi.get_pod_list(context, limit=limit,
                                          marker=marker,
                                          sort_key=sort_key,
-                                         sort_dir=sort_dir)
-        return Pod._from_db_object_list(db_pods, cls, context)
+                                         sort_dir=sort_dir,
+                                         filters=filters,
+                                         columns=columns)
+        return Pod._from_db_object_list(db_pods, cls, context, columns)
+
+    @classmethod
+    def list_views(cls, context, limit=None, marker=None,
+                   sort_key=None, sort_dir=None, filters=None, columns=None):
+        """Return a list of read-only views of pods.
+
+        Takes the same arguments as :meth:`list`, but skips building
+        versioned objects. Use it for paths which only render pods.
+
+        :returns: a list of :class:`PodView` object.
+        """
+        db_pods = cls.dbapi.get_pod_list(context, limit=limit,
+                                         marker=marker,
+                                         sort_key=sort_key,
+                                         sort_dir=sort_dir,
+                                         filters=filters,
+                                         columns=columns)
+        return [PodView(db_pod, columns) for db_pod in db_pods]
 
     @base.remotable
     def create(self, context=None):
@@ -199,3 +231,11 @@ class Pod(base.MagnumPersistentObject, base.MagnumObject,
                 continue
             if self.obj_attr_is_set(field) and self[field] != current[field]:
                 self[field] = current[field]
+
+
+class PodView(base.MagnumObjectView):
+    """Read-only view of a pod, see :class:`Pod`."""
+
+    # manifest and manifest_url are only used to create a pod
+    __slots__ = tuple(f for f in Pod.fields
+                      if f not in ('manifest', 'manifest_url'))
@@ -41,8 +41,12 @@ class ReplicationController(base.MagnumPersistentObject, base.MagnumObject,
     }
 
     @staticmethod
-    def _from_db_object(rc, db_rc):
-        """Converts a database entity to a formal object."""
+    def _from_db_object(rc, db_rc, columns=None):
+        """Converts a database entity to a formal object.
+
+        :param columns: if given, only these fields are copied from the
+                        database entity and the others are left unset.
+        """
         for field in rc.fields:
             # ignore manifest_url as it was used for create rc
             if field == 'manifest_url':
@@ -50,15 +54,18 @@ class ReplicationController(base.MagnumPersistentObject, base.MagnumObject,
             # ignore manifest as it was used for create rc
             if field == 'manifest':
                 continue
+            if columns is not None and field not in columns:
+                continue
             rc[field] = db_rc[field]
 
         rc.obj_reset_changes()
         return rc
 
     @staticmethod
-    def _from_db_object_list(db_objects, cls, context):
+    def _from_db_object_list(db_objects, cls, context, columns=None):
         """Converts a list of database entities to a list of formal objects."""
-        return [ReplicationController._from_db_object(cls(context), obj)
+        return [ReplicationController._from_db_object(cls(context), obj,
+                                                      columns)
                 for obj in db_objects]
 
     @base.remotable_classmethod
@@ -101,7 +108,7 @@ class ReplicationController(base.MagnumPersistentObject, base.MagnumObject,
 
     @base.remotable_classmethod
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, filters=None, columns=None):
         """Return a list of ReplicationController objects.
 
         :param context: Security context.
@@ -109,14 +116,40 @@ class ReplicationController(base.MagnumPersistentObject, base.MagnumObject,
         :param marker: pagination marker for large data sets.
         :param sort_key: column to sort results by.
         :param sort_dir: direction to sort. "asc" or "desc".
+        :param filters: filter dict, can include 'bay_uuid', 'name',
+                        'replicas' and 'labels' (a dict of labels which must
+                        all match).
+        :param columns: fields to load from the database. The other fields
+                        of the returned objects are left unset.
         :returns: a list of :class:`ReplicationController` object.
 
         """
         db_rcs = cls.dbapi.get_rc_list(context, limit=limit,
                                        marker=marker,
                                        sort_key=sort_key,
-                                       sort_dir=sort_dir)
-        return ReplicationController._from_db_object_list(db_rcs, cls, context)
+                                       sort_dir=sort_dir,
+                                       filters=filters,
+                                       columns=columns)
+        return ReplicationController._from_db_object_list(db_rcs, cls, context,
+                                                          columns)
+
+    @classmethod
+    def list_views(cls, context, limit=None, marker=None,
+                   sort_key=None, sort_dir=None, filters=None, columns=None):
+        """Return a list of read-only views of ReplicationControllers.
+
+        Takes the same arguments as :meth:`list`, but skips building
+        versioned objects. Use it for paths which only render rcs.
+
+        :returns: a list of :class:`ReplicationControllerView` object.
+        """
+        db_rcs = cls.dbapi.get_rc_list(context, limit=limit,
+                                       marker=marker,
+                                       sort_key=sort_key,
+                                       sort_dir=sort_dir,
+                                       filters=filters,
+                                       columns=columns)
+        return [ReplicationControllerView(db_rc, columns) for db_rc in db_rcs]
 
     @base.remotable
     def create(self, context=None):
@@ -190,3 +223,11 @@ class ReplicationController(base.MagnumPersistentObject, base.MagnumObject,
                 continue
             if self.obj_attr_is_set(field) and self[field] != current[field]:
                 self[field] = current[field]
+
+
+class ReplicationControllerView(base.MagnumObjectView):
+    """Read-only view of a rc, see :class:`ReplicationController`."""
+
+    # manifest and manifest_url are only used to create a rc
+    __slots__ = tuple(f for f in ReplicationController.fields
+                      if f not in ('manifest', 'manifest_url'))
@@ -44,23 +44,29 @@ class Service(base.MagnumPersistentObject, base.MagnumObject,
     }
 
     @staticmethod
-    def _from_db_object(service, db_service):
-        """Converts a database entity to a formal object."""
+    def _from_db_object(service, db_service, columns=None):
+        """Converts a database entity to a formal object.
+
+        :param columns: if given, only these fields are copied from the
+                        database entity and the others are left unset.
+        """
         for field in service.fields:
             # ignore manifest_url as it was used for create service
             if field == 'manifest_url':
                 continue
             if field == 'manifest':
                 continue
+            if columns is not None and field not in columns:
+                continue
             service[field] = db_service[field]
 
         service.obj_reset_changes()
         return service
 
     @staticmethod
-    def _from_db_object_list(db_objects, cls, context):
+    def _from_db_object_list(db_objects, cls, context, columns=None):
         """Converts a list of database entities to a list of formal objects."""
-        return [Service._from_db_object(cls(context), obj)
+        return [Service._from_db_object(cls(context), obj, columns)
                 for obj in db_objects]
 
     @base.remotable_classmethod
@@ -113,7 +119,7 @@ class Service(base.MagnumPersistentObject, base.MagnumObject,
 
     @base.remotable_classmethod
     def list(cls, context, limit=None, marker=None,
-             sort_key=None, sort_dir=None):
+             sort_key=None, sort_dir=None, filters=None, columns=None):
         """Return a list of Service objects.
 
         :param context: Security context.
@@ -121,14 +127,22 @@ class Service(base.MagnumPersistentObject, base.MagnumObject,
         :param marker: pagination marker for large data sets.
         :param sort_key: column to sort results by.
         :param sort_dir: direction to sort. "asc" or "desc".
+        :param filters: filter dict, can include 'bay_uuid', 'name', 'ip',
+                        'ports' and 'labels' (a dict of labels which must
+                        all match).
+        :param columns: fields to load from the database. The other fields
+                        of the returned objects are left unset.
         :returns: a list of :class:`Service` object.
 
         """
         db_services = cls.dbapi.get_service_list(context, limit=limit,
                                                  marker=marker,
                                                  sort_key=sort_key,
-                                                 sort_dir=sort_dir)
-        return Service._from_db_object_list(db_services, cls, context)
+                                                 sort_dir=sort_dir,
+                                                 filters=filters,
+                                                 columns=columns)
+        return Service._from_db_object_list(db_services, cls, context,
+                                            columns)
 
     @base.remotable
     def create(self, context=None):
@@ -18,18 +18,22 @@ import itertools
 import magnum.api.app
 import magnum.api.auth
 import magnum.common.cert_manager
+from magnum.common.cert_manager import barbican_cert_manager
 from magnum.common.cert_manager import local_cert_manager
 import magnum.common.clients
 import magnum.common.exception
 import magnum.common.magnum_keystoneclient
+import magnum.common.policy
 import magnum.common.service
 import magnum.common.x509.config
 import magnum.conductor.config
+import magnum.conductor.discovery
 import magnum.conductor.handlers.bay_conductor
 import magnum.conductor.handlers.docker_conductor
 import magnum.conductor.handlers.k8s_conductor
 import magnum.conductor.template_definition
 import magnum.db
+import magnum.objects.baymodel
 
 
 def list_opts():
@@ -41,9 +45,17 @@ def list_opts():
                          magnum.common.utils.UTILS_OPTS,
                          magnum.common.rpc_service.periodic_opts,
                          magnum.common.service.service_opts,
+                         magnum.common.policy.policy_opts,
                          )),
         ('api', magnum.api.app.API_SERVICE_OPTS),
-        ('bay', magnum.conductor.template_definition.template_def_opts),
+        ('bay',
+         itertools.chain(
+             magnum.conductor.template_definition.template_def_opts,
+             magnum.conductor.discovery.discovery_opts,
+         )),
+        ('baymodel', magnum.objects.baymodel.baymodel_opts),
+        ('client_cache',
+         magnum.common.magnum_keystoneclient.client_cache_opts),
         ('conductor', magnum.conductor.config.SERVICE_OPTS),
         ('database', magnum.db.sql_opts),
         ('docker', magnum.conductor.handlers.docker_conductor.docker_opts),
@@ -56,6 +68,7 @@ def list_opts():
         ('certificates',
             itertools.chain(magnum.common.cert_manager.cert_manager_opts,
                             local_cert_manager.local_cert_manager_opts,
+                            barbican_cert_manager.barbican_cert_manager_opts,
                             )),
         ('kubernetes',
             magnum.conductor.k8s_api.kubernetes_opts),
@@ -13,16 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
 import functools
 import six
 
+from oslo_config import cfg
 from oslo_log import log
 from oslo_service import periodic_task
 from oslo_service import threadgroup
+from oslo_utils import timeutils
 
 from magnum.common import clients
 from magnum.common import context
 from magnum.common import exception
+from magnum.db import api as dbapi
 from magnum.i18n import _
 from magnum.i18n import _LI
 from magnum.i18n import _LW
@@ -30,6 +34,7 @@ from magnum import objects
 from magnum.objects.fields import BayStatus as bay_status
 
 
+CONF = cfg.CONF
 LOG = log.getLogger(__name__)
 
 
@@ -120,6 +125,25 @@ class MagnumPeriodicTasks(periodic_task.PeriodicTasks):
             LOG.warn(_LW("Ignore error [%s] when syncing up bay status."), e,
                      exc_info=True)
 
+    @periodic_task.periodic_task(spacing=3600)
+    @set_context
+    def purge_deleted_rows(self, ctx):
+        days = CONF.database.purge_deleted_after_days
+        if days <= 0:
+            return
+        try:
+            LOG.debug('Starting to purge soft-deleted rows')
+            before = timeutils.utcnow() - datetime.timedelta(days=days)
+            count = dbapi.get_instance().purge_deleted_rows(
+                before, CONF.database.purge_batch_size)
+            if count:
+                LOG.info(_LI("Purged %(count)s rows deleted more than "
+                             "%(days)s days ago."),
+                         {'count': count, 'days': days})
+        except Exception as e:
+            LOG.warn(_LW("Ignore error [%s] when purging deleted rows."), e,
+                     exc_info=True)
+
 
 def setup(conf):
     tg = threadgroup.ThreadGroup()
@@ -25,8 +25,12 @@ from oslotest import base
 import pecan
 import testscenarios
 
+from magnum.common import clients
 from magnum.common import context as magnum_context
+from magnum.conductor import discovery
+from magnum.conductor import template_definition
 from magnum.objects import base as objects_base
+from magnum.objects import baymodel as objects_baymodel
 from magnum.tests import conf_fixture
 from magnum.tests import policy_fixture
 
@@ -89,6 +93,15 @@ class TestCase(base.BaseTestCase):
             objects_base.MagnumObjectRegistry._registry._obj_classes)
         self.addCleanup(self._restore_obj_registry)
 
+        objects_baymodel.reset_cache()
+        self.addCleanup(objects_baymodel.reset_cache)
+        clients.reset_cache()
+        self.addCleanup(clients.reset_cache)
+        discovery.reset()
+        self.addCleanup(discovery.reset)
+        self.addCleanup(setattr, template_definition.TemplateDefinition,
+                        'instances', None)
+
         def reset_pecan():
             pecan.set_config({}, overwrite=True)
 
@@ -21,6 +21,9 @@ from oslo_log import log
 from magnum.common import config
 
 cfg.CONF.import_opt('host', 'magnum.common.service')
+cfg.CONF.import_opt('discovery_pool_size', 'magnum.conductor.discovery',
+                    group='bay')
+cfg.CONF.import_group('x509', 'magnum.common.x509.config')
 log.register_options(cfg.CONF)
 
 
@@ -34,5 +37,7 @@ class ConfFixture(fixtures.Fixture):
         self.conf.set_default('host', 'fake-mini')
         self.conf.set_default('connection', "sqlite://", group='database')
         self.conf.set_default('sqlite_synchronous', False, group='database')
+        self.conf.set_default('discovery_pool_size', 0, group='bay')
+        self.conf.set_default('key_pool_size', 0, group='x509')
         config.parse_args([], default_config_files=[])
         self.addCleanup(self.conf.reset)
@@ -36,7 +36,9 @@ class PolicyFixture(fixtures.Fixture):
         policy_opts.set_defaults(CONF)
         CONF.set_override('policy_file', self.policy_file_name, 'oslo_policy')
         magnum_policy._ENFORCER = None
+        magnum_policy.reset_cache()
         self.addCleanup(magnum_policy.init().clear)
+        self.addCleanup(magnum_policy.reset_cache)
 
     def set_rules(self, rules):
         policy = magnum_policy._ENFORCER
@@ -69,6 +69,7 @@ class FunctionalTest(base.DbTestCase):
                 'acl_public_routes': ['/', '/v1'],
                 'hooks': [
                     hooks.ContextHook(),
+                    hooks.ObjectCacheHook(),
                     hooks.RPCHook(),
                     hooks.NoExceptionTracebackHook(),
                 ],
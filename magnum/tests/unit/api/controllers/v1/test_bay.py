@@ -22,6 +22,7 @@ from magnum.api.controllers.v1 import bay as api_bay
 from magnum.common import utils
 from magnum.conductor import api as rpcapi
 from magnum import objects
+from magnum.objects.fields import BayStatus as bay_status
 from magnum.tests import base
 from magnum.tests.unit.api import base as api_base
 from magnum.tests.unit.api import utils as apiutils
@@ -107,6 +108,115 @@ class TestListBay(api_base.FunctionalTest):
         self.assertEqual(1, len(response['bays']))
         self.assertEqual(bay_list[-1].uuid, response['bays'][0]['uuid'])
 
+    def test_get_one_not_modified(self):
+        bay = obj_utils.create_test_bay(self.context)
+        response = self.app.get('/v1/bays/%s' % bay.uuid)
+        self.assertEqual(200, response.status_int)
+        etag = response.headers['ETag']
+
+        response = self.app.get('/v1/bays/%s' % bay.uuid,
+                                headers={'If-None-Match': etag})
+        self.assertEqual(304, response.status_int)
+        self.assertEqual(etag, response.headers['ETag'])
+
+        bay.status = 'CREATE_COMPLETE'
+        bay.save()
+        response = self.app.get('/v1/bays/%s' % bay.uuid,
+                                headers={'If-None-Match': etag})
+        self.assertEqual(200, response.status_int)
+        self.assertNotEqual(etag, response.headers['ETag'])
+
+    @mock.patch('magnum.api.watch.WATCHER.wait')
+    def test_get_one_wait_for_change(self, mock_wait):
+        bay = obj_utils.create_test_bay(self.context,
+                                        status='CREATE_IN_PROGRESS')
+
+        def update_bay(uuid, timeout):
+            bay.status = 'CREATE_COMPLETE'
+            bay.save()
+
+        mock_wait.side_effect = update_bay
+        response = self.get_json('/bays/%s?wait_for_change=30' % bay.uuid)
+        self.assertEqual('CREATE_COMPLETE', response['status'])
+        mock_wait.assert_called_once_with(bay.uuid, mock.ANY)
+
+    @mock.patch('magnum.api.watch.WATCHER.wait')
+    def test_get_one_wait_for_change_timeout(self, mock_wait):
+        self.config(max_wait_for_change=0, group='api')
+        bay = obj_utils.create_test_bay(self.context)
+        response = self.app.get('/v1/bays/%s' % bay.uuid)
+        etag = response.headers['ETag']
+
+        response = self.app.get('/v1/bays/%s?wait_for_change=30' % bay.uuid,
+                                headers={'If-None-Match': etag})
+        self.assertEqual(304, response.status_int)
+        self.assertFalse(mock_wait.called)
+
+    def test_get_all_with_fields(self):
+        bay = obj_utils.create_test_bay(self.context,
+                                        status='CREATE_COMPLETE')
+        response = self.get_json('/bays/detail?fields=status')
+        self.assertEqual(1, len(response['bays']))
+        actual = response['bays'][0]
+        self.assertEqual(bay.uuid, actual['uuid'])
+        self.assertEqual('CREATE_COMPLETE', actual['status'])
+        self.assertNotIn('name', actual)
+        self.assertNotIn('node_addresses', actual)
+        self.assertIn('links', actual)
+
+    @mock.patch.object(rpcapi.API, 'bay_list')
+    def test_get_all_with_fields_loads_columns(self, mock_bay_list):
+        mock_bay_list.return_value = []
+        self.get_json('/bays?fields=uuid,status')
+        mock_bay_list.assert_called_once_with(
+            mock.ANY, 1000, None, sort_key='id', sort_dir='asc', filters={},
+            columns=['uuid', 'status'])
+
+    def test_get_all_with_invalid_fields(self):
+        response = self.get_json('/bays?fields=stack_id',
+                                 expect_errors=True)
+        self.assertEqual(400, response.status_int)
+
+    def test_get_all_not_modified(self):
+        obj_utils.create_test_bay(self.context)
+        response = self.app.get('/v1/bays')
+        etag = response.headers['ETag']
+
+        response = self.app.get('/v1/bays', headers={'If-None-Match': etag})
+        self.assertEqual(304, response.status_int)
+
+        obj_utils.create_test_bay(self.context, id=2,
+                                  uuid=utils.generate_uuid())
+        response = self.app.get('/v1/bays', headers={'If-None-Match': etag})
+        self.assertEqual(200, response.status_int)
+        self.assertEqual(2, len(response.json['bays']))
+
+    def test_get_all_with_filters(self):
+        bay1 = obj_utils.create_test_bay(self.context, id=1, name='bay1',
+                                         uuid=utils.generate_uuid(),
+                                         status='CREATE_COMPLETE')
+        bay2 = obj_utils.create_test_bay(self.context, id=2, name='bay2',
+                                         uuid=utils.generate_uuid(),
+                                         status='CREATE_FAILED')
+        obj_utils.create_test_bay(self.context, id=3, name='bay3',
+                                  uuid=utils.generate_uuid(),
+                                  status='CREATE_IN_PROGRESS')
+
+        response = self.get_json('/bays?name=bay1')
+        self.assertEqual([bay1.uuid], [b['uuid'] for b in response['bays']])
+
+        response = self.get_json(
+            '/bays?status=CREATE_COMPLETE,CREATE_FAILED')
+        self.assertEqual(sorted([bay1.uuid, bay2.uuid]),
+                         sorted(b['uuid'] for b in response['bays']))
+
+        response = self.get_json('/bays/detail?status=CREATE_FAILED')
+        self.assertEqual([bay2.uuid], [b['uuid'] for b in response['bays']])
+
+        # an empty status is no status filter
+        response = self.get_json('/bays?status=')
+        self.assertEqual(3, len(response['bays']))
+
     def test_detail(self):
         bay = obj_utils.create_test_bay(self.context)
         response = self.get_json('/bays/detail')
@@ -577,6 +687,58 @@ class TestPost(api_base.FunctionalTest):
         self.assertEqual(201, response.status_int)
 
 
+class TestBulkPost(api_base.FunctionalTest):
+
+    def setUp(self):
+        super(TestBulkPost, self).setUp()
+        self.baymodel = obj_utils.create_test_baymodel(self.context)
+        p = mock.patch.object(rpcapi.API, 'bay_create_bulk')
+        self.mock_bay_create_bulk = p.start()
+        self.mock_bay_create_bulk.side_effect = self._simulate_create_bulk
+        self.addCleanup(p.stop)
+
+    def _simulate_create_bulk(self, bays, bay_create_timeout):
+        for bay in bays:
+            if bay.name == 'failed-1':
+                bay.status = bay_status.CREATE_FAILED
+                bay.status_reason = 'quota exceeded'
+            else:
+                bay.create()
+        return bays
+
+    def test_create_bays(self):
+        bdict = apiutils.bay_post_data(name='web')
+        response = self.post_json('/bays/bulk', {'bay': bdict, 'count': 1})
+        self.assertEqual(201, response.status_int)
+        bays = response.json['bays']
+        self.assertEqual(['web-1'], [b['name'] for b in bays])
+        self.assertNotEqual(bdict['uuid'], bays[0]['uuid'])
+        response = self.get_json('/bays/%s' % bays[0]['uuid'])
+        self.assertEqual('web-1', response['name'])
+        bays, timeout = self.mock_bay_create_bulk.call_args[0]
+        self.assertEqual(15, timeout)
+        self.assertEqual(self.context.project_id, bays[0].project_id)
+
+    def test_create_bays_reports_failed_bays(self):
+        bdict = apiutils.bay_post_data(name='failed')
+        response = self.post_json('/bays/bulk', {'bay': bdict, 'count': 1})
+        self.assertEqual(201, response.status_int)
+        bays = response.json['bays']
+        self.assertEqual(1, len(bays))
+        self.assertEqual(bay_status.CREATE_FAILED, bays[0]['status'])
+        self.assertEqual('quota exceeded', bays[0]['status_reason'])
+        response = self.get_json('/bays/%s' % bays[0]['uuid'],
+                                 expect_errors=True)
+        self.assertEqual(404, response.status_int)
+
+    def test_create_too_many_bays(self):
+        bdict = apiutils.bay_post_data()
+        response = self.post_json('/bays/bulk', {'bay': bdict, 'count': 2},
+                                  expect_errors=True)
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(self.mock_bay_create_bulk.called)
+
+
 class TestDelete(api_base.FunctionalTest):
 
     def setUp(self):
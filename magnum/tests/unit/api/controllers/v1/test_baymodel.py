@@ -185,6 +185,54 @@ class TestListBayModel(api_base.FunctionalTest):
         uuids = [bm['uuid'] for bm in response['baymodels']]
         self.assertEqual(sorted(bm_list), sorted(uuids))
 
+    def test_get_all_with_fields(self):
+        baymodel = obj_utils.create_test_baymodel(self.context)
+        response = self.get_json('/baymodels/detail?fields=coe')
+        self.assertEqual(1, len(response['baymodels']))
+        actual = response['baymodels'][0]
+        self.assertEqual(baymodel.uuid, actual['uuid'])
+        self.assertEqual(baymodel.coe, actual['coe'])
+        self.assertNotIn('name', actual)
+        self.assertNotIn('image_id', actual)
+        self.assertIn('links', actual)
+
+    def test_links_with_fields(self):
+        for id_ in range(1, 3):
+            obj_utils.create_test_baymodel(self.context, id=id_,
+                                           uuid=utils.generate_uuid(),
+                                           name='baymodel%s' % id_)
+        response = self.get_json('/baymodels?limit=1&fields=coe')
+        self.assertEqual(1, len(response['baymodels']))
+        self.assertIn('fields=coe,uuid', response['next'])
+
+    def test_get_all_with_invalid_fields(self):
+        response = self.get_json('/baymodels?fields=coe,bogus',
+                                 expect_errors=True)
+        self.assertEqual(400, response.status_int)
+
+    def test_get_all_with_filters(self):
+        bm1 = obj_utils.create_test_baymodel(self.context, id=1, name='bm1',
+                                             uuid=utils.generate_uuid(),
+                                             coe='swarm')
+        bm2 = obj_utils.create_test_baymodel(self.context, id=2, name='bm2',
+                                             uuid=utils.generate_uuid(),
+                                             coe='kubernetes')
+        bm3 = obj_utils.create_test_baymodel(self.context, id=3, name='bm3',
+                                             uuid=utils.generate_uuid(),
+                                             coe='kubernetes')
+
+        response = self.get_json('/baymodels?name=bm1')
+        self.assertEqual([bm1.uuid],
+                         [bm['uuid'] for bm in response['baymodels']])
+
+        response = self.get_json('/baymodels?coe=kubernetes')
+        self.assertEqual(sorted([bm2.uuid, bm3.uuid]),
+                         sorted(bm['uuid'] for bm in response['baymodels']))
+
+        response = self.get_json('/baymodels/detail?coe=kubernetes&name=bm3')
+        self.assertEqual([bm3.uuid],
+                         [bm['uuid'] for bm in response['baymodels']])
+
     def test_links(self):
         uuid = utils.generate_uuid()
         obj_utils.create_test_baymodel(self.context, id=1, uuid=uuid)
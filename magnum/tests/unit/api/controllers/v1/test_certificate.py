@@ -162,6 +162,88 @@ class TestPost(api_base.FunctionalTest):
         self.assertTrue(response.json['error_message'])
 
 
+class TestBatch(api_base.FunctionalTest):
+
+    def setUp(self):
+        super(TestBatch, self).setUp()
+        self.bay = obj_utils.create_test_bay(self.context)
+
+        conductor_api_patcher = mock.patch('magnum.conductor.api.API')
+        self.conductor_api_class = conductor_api_patcher.start()
+        self.conductor_api = mock.MagicMock()
+        self.conductor_api_class.return_value = self.conductor_api
+        self.addCleanup(conductor_api_patcher.stop)
+
+        self.conductor_api.sign_certificates.side_effect = self._fake_sign
+
+    @staticmethod
+    def _fake_sign(bay, certs):
+        for cert in certs:
+            if cert.csr == 'invalid-csr':
+                cert.pem = None
+                cert.error = 'invalid csr'
+            else:
+                cert.pem = 'pem-%s' % cert.csr
+                cert.error = None
+        return certs
+
+    def test_batch(self):
+        batch = {'bay_uuid': self.bay.uuid,
+                 'csrs': ['csr1', 'invalid-csr', 'csr3']}
+
+        response = self.post_json('/certificates/batch', batch)
+
+        self.assertEqual(201, response.status_int)
+        self.assertEqual(self.bay.uuid, response.json['bay_uuid'])
+        certs = response.json['certificates']
+        self.assertEqual(['csr1', 'invalid-csr', 'csr3'],
+                         [c['csr'] for c in certs])
+        self.assertEqual('pem-csr1', certs[0]['pem'])
+        self.assertEqual('invalid csr', certs[1]['error'])
+        self.assertNotIn('pem', certs[1])
+        self.assertEqual('pem-csr3', certs[2]['pem'])
+        self.assertEqual(1, self.conductor_api.sign_certificates.call_count)
+        bay, cert_objs = self.conductor_api.sign_certificates.call_args[0]
+        self.assertEqual(self.bay.uuid, bay.uuid)
+        for cert in cert_objs:
+            self.assertEqual(self.context.project_id, cert.project_id)
+
+    def test_batch_by_bay_name(self):
+        batch = {'bay_uuid': self.bay.name, 'csrs': ['csr1']}
+
+        response = self.post_json('/certificates/batch', batch)
+
+        self.assertEqual(201, response.status_int)
+        self.assertEqual(self.bay.uuid, response.json['bay_uuid'])
+
+    def test_batch_bay_not_found(self):
+        batch = {'bay_uuid': 'not_found', 'csrs': ['csr1']}
+
+        response = self.post_json('/certificates/batch', batch,
+                                  expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(self.conductor_api.sign_certificates.called)
+
+    def test_batch_too_many_csrs(self):
+        self.config(max_batch_sign=2, group='api')
+        batch = {'bay_uuid': self.bay.uuid, 'csrs': ['csr1', 'csr2', 'csr3']}
+
+        response = self.post_json('/certificates/batch', batch,
+                                  expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+        self.assertFalse(self.conductor_api.sign_certificates.called)
+
+    def test_batch_no_csrs(self):
+        batch = {'bay_uuid': self.bay.uuid, 'csrs': []}
+
+        response = self.post_json('/certificates/batch', batch,
+                                  expect_errors=True)
+
+        self.assertEqual(400, response.status_int)
+
+
 class TestCertPolicyEnforcement(api_base.FunctionalTest):
 
     def setUp(self):
@@ -183,3 +265,10 @@ class TestCertPolicyEnforcement(api_base.FunctionalTest):
         cert = apiutils.cert_post_data()
         self._common_policy_check(
             "certificate:create", self.post_json, '/certificates', cert)
+
+    def test_policy_disallow_batch(self):
+        batch = {'bay_uuid': 'ce5da569-4f65-4272-9199-fac8c9fbc9d4',
+                 'csrs': ['fake-csr']}
+        self._common_policy_check(
+            "certificate:create", self.post_json, '/certificates/batch',
+            batch)
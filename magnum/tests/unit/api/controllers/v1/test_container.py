@@ -175,9 +175,10 @@ class TestContainerController(api_base.FunctionalTest):
 
         response = self.app.get('/v1/containers')
 
-        mock_container_list.assert_called_once_with(mock.ANY,
-                                                    1000, None, sort_dir='asc',
-                                                    sort_key='id')
+        mock_container_list.assert_called_once_with(
+            mock.ANY, 1000, None, sort_dir='asc', sort_key='id', filters={},
+            columns=['uuid', 'name', 'bay_uuid', 'image', 'command',
+                     'status'])
         self.assertEqual(response.status_int, 200)
         actual_containers = response.json['containers']
         self.assertEqual(len(actual_containers), 1)
@@ -233,6 +234,81 @@ class TestContainerController(api_base.FunctionalTest):
         self.assertIn('image', actual_containers[0])
         self.assertIn('command', actual_containers[0])
 
+    @patch('magnum.conductor.api.API.container_show')
+    def test_get_all_containers_with_fields(self, mock_container_show):
+        container = utils.create_test_container(
+            name='container1', uuid=comm_utils.generate_uuid())
+
+        response = self.app.get('/v1/containers?fields=name')
+
+        # the docker status is not refreshed when it is not rendered
+        self.assertFalse(mock_container_show.called)
+        self.assertEqual(200, response.status_int)
+        actual = response.json['containers'][0]
+        self.assertEqual(container.uuid, actual['uuid'])
+        self.assertEqual('container1', actual['name'])
+        self.assertNotIn('status', actual)
+        self.assertNotIn('image', actual)
+
+    @patch('magnum.conductor.api.API.container_show')
+    def test_get_all_containers_with_status_field(self,
+                                                  mock_container_show):
+        container = utils.create_test_container(
+            name='container1', uuid=comm_utils.generate_uuid())
+        mock_container = objects.Container.get_by_uuid(self.context,
+                                                       container.uuid)
+        mock_container.status = 'Running'
+        mock_container_show.return_value = mock_container
+
+        response = self.app.get('/v1/containers?fields=status')
+
+        mock_container_show.assert_called_once_with(container.uuid)
+        self.assertEqual(200, response.status_int)
+        actual = response.json['containers'][0]
+        self.assertEqual(container.uuid, actual['uuid'])
+        self.assertEqual('Running', actual['status'])
+        self.assertNotIn('name', actual)
+
+    @patch('magnum.conductor.api.API.container_show')
+    @patch('magnum.objects.Container.list')
+    def test_get_all_containers_with_fields_loads_columns(
+            self, mock_container_list, mock_container_show):
+        mock_container_list.return_value = []
+
+        self.app.get('/v1/containers?fields=name,image')
+
+        mock_container_list.assert_called_once_with(
+            mock.ANY, 1000, None, sort_dir='asc', sort_key='id', filters={},
+            columns=['name', 'image', 'uuid'])
+
+    @patch('magnum.conductor.api.API.container_show')
+    def test_get_all_containers_with_filters(self, mock_container_show):
+        other_bay_uuid = comm_utils.generate_uuid()
+        container1 = utils.create_test_container(
+            id=1, name='container1', uuid=comm_utils.generate_uuid())
+        container2 = utils.create_test_container(
+            id=2, name='container2', uuid=comm_utils.generate_uuid())
+        container3 = utils.create_test_container(
+            id=3, name='container3', uuid=comm_utils.generate_uuid(),
+            bay_uuid=other_bay_uuid)
+        mock_container_show.side_effect = (
+            lambda uuid: objects.Container.get_by_uuid(self.context, uuid))
+
+        response = self.app.get('/v1/containers?name=container2')
+        self.assertEqual([container2.uuid],
+                         [c['uuid'] for c in response.json['containers']])
+
+        response = self.app.get('/v1/containers?bay_uuid=%s'
+                                % other_bay_uuid)
+        self.assertEqual([container3.uuid],
+                         [c['uuid'] for c in response.json['containers']])
+
+        response = self.app.get('/v1/containers/detail?bay_uuid=%s'
+                                % container1.bay_uuid)
+        self.assertEqual(sorted([container1.uuid, container2.uuid]),
+                         sorted(c['uuid']
+                                for c in response.json['containers']))
+
     @patch('magnum.conductor.api.API.container_show')
     @patch('magnum.objects.Container.list')
     def test_get_all_containers_with_exception(self, mock_container_list,
@@ -244,9 +320,10 @@ class TestContainerController(api_base.FunctionalTest):
 
         response = self.app.get('/v1/containers')
 
-        mock_container_list.assert_called_once_with(mock.ANY,
-                                                    1000, None, sort_dir='asc',
-                                                    sort_key='id')
+        mock_container_list.assert_called_once_with(
+            mock.ANY, 1000, None, sort_dir='asc', sort_key='id', filters={},
+            columns=['uuid', 'name', 'bay_uuid', 'image', 'command',
+                     'status'])
         self.assertEqual(response.status_int, 200)
         actual_containers = response.json['containers']
         self.assertEqual(len(actual_containers), 1)
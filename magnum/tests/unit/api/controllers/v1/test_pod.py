@@ -135,6 +135,60 @@ class TestListPod(api_base.FunctionalTest):
         uuids = [p['uuid'] for p in response['pods']]
         self.assertEqual(sorted(pod_list), sorted(uuids))
 
+    def test_get_all_with_fields(self):
+        pod = obj_utils.create_test_pod(self.context, status='Running')
+        response = self.get_json('/pods/detail?fields=status')
+        self.assertEqual(1, len(response['pods']))
+        actual = response['pods'][0]
+        self.assertEqual(pod.uuid, actual['uuid'])
+        self.assertEqual('Running', actual['status'])
+        self.assertNotIn('name', actual)
+        self.assertNotIn('images', actual)
+        self.assertIn('links', actual)
+
+    def test_get_all_with_invalid_fields(self):
+        response = self.get_json('/pods?fields=status,bogus',
+                                 expect_errors=True)
+        self.assertEqual(400, response.status_int)
+
+    def test_get_all_with_filters(self):
+        other_bay_uuid = utils.generate_uuid()
+        pod1 = obj_utils.create_test_pod(self.context, id=1, name='pod1',
+                                         uuid=utils.generate_uuid(),
+                                         status='Running',
+                                         labels={'app': 'web'})
+        pod2 = obj_utils.create_test_pod(self.context, id=2, name='pod2',
+                                         uuid=utils.generate_uuid(),
+                                         status='Pending',
+                                         labels={'app': 'db'})
+        pod3 = obj_utils.create_test_pod(self.context, id=3, name='pod3',
+                                         uuid=utils.generate_uuid(),
+                                         bay_uuid=other_bay_uuid,
+                                         status='Running',
+                                         labels={'app': 'web',
+                                                 'tier': 'front'})
+
+        response = self.get_json('/pods?name=pod2')
+        self.assertEqual([pod2.uuid], [p['uuid'] for p in response['pods']])
+
+        response = self.get_json('/pods?status=Running')
+        self.assertEqual(sorted([pod1.uuid, pod3.uuid]),
+                         sorted(p['uuid'] for p in response['pods']))
+
+        response = self.get_json('/pods?bay_uuid=%s' % other_bay_uuid)
+        self.assertEqual([pod3.uuid], [p['uuid'] for p in response['pods']])
+
+        response = self.get_json('/pods?labels=app=web')
+        self.assertEqual(sorted([pod1.uuid, pod3.uuid]),
+                         sorted(p['uuid'] for p in response['pods']))
+
+        response = self.get_json('/pods/detail?labels=app=web,tier=front')
+        self.assertEqual([pod3.uuid], [p['uuid'] for p in response['pods']])
+
+    def test_get_all_with_invalid_labels(self):
+        response = self.get_json('/pods?labels=app', expect_errors=True)
+        self.assertEqual(400, response.status_int)
+
     def test_links(self):
         uuid = utils.generate_uuid()
         obj_utils.create_test_pod(self.context, id=1, uuid=uuid)
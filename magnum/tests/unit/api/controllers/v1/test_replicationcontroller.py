@@ -139,6 +139,52 @@ class TestListRC(api_base.FunctionalTest):
         uuids = [r['uuid'] for r in response['rcs']]
         self.assertEqual(sorted(rc_list), sorted(uuids))
 
+    def test_get_all_with_fields(self):
+        rc = obj_utils.create_test_rc(self.context)
+        response = self.get_json('/rcs/detail?fields=replicas')
+        self.assertEqual(1, len(response['rcs']))
+        actual = response['rcs'][0]
+        self.assertEqual(rc.uuid, actual['uuid'])
+        self.assertEqual(rc.replicas, actual['replicas'])
+        self.assertNotIn('name', actual)
+        self.assertNotIn('labels', actual)
+        self.assertIn('links', actual)
+
+    def test_get_all_with_invalid_fields(self):
+        response = self.get_json('/rcs?fields=replicas,bogus',
+                                 expect_errors=True)
+        self.assertEqual(400, response.status_int)
+
+    def test_get_all_with_filters(self):
+        other_bay_uuid = utils.generate_uuid()
+        rc1 = obj_utils.create_test_rc(self.context, id=1, name='rc1',
+                                       uuid=utils.generate_uuid(),
+                                       labels={'app': 'web'})
+        rc2 = obj_utils.create_test_rc(self.context, id=2, name='rc2',
+                                       uuid=utils.generate_uuid(),
+                                       labels={'app': 'db'})
+        rc3 = obj_utils.create_test_rc(self.context, id=3, name='rc3',
+                                       uuid=utils.generate_uuid(),
+                                       bay_uuid=other_bay_uuid,
+                                       labels={'app': 'web', 'tier': '50%'})
+
+        response = self.get_json('/rcs?name=rc2')
+        self.assertEqual([rc2.uuid], [r['uuid'] for r in response['rcs']])
+
+        response = self.get_json('/rcs?bay_uuid=%s' % other_bay_uuid)
+        self.assertEqual([rc3.uuid], [r['uuid'] for r in response['rcs']])
+
+        response = self.get_json('/rcs?labels=app=web')
+        self.assertEqual(sorted([rc1.uuid, rc3.uuid]),
+                         sorted(r['uuid'] for r in response['rcs']))
+
+        response = self.get_json('/rcs/detail?labels=app=web,tier=50%25')
+        self.assertEqual([rc3.uuid], [r['uuid'] for r in response['rcs']])
+
+        # '%' of a label must not act as a LIKE wildcard
+        response = self.get_json('/rcs?labels=tier=%25')
+        self.assertEqual([], response['rcs'])
+
     def test_links(self):
         uuid = utils.generate_uuid()
         obj_utils.create_test_rc(self.context, id=1, uuid=uuid)
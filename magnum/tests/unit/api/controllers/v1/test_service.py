@@ -141,6 +141,56 @@ class TestListService(api_base.FunctionalTest):
         uuids = [s['uuid'] for s in response['services']]
         self.assertEqual(sorted(service_list), sorted(uuids))
 
+    def test_get_all_with_fields(self):
+        service = obj_utils.create_test_service(self.context)
+        response = self.get_json('/services/detail?fields=name')
+        self.assertEqual(1, len(response['services']))
+        actual = response['services'][0]
+        self.assertEqual(service.uuid, actual['uuid'])
+        self.assertEqual(service.name, actual['name'])
+        self.assertNotIn('labels', actual)
+        self.assertNotIn('ports', actual)
+        self.assertIn('links', actual)
+
+    def test_get_all_with_invalid_fields(self):
+        response = self.get_json('/services?fields=name,bogus',
+                                 expect_errors=True)
+        self.assertEqual(400, response.status_int)
+
+    def test_get_all_with_filters(self):
+        other_bay_uuid = utils.generate_uuid()
+        service1 = obj_utils.create_test_service(
+            self.context, id=1, name='service1', uuid=utils.generate_uuid(),
+            labels={'app': 'web'})
+        service2 = obj_utils.create_test_service(
+            self.context, id=2, name='service2', uuid=utils.generate_uuid(),
+            labels={'app': 'db'})
+        service3 = obj_utils.create_test_service(
+            self.context, id=3, name='service3', uuid=utils.generate_uuid(),
+            bay_uuid=other_bay_uuid,
+            labels={'app': 'web', 'tier': 'front_end'})
+
+        response = self.get_json('/services?name=service2')
+        self.assertEqual([service2.uuid],
+                         [s['uuid'] for s in response['services']])
+
+        response = self.get_json('/services?bay_uuid=%s' % other_bay_uuid)
+        self.assertEqual([service3.uuid],
+                         [s['uuid'] for s in response['services']])
+
+        response = self.get_json('/services?labels=app=web')
+        self.assertEqual(sorted([service1.uuid, service3.uuid]),
+                         sorted(s['uuid'] for s in response['services']))
+
+        response = self.get_json(
+            '/services/detail?labels=app=web,tier=front_end')
+        self.assertEqual([service3.uuid],
+                         [s['uuid'] for s in response['services']])
+
+        # '_' of a label must not act as a LIKE wildcard
+        response = self.get_json('/services?labels=tier=front-end')
+        self.assertEqual([], response['services'])
+
     def test_links(self):
         uuid = utils.generate_uuid()
         obj_utils.create_test_service(self.context, id=1, uuid=uuid)
@@ -16,6 +16,7 @@
 import mock
 import wsme
 
+from magnum.api.controllers.v1 import bay as api_bay
 from magnum.api.controllers.v1 import utils
 from magnum.common import exception
 from magnum.common import utils as common_utils
@@ -51,6 +52,33 @@ class TestApiUtils(base.FunctionalTest):
                           utils.validate_sort_dir,
                           'fake-sort')
 
+    def test_parse_labels(self):
+        self.assertIsNone(utils.parse_labels(None))
+        self.assertEqual({'app': 'web', 'tier': ''},
+                         utils.parse_labels('app=web, tier='))
+
+        # invalid labels parameter
+        self.assertRaises(wsme.exc.ClientSideError,
+                          utils.parse_labels, 'app')
+        self.assertRaises(wsme.exc.ClientSideError,
+                          utils.parse_labels, '=web')
+
+    def test_parse_list(self):
+        self.assertIsNone(utils.parse_list(None))
+        self.assertIsNone(utils.parse_list(''))
+        self.assertIsNone(utils.parse_list(' , '))
+        self.assertEqual(['a', 'b'], utils.parse_list('a, b,'))
+
+    def test_parse_fields(self):
+        self.assertIsNone(utils.parse_fields(None, api_bay.Bay))
+        self.assertIsNone(utils.parse_fields('', api_bay.Bay))
+        self.assertEqual(['status', 'uuid'],
+                         utils.parse_fields('status', api_bay.Bay))
+        self.assertEqual(['uuid', 'name'],
+                         utils.parse_fields('uuid, name', api_bay.Bay))
+        self.assertRaises(wsme.exc.ClientSideError,
+                          utils.parse_fields, 'status,stack_id', api_bay.Bay)
+
     @mock.patch('pecan.request')
     @mock.patch('magnum.objects.Bay.get_by_name')
     @mock.patch('magnum.objects.Bay.get_by_uuid')
@@ -0,0 +1,95 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import gzip
+import zlib
+
+from six import moves
+import webob
+
+from magnum.api.middleware import compression
+from magnum.tests import base
+
+
+class TestCompressionMiddleware(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestCompressionMiddleware, self).setUp()
+        self.body = b'{"bays": []}' * 200
+
+        self.etag = None
+
+        def app(environ, start_response):
+            response = webob.Response(body=self.body,
+                                      content_type='application/json')
+            if self.etag:
+                response.etag = self.etag
+            return response(environ, start_response)
+
+        self.app = compression.CompressionMiddleware(app, min_size=1024)
+
+    def _get(self, accept_encoding=None):
+        request = webob.Request.blank('/v1/bays')
+        if accept_encoding:
+            request.headers['Accept-Encoding'] = accept_encoding
+        return request.get_response(self.app)
+
+    def test_gzip(self):
+        response = self._get('gzip, deflate')
+        self.assertEqual('gzip', response.content_encoding)
+        self.assertIn('Accept-Encoding', response.vary)
+        self.assertLess(response.content_length, len(self.body))
+        body = gzip.GzipFile(fileobj=moves.BytesIO(response.body)).read()
+        self.assertEqual(self.body, body)
+
+    def test_deflate(self):
+        response = self._get('deflate')
+        self.assertEqual('deflate', response.content_encoding)
+        self.assertEqual(self.body, zlib.decompress(response.body))
+
+    def test_not_accepted(self):
+        response = self._get()
+        self.assertIsNone(response.content_encoding)
+        self.assertEqual(self.body, response.body)
+        self.assertIn('Accept-Encoding', response.vary)
+
+        response = self._get('br')
+        self.assertIsNone(response.content_encoding)
+        self.assertIn('Accept-Encoding', response.vary)
+
+    def test_compressed_etag_is_weak(self):
+        self.etag = 'abc'
+        response = self._get('gzip')
+        self.assertEqual('W/"abc"', response.headers['ETag'])
+
+    def test_uncompressed_etag_is_strong(self):
+        self.etag = 'abc'
+        response = self._get()
+        self.assertEqual('"abc"', response.headers['ETag'])
+
+    def test_below_min_size(self):
+        self.body = b'{}'
+        response = self._get('gzip')
+        self.assertIsNone(response.content_encoding)
+        self.assertEqual(b'{}', response.body)
+        self.assertIn('Accept-Encoding', response.vary)
+
+    def test_not_compressible(self):
+        def app(environ, start_response):
+            response = webob.Response(body=self.body,
+                                      content_type='application/octet-stream')
+            return response(environ, start_response)
+
+        self.app = compression.CompressionMiddleware(app, min_size=1024)
+        response = self._get('gzip')
+        self.assertIsNone(response.content_encoding)
+        self.assertIsNone(response.vary)
@@ -69,6 +69,29 @@ class TestContextHook(base.BaseTestCase):
         self.assertEqual('assert_this', ctx.auth_token_info)
 
 
+class TestRPCHook(base.BaseTestCase):
+
+    @mock.patch.object(messaging, 'get_transport')
+    @mock.patch('magnum.common.rpc._SHARED_CLIENTS', {})
+    @mock.patch('magnum.common.rpc.TRANSPORT')
+    def test_rpc_hook_reuses_client(self, mock_transport, mock_get_transport):
+        hook = hooks.RPCHook()
+        state1 = mock.Mock(request=fakes.FakePecanRequest())
+        state2 = mock.Mock(request=fakes.FakePecanRequest())
+        hook.before(state1)
+        hook.before(state2)
+
+        # the clients are built on the transport of magnum.common.rpc
+        self.assertFalse(mock_get_transport.called)
+        self.assertIs(mock_transport, state1.request.rpcapi._client.transport)
+        self.assertIs(state1.request.rpcapi._client,
+                      state2.request.rpcapi._client)
+        self.assertIs(state1.request.context,
+                      state1.request.rpcapi._context)
+        self.assertIs(state2.request.context,
+                      state2.request.rpcapi._context)
+
+
 class TestNoExceptionTracebackHook(api_base.FunctionalTest):
 
     TRACE = [u'Traceback (most recent call last):',
@@ -0,0 +1,46 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+from magnum.api import watch
+from magnum.tests import base
+
+
+class TestBayWatcher(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestBayWatcher, self).setUp()
+        self.watcher = watch.BayWatcher()
+        self.watcher._listener = mock.Mock()
+
+    def test_wait_timeout(self):
+        self.assertFalse(self.watcher.wait('uuid', 0))
+        self.assertEqual({}, self.watcher._waiters)
+
+    def test_notify(self):
+        event = mock.Mock()
+        self.watcher._waiters['uuid'] = set([event])
+        self.watcher.notify('other-uuid')
+        self.assertFalse(event.set.called)
+        self.watcher.notify('uuid')
+        event.set.assert_called_once_with()
+        self.assertEqual({}, self.watcher._waiters)
+
+    def test_endpoint_ignores_other_events(self):
+        endpoint = watch.BayUpdateEndpoint(mock.Mock())
+        endpoint.info({}, 'conductor.host', 'magnum.pod.update',
+                      {'uuid': 'uuid'}, {})
+        self.assertFalse(endpoint.watcher.notify.called)
+        endpoint.info({}, 'conductor.host', 'magnum.bay.update',
+                      {'uuid': 'uuid'}, {})
+        endpoint.watcher.notify.assert_called_once_with('uuid')
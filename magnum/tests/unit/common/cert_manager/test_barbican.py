@@ -127,6 +127,8 @@ class TestBarbicanManager(base.BaseTestCase):
         self.secret4 = mock.Mock(spec=secrets.Secret)
 
         super(TestBarbicanManager, self).setUp()
+        bcm.reset_cache()
+        self.addCleanup(bcm.reset_cache)
 
     @patch('magnum.common.clients.OpenStackClients.barbican')
     def test_store_cert(self, mock_barbican):
@@ -312,3 +314,58 @@ class TestBarbicanManager(base.BaseTestCase):
 
         # Container should be deleted once
         self.container.delete.assert_called_once_with()
+
+    @patch('magnum.common.clients.OpenStackClients.barbican')
+    def test_get_cert_cached(self, mock_barbican):
+        bc = mock.MagicMock()
+        bc.containers.register_consumer.return_value = self.container
+        mock_barbican.return_value = bc
+
+        with patch.object(bcm, '_expires_soon', return_value=False):
+            data1 = bcm.CertManager.get_cert(cert_ref=self.container_ref)
+            data2 = bcm.CertManager.get_cert(cert_ref=self.container_ref)
+            data3 = bcm.CertManager.get_cert(cert_ref=self.container_ref,
+                                             check_only=True)
+
+        self.assertIs(data1, data2)
+        self.assertIs(data1, data3)
+        self.assertEqual(1, bc.containers.register_consumer.call_count)
+        self.assertFalse(bc.containers.get.called)
+
+    @patch('magnum.common.clients.OpenStackClients.barbican')
+    def test_get_cert_cached_registers_new_consumer(self, mock_barbican):
+        bc = mock.MagicMock()
+        bc.containers.get.return_value = self.container
+        bc.containers.register_consumer.return_value = self.container
+        mock_barbican.return_value = bc
+
+        with patch.object(bcm, '_expires_soon', return_value=False):
+            bcm.CertManager.get_cert(cert_ref=self.container_ref,
+                                     check_only=True)
+            bcm.CertManager.get_cert(cert_ref=self.container_ref)
+            bcm.CertManager.get_cert(cert_ref=self.container_ref)
+
+        self.assertEqual(1, bc.containers.get.call_count)
+        self.assertEqual(1, bc.containers.register_consumer.call_count)
+
+    @patch('magnum.common.clients.OpenStackClients.barbican')
+    def test_delete_cert_invalidates_cache(self, mock_barbican):
+        bc = mock.MagicMock()
+        bc.containers.register_consumer.return_value = self.container
+        mock_barbican.return_value = bc
+
+        with patch.object(bcm, '_expires_soon', return_value=False):
+            bcm.CertManager.get_cert(cert_ref=self.container_ref)
+            bcm.CertManager.delete_cert(cert_ref=self.container_ref)
+            bcm.CertManager.get_cert(cert_ref=self.container_ref)
+
+        self.assertEqual(2, bc.containers.register_consumer.call_count)
+
+    @patch.object(bcm, '_expires_soon')
+    def test_get_admin_clients_renewed_when_expiring(self, mock_expires):
+        mock_expires.return_value = False
+        osc = bcm.get_admin_clients()
+        self.assertIs(osc, bcm.get_admin_clients())
+
+        mock_expires.return_value = True
+        self.assertIsNot(osc, bcm.get_admin_clients())
@@ -0,0 +1,63 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+from magnum.common import cache
+from magnum.tests import base
+
+
+class TTLCacheTestCase(base.BaseTestCase):
+
+    def test_get_set(self):
+        c = cache.TTLCache(2, ttl=10)
+        self.assertIsNone(c.get('a'))
+        c.set('a', 1)
+        self.assertEqual(1, c.get('a'))
+        self.assertIn('a', c)
+        self.assertEqual(1, len(c))
+
+    def test_lru_eviction(self):
+        c = cache.TTLCache(2)
+        c.set('a', 1)
+        c.set('b', 2)
+        # 'a' becomes the most recently used entry
+        c.get('a')
+        c.set('c', 3)
+        self.assertEqual(1, c.get('a'))
+        self.assertNotIn('b', c)
+        self.assertEqual(3, c.get('c'))
+
+    @mock.patch('time.time')
+    def test_expiry(self, mock_time):
+        mock_time.return_value = 100
+        c = cache.TTLCache(2, ttl=10)
+        c.set('a', 1)
+        mock_time.return_value = 109
+        self.assertEqual(1, c.get('a'))
+        mock_time.return_value = 110
+        self.assertIsNone(c.get('a'))
+        self.assertEqual(0, len(c))
+
+    def test_pop_and_clear(self):
+        c = cache.TTLCache(2)
+        c.set('a', 1)
+        c.set('b', 2)
+        self.assertEqual(1, c.pop('a'))
+        self.assertIsNone(c.pop('a'))
+        c.clear()
+        self.assertEqual(0, len(c))
+
+    def test_zero_size(self):
+        c = cache.TTLCache(0)
+        c.set('a', 1)
+        self.assertIsNone(c.get('a'))
@@ -23,15 +23,49 @@ from magnum.tests import base
 
 class ClientsTest(base.BaseTestCase):
 
+    def setUp(self):
+        super(ClientsTest, self).setUp()
+        clients.reset_cache()
+        self.addCleanup(clients.reset_cache)
+
     @mock.patch.object(clients.OpenStackClients, 'keystone')
     def test_url_for(self, mock_keystone):
-        obj = clients.OpenStackClients(None)
+        obj = clients.OpenStackClients(mock.MagicMock())
         obj.url_for(service_type='fake_service', endpoint_type='fake_endpoint')
 
         mock_cat = mock_keystone.return_value.client.service_catalog
         mock_cat.url_for.assert_called_once_with(service_type='fake_service',
                                                  endpoint_type='fake_endpoint')
 
+    @mock.patch.object(clients.OpenStackClients, 'keystone')
+    def test_url_for_cached(self, mock_keystone):
+        con = mock.MagicMock()
+        mock_cat = mock_keystone.return_value.client.service_catalog
+        mock_cat.url_for.return_value = 'fake_url'
+
+        for i in range(2):
+            obj = clients.OpenStackClients(con)
+            url = obj.url_for(service_type='fake_service',
+                              endpoint_type='fake_endpoint')
+            self.assertEqual('fake_url', url)
+        self.assertEqual(1, mock_cat.url_for.call_count)
+
+        obj = clients.OpenStackClients(mock.MagicMock())
+        obj.url_for(service_type='fake_service',
+                    endpoint_type='fake_endpoint')
+        self.assertEqual(2, mock_cat.url_for.call_count)
+
+    @mock.patch.object(clients.OpenStackClients, 'keystone')
+    def test_url_for_cache_disabled(self, mock_keystone):
+        cfg.CONF.set_override('enabled', False, group='client_cache')
+        con = mock.MagicMock()
+        mock_cat = mock_keystone.return_value.client.service_catalog
+
+        for i in range(2):
+            obj = clients.OpenStackClients(con)
+            obj.url_for(service_type='fake_service')
+        self.assertEqual(2, mock_cat.url_for.call_count)
+
     @mock.patch.object(clients.OpenStackClients, 'keystone')
     def test_magnum_url(self, mock_keystone):
         fake_region = 'fake_region'
@@ -104,6 +138,24 @@ class ClientsTest(base.BaseTestCase):
         heat_cached = obj.heat()
         self.assertEqual(heat, heat_cached)
 
+    @mock.patch.object(heatclient, 'Client')
+    @mock.patch.object(clients.OpenStackClients, 'url_for')
+    @mock.patch.object(clients.OpenStackClients, 'auth_url')
+    def test_clients_heat_shared(self, mock_auth, mock_url, mock_call):
+        mock_auth.__get__ = mock.Mock(return_value="keystone_url")
+        mock_url.return_value = "url_from_keystone"
+        con = mock.MagicMock()
+        con.auth_token = "3bcc3d3a03f44e3d8377f9247b0ad155"
+        other_con = mock.MagicMock()
+        other_con.auth_token = "8b0f5e1c6f2a4d0b9c3e7a1d2f4b6c8e"
+
+        heat = clients.OpenStackClients(con).heat()
+        self.assertEqual(heat, clients.OpenStackClients(con).heat())
+        self.assertEqual(1, mock_call.call_count)
+
+        clients.OpenStackClients(other_con).heat()
+        self.assertEqual(2, mock_call.call_count)
+
     @mock.patch.object(glanceclient, 'Client')
     @mock.patch.object(clients.OpenStackClients, 'url_for')
     @mock.patch.object(clients.OpenStackClients, 'auth_url')
@@ -48,6 +48,9 @@ class KeystoneClientTest(base.BaseTestCase):
         cfg.CONF.set_override('admin_tenant_name', 'service',
                               group='keystone_authtoken')
 
+        magnum_keystoneclient.reset_cache()
+        self.addCleanup(magnum_keystoneclient.reset_cache)
+
     def test_init_v3_token(self, mock_ks):
         """Test creating the client, token auth."""
         self.ctx.project_id = None
@@ -227,3 +230,50 @@ class KeystoneClientTest(base.BaseTestCase):
         self.assertIsNone(magnum_ks_client._client)
         self.assertIsNotNone(magnum_ks_client._admin_client)
         mock_admin_creds.assert_called_once_with()
+
+    def test_init_v3_token_cached(self, mock_ks):
+        """Test the client of a token is shared while it is valid."""
+        auth_ref = mock_ks.return_value.auth_ref
+        auth_ref.will_expire_soon.return_value = False
+
+        for i in range(2):
+            magnum_ks_client = magnum_keystoneclient.KeystoneClientV3(
+                self.ctx)
+            magnum_ks_client.client
+        self.assertEqual(1, mock_ks.call_count)
+        auth_ref.will_expire_soon.assert_called_once_with(300)
+
+    def test_init_v3_token_cached_expires_soon(self, mock_ks):
+        """Test the client of a token is recreated when it expires soon."""
+        auth_ref = mock_ks.return_value.auth_ref
+        auth_ref.will_expire_soon.return_value = True
+
+        for i in range(2):
+            magnum_ks_client = magnum_keystoneclient.KeystoneClientV3(
+                self.ctx)
+            magnum_ks_client.client
+        self.assertEqual(2, mock_ks.call_count)
+
+    def test_init_v3_token_cache_disabled(self, mock_ks):
+        cfg.CONF.set_override('enabled', False, group='client_cache')
+        mock_ks.return_value.auth_ref.will_expire_soon.return_value = False
+
+        for i in range(2):
+            magnum_ks_client = magnum_keystoneclient.KeystoneClientV3(
+                self.ctx)
+            magnum_ks_client.client
+        self.assertEqual(2, mock_ks.call_count)
+
+    def test_trust_init_cached(self, mock_ks):
+        """Test a cached trust client still updates the context."""
+        auth_ref = mock_ks.return_value.auth_ref
+        auth_ref.will_expire_soon.return_value = False
+        auth_ref.auth_token = 'trust_token'
+        self.ctx.trust_id = 'atrust123'
+        magnum_keystoneclient.KeystoneClientV3(self.ctx)
+
+        ctx = utils.dummy_context()
+        ctx.trust_id = 'atrust123'
+        magnum_keystoneclient.KeystoneClientV3(ctx)
+        self.assertEqual(1, mock_ks.call_count)
+        self.assertEqual('trust_token', ctx.auth_token)
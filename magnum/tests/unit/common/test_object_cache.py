@@ -0,0 +1,60 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+from magnum.common import context as magnum_context
+from magnum.common import object_cache
+from magnum import objects
+from magnum.tests import base
+
+
+class ObjectCacheTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ObjectCacheTestCase, self).setUp()
+        self.ctx = magnum_context.make_context()
+        self.loader = mock.Mock()
+        self.loader.return_value = mock.Mock(uuid='fake-uuid')
+
+    def test_get_object_without_cache(self):
+        object_cache.get_object(self.ctx, objects.Bay, 'fake-uuid',
+                                self.loader)
+        object_cache.get_object(self.ctx, objects.Bay, 'fake-uuid',
+                                self.loader)
+        self.assertEqual(2, self.loader.call_count)
+
+    def test_get_object_loads_once(self):
+        object_cache.install(self.ctx)
+        bay1 = object_cache.get_object(self.ctx, objects.Bay, 'fake-uuid',
+                                       self.loader)
+        bay2 = object_cache.get_object(self.ctx, objects.Bay, 'fake-uuid',
+                                       self.loader)
+        self.loader.assert_called_once_with(self.ctx, 'fake-uuid')
+        self.assertIs(bay1, bay2)
+
+    def test_get_object_by_name_then_uuid(self):
+        object_cache.install(self.ctx)
+        bay1 = object_cache.get_object(self.ctx, objects.Bay, 'fake-name',
+                                       self.loader)
+        bay2 = object_cache.get_object(self.ctx, objects.Bay, 'fake-uuid',
+                                       self.loader)
+        self.loader.assert_called_once_with(self.ctx, 'fake-name')
+        self.assertIs(bay1, bay2)
+
+    def test_get_object_scoped_by_class(self):
+        object_cache.install(self.ctx)
+        object_cache.get_object(self.ctx, objects.Bay, 'fake-uuid',
+                                self.loader)
+        object_cache.get_object(self.ctx, objects.BayModel, 'fake-uuid',
+                                self.loader)
+        self.assertEqual(2, self.loader.call_count)
@@ -0,0 +1,105 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from oslo_policy import policy as oslo_policy
+
+from magnum.common import context as magnum_context
+from magnum.common import policy
+from magnum.tests import base
+
+
+class PolicyTestCase(base.TestCase):
+
+    def setUp(self):
+        super(PolicyTestCase, self).setUp()
+        self.ctx = magnum_context.make_context(roles=['member'])
+        self.enforcer = policy.init()
+
+    def test_credential_attrs_match_context(self):
+        expected = set(self.ctx.to_dict())
+        expected -= set(policy.NON_CREDENTIAL_ATTRS)
+        # roles are always part of the credentials
+        expected.discard('roles')
+        self.assertEqual(expected, set(policy.CREDENTIAL_ATTRS))
+
+    def test_credentials(self):
+        ctx = magnum_context.make_context(domain_name='domain',
+                                          all_tenants=True,
+                                          auth_token='token',
+                                          roles=['member', 'admin'])
+        credentials = policy._get_credentials(ctx)
+        self.assertEqual('domain', credentials['domain_name'])
+        self.assertTrue(credentials['all_tenants'])
+        self.assertEqual(('admin', 'member'), credentials['roles'])
+        self.assertNotIn('auth_token', credentials)
+
+    def test_enforce_caches_decision(self):
+        with mock.patch.object(self.enforcer, 'enforce',
+                               wraps=self.enforcer.enforce) as mock_enforce:
+            self.assertTrue(policy.enforce(self.ctx, 'bay:get'))
+            self.assertTrue(policy.enforce(self.ctx, 'bay:get'))
+        self.assertEqual(1, mock_enforce.call_count)
+
+    def test_enforce_cache_keyed_by_credentials(self):
+        other_ctx = magnum_context.make_context(project_id='other_project')
+        with mock.patch.object(self.enforcer, 'enforce',
+                               wraps=self.enforcer.enforce) as mock_enforce:
+            policy.enforce(self.ctx, 'bay:get')
+            policy.enforce(other_ctx, 'bay:get')
+            policy.enforce(self.ctx, 'bay:delete')
+        self.assertEqual(3, mock_enforce.call_count)
+
+    def test_enforce_does_not_cache_denial(self):
+        self.policy.set_rules({'bay:get': 'role:admin'})
+        with mock.patch.object(self.enforcer, 'enforce',
+                               wraps=self.enforcer.enforce) as mock_enforce:
+            for i in range(2):
+                self.assertRaises(oslo_policy.PolicyNotAuthorized,
+                                  policy.enforce, self.ctx, 'bay:get')
+        self.assertEqual(2, mock_enforce.call_count)
+
+    def test_enforce_cache_flushed_on_new_rules(self):
+        self.assertTrue(policy.enforce(self.ctx, 'bay:get'))
+        self.policy.set_rules({'bay:get': 'role:admin'})
+        self.assertRaises(oslo_policy.PolicyNotAuthorized,
+                          policy.enforce, self.ctx, 'bay:get')
+
+    def test_enforce_cache_flushed_on_merged_rules(self):
+        self.assertTrue(policy.enforce(self.ctx, 'bay:get'))
+        rules = self.enforcer.rules
+        # the policy.d files are merged into the current rules
+        self.enforcer.set_rules(
+            {'bay:get': oslo_policy.RuleCheck('rule', 'admin_api')},
+            overwrite=False)
+        self.assertIs(rules, self.enforcer.rules)
+        self.assertRaises(oslo_policy.PolicyNotAuthorized,
+                          policy.enforce, self.ctx, 'bay:get')
+
+    def test_enforce_cache_disabled(self):
+        self.config(policy_cache_size=0)
+        policy.reset_cache()
+        with mock.patch.object(self.enforcer, 'enforce',
+                               wraps=self.enforcer.enforce) as mock_enforce:
+            policy.enforce(self.ctx, 'bay:get')
+            policy.enforce(self.ctx, 'bay:get')
+        self.assertEqual(2, mock_enforce.call_count)
+
+    def test_enforce_with_target_not_cached(self):
+        target = {'project_id': self.ctx.project_id}
+        with mock.patch.object(self.enforcer, 'enforce',
+                               wraps=self.enforcer.enforce) as mock_enforce:
+            policy.enforce(self.ctx, 'bay:get', target)
+            policy.enforce(self.ctx, 'bay:get', target)
+        self.assertEqual(2, mock_enforce.call_count)
+        credentials = mock_enforce.call_args[0][2]
+        self.assertEqual(self.ctx.to_dict(), credentials)
@@ -0,0 +1,70 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from oslo_config import cfg
+
+from magnum.common import pool
+from magnum.tests import base
+
+test_pool_opts = [
+    cfg.IntOpt('test_pool_size', default=2),
+    cfg.IntOpt('test_pool_ttl', default=60),
+]
+cfg.CONF.register_opts(test_pool_opts, group='test_pool')
+
+
+class BackgroundPoolTestCase(base.TestCase):
+
+    def setUp(self):
+        super(BackgroundPoolTestCase, self).setUp()
+        self.generate = mock.Mock(side_effect=['item1', 'item2', 'item3',
+                                               'item4'])
+        self.pool = pool.BackgroundPool(self.generate, 'test_pool_size',
+                                        group='test_pool')
+
+    @mock.patch('eventlet.spawn_n')
+    def test_get_generates_when_empty(self, mock_spawn_n):
+        self.assertEqual('item1', self.pool.get())
+        mock_spawn_n.assert_called_once_with(self.pool._refill)
+
+    @mock.patch('eventlet.spawn_n')
+    def test_get_from_pool(self, mock_spawn_n):
+        self.pool._refill()
+        self.assertEqual(2, len(self.pool))
+
+        self.assertEqual('item1', self.pool.get())
+        self.assertEqual(2, self.generate.call_count)
+        mock_spawn_n.assert_called_once_with(self.pool._refill)
+
+    @mock.patch('eventlet.spawn_n')
+    def test_get_skips_expired(self, mock_spawn_n):
+        self.pool = pool.BackgroundPool(self.generate, 'test_pool_size',
+                                        group='test_pool',
+                                        ttl_opt='test_pool_ttl')
+        self.pool._refill()
+        cfg.CONF.set_override('test_pool_ttl', -1, group='test_pool')
+
+        self.assertEqual('item3', self.pool.get())
+
+    @mock.patch('eventlet.spawn_n')
+    def test_refill_disabled(self, mock_spawn_n):
+        cfg.CONF.set_override('test_pool_size', 0, group='test_pool')
+        self.assertEqual('item1', self.pool.get())
+        self.assertFalse(mock_spawn_n.called)
+
+    def test_refill_failure(self):
+        self.generate.side_effect = ValueError()
+        self.pool._refilling = True
+        self.pool._refill()
+        self.assertEqual(0, len(self.pool))
+        self.assertFalse(self.pool._refilling)
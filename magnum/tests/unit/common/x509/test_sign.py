@@ -12,6 +12,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import mock
+from oslo_config import cfg
 import six
 
 from cryptography.hazmat.backends import default_backend
@@ -33,6 +35,9 @@ class TestX509(base.BaseTestCase):
         self.subject_name = six.u("fake-subject")
         self.ca_encryption_password = six.b("fake-ca-password")
         self.encryption_password = six.b("fake-password")
+        cfg.CONF.set_override('key_pool_size', 0, group='x509')
+        operations.reset_key_pool()
+        self.addCleanup(operations.reset_key_pool)
 
     def _load_pems(self, keypairs, encryption_password):
         private_key = serialization.load_pem_private_key(
@@ -173,3 +178,63 @@ class TestX509(base.BaseTestCase):
             self.issuer_name, self.subject_name)
 
         self.assertInClientExtensions(cert)
+
+    def test_load_private_key(self):
+        ca = operations.generate_ca_certificate(
+            self.issuer_name, encryption_password=self.ca_encryption_password)
+
+        private_key = operations.load_private_key(
+            ca['private_key'], self.ca_encryption_password)
+
+        self.assertIsInstance(private_key, rsa.RSAPrivateKey)
+
+    @mock.patch('eventlet.tpool.execute')
+    def test_sign_in_native_thread(self, mock_execute):
+        operations.sign('csr', self.issuer_name, 'ca_key')
+
+        mock_execute.assert_called_once_with(
+            operations._sign, 'csr', self.issuer_name, 'ca_key',
+            ca_key_password=None, skip_validation=False)
+
+    @mock.patch('eventlet.tpool.execute')
+    @mock.patch.object(operations, '_sign')
+    def test_sign_in_green_thread(self, mock_sign, mock_execute):
+        cfg.CONF.set_override('max_concurrent_operations', 0, group='x509')
+
+        operations.sign('csr', self.issuer_name, 'ca_key')
+
+        self.assertFalse(mock_execute.called)
+        mock_sign.assert_called_once_with(
+            'csr', self.issuer_name, 'ca_key', ca_key_password=None,
+            skip_validation=False)
+
+    @mock.patch('eventlet.spawn_n')
+    @mock.patch.object(operations, '_generate_private_key')
+    def test_key_pool_generates_when_empty(self, mock_generate,
+                                           mock_spawn_n):
+        cfg.CONF.set_override('key_pool_size', 2, group='x509')
+        cfg.CONF.set_override('max_concurrent_operations', 0, group='x509')
+        pool = operations.KeyPool(1024)
+
+        self.assertEqual(mock_generate.return_value, pool.get())
+        mock_generate.assert_called_once_with(1024)
+        mock_spawn_n.assert_called_once_with(pool._refill)
+
+    @mock.patch('eventlet.spawn_n')
+    @mock.patch.object(operations, '_generate_private_key')
+    def test_key_pool_get_from_pool(self, mock_generate, mock_spawn_n):
+        cfg.CONF.set_override('key_pool_size', 2, group='x509')
+        cfg.CONF.set_override('max_concurrent_operations', 0, group='x509')
+        mock_generate.side_effect = ['key1', 'key2', 'key3']
+        pool = operations.KeyPool(1024)
+        pool._refill()
+
+        self.assertEqual(2, len(pool))
+        self.assertEqual('key1', pool.get())
+        self.assertEqual(2, mock_generate.call_count)
+        mock_spawn_n.assert_called_once_with(pool._refill)
+
+    @mock.patch('eventlet.spawn_n')
+    def test_key_pool_disabled(self, mock_spawn_n):
+        operations.get_private_key()
+        self.assertFalse(mock_spawn_n.called)
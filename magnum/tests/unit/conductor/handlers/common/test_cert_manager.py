@@ -13,6 +13,7 @@
 # under the License.
 
 import mock
+from oslo_config import cfg
 
 from magnum.conductor.handlers.common import cert_manager
 from magnum.tests import base
@@ -32,6 +33,9 @@ class CertManagerTestCase(base.BaseTestCase):
         self.cert_manager_backend.CertManager = mock.MagicMock()
         self.CertManager = self.cert_manager_backend.CertManager
 
+        cert_manager.reset_cache()
+        self.addCleanup(cert_manager.reset_cache)
+
     @mock.patch('magnum.common.x509.operations.generate_ca_certificate')
     @mock.patch('magnum.common.short_id.generate_id')
     def test_generate_ca_cert(self, mock_generate_id, mock_generate_ca_cert):
@@ -124,14 +128,16 @@ class CertManagerTestCase(base.BaseTestCase):
         mock_generate_client_cert.assert_called_once_with(
             expected_ca_name, expected_ca_cert, expected_ca_password)
 
+    @mock.patch('magnum.common.x509.operations.load_private_key')
     @mock.patch('magnum.common.x509.operations.sign')
-    def test_sign_node_certificate(self, mock_x509_sign):
+    def test_sign_node_certificate(self, mock_x509_sign, mock_load_key):
         mock_bay = mock.MagicMock()
         mock_ca_cert = mock.MagicMock()
         mock_ca_cert.get_private_key.return_value = mock.sentinel.priv_key
         passphrase = mock.sentinel.passphrase
         mock_ca_cert.get_private_key_passphrase.return_value = passphrase
         self.CertManager.get_cert.return_value = mock_ca_cert
+        mock_load_key.return_value = mock.sentinel.ca_key
         mock_csr = mock.MagicMock()
         mock_x509_sign.return_value = mock.sentinel.signed_cert
 
@@ -139,11 +145,73 @@ class CertManagerTestCase(base.BaseTestCase):
 
         self.CertManager.get_cert.assert_called_once_with(
             mock_bay.ca_cert_ref)
+        mock_load_key.assert_called_once_with(mock.sentinel.priv_key,
+                                              passphrase)
         mock_x509_sign.assert_called_once_with(mock_csr, mock_bay.name,
-                                               mock.sentinel.priv_key,
-                                               passphrase)
+                                               mock.sentinel.ca_key)
         self.assertEqual(bay_ca_cert, mock.sentinel.signed_cert)
 
+    @mock.patch('magnum.common.x509.operations.load_private_key')
+    @mock.patch('magnum.common.x509.operations.sign')
+    def test_sign_node_certificate_ca_key_cached(self, mock_x509_sign,
+                                                 mock_load_key):
+        mock_bay = mock.MagicMock()
+
+        cert_manager.sign_node_certificate(mock_bay, mock.sentinel.csr1)
+        cert_manager.sign_node_certificate(mock_bay, mock.sentinel.csr2)
+
+        self.CertManager.get_cert.assert_called_once_with(
+            mock_bay.ca_cert_ref)
+        self.assertEqual(1, mock_load_key.call_count)
+        mock_x509_sign.assert_called_with(mock.sentinel.csr2, mock_bay.name,
+                                          mock_load_key.return_value)
+
+    @mock.patch('magnum.common.x509.operations.load_private_key')
+    @mock.patch('magnum.common.x509.operations.sign')
+    def test_sign_node_certificate_ca_key_invalidated(self, mock_x509_sign,
+                                                      mock_load_key):
+        mock_bay = mock.MagicMock()
+
+        cert_manager.sign_node_certificate(mock_bay, mock.sentinel.csr)
+        cert_manager.invalidate_bay_ca(mock_bay)
+        cert_manager.sign_node_certificate(mock_bay, mock.sentinel.csr)
+
+        self.assertEqual(2, self.CertManager.get_cert.call_count)
+        self.assertEqual(2, mock_load_key.call_count)
+
+    @mock.patch('magnum.common.x509.operations.load_private_key')
+    @mock.patch('magnum.common.x509.operations.sign')
+    def test_sign_node_certificate_ca_key_cache_disabled(self,
+                                                         mock_x509_sign,
+                                                         mock_load_key):
+        cfg.CONF.set_override('ca_key_cache_size', 0, group='x509')
+        self.addCleanup(cfg.CONF.clear_override, 'ca_key_cache_size',
+                        group='x509')
+        mock_bay = mock.MagicMock()
+
+        cert_manager.sign_node_certificate(mock_bay, mock.sentinel.csr)
+        cert_manager.sign_node_certificate(mock_bay, mock.sentinel.csr)
+
+        self.assertEqual(2, mock_load_key.call_count)
+
+    @mock.patch('magnum.common.x509.operations.load_private_key')
+    @mock.patch('magnum.common.x509.operations.sign')
+    def test_sign_node_certificates(self, mock_x509_sign, mock_load_key):
+        mock_bay = mock.MagicMock()
+        error = ValueError('invalid csr')
+        mock_x509_sign.side_effect = ['pem1', error, 'pem3']
+
+        results = cert_manager.sign_node_certificates(
+            mock_bay, ['csr1', 'csr2', 'csr3'])
+
+        self.assertEqual([('pem1', None), (None, error), ('pem3', None)],
+                         results)
+        self.CertManager.get_cert.assert_called_once_with(
+            mock_bay.ca_cert_ref)
+        self.assertEqual(1, mock_load_key.call_count)
+        mock_x509_sign.assert_any_call('csr2', mock_bay.name,
+                                       mock_load_key.return_value)
+
     def test_get_bay_ca_certificate(self):
         mock_bay = mock.MagicMock()
         mock_ca_cert = mock.MagicMock()
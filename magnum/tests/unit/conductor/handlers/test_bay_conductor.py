@@ -349,7 +349,7 @@ class TestBayConductorWithK8s(base.TestCase):
             'no_proxy': 'no_proxy'
         }
         self.assertEqual(expected, definition)
-        reqget.assert_called_once_with('http://etcd/test?size=1')
+        reqget.assert_called_once_with('http://etcd/test?size=1', timeout=10)
 
     @patch('magnum.common.short_id.generate_id')
     @patch('heatclient.common.template_utils.get_template_contents')
@@ -476,34 +476,35 @@ class TestBayConductorWithK8s(base.TestCase):
 
     @patch('heatclient.common.template_utils.get_template_contents')
     @patch('magnum.conductor.handlers.bay_conductor'
-           '._extract_template_definition')
+           '._get_template_definition')
     def test_update_stack(self,
-                          mock_extract_template_definition,
+                          mock_get_template_definition,
                           mock_get_template_contents):
 
         mock_stack_id = 'xx-xx-xx-xx'
-        expected_template_contents = 'template_contents'
-        exptected_files = []
-
-        mock_tpl_files = mock.MagicMock()
-        mock_tpl_files.items.return_value = exptected_files
-        mock_get_template_contents.return_value = [
-            mock_tpl_files, expected_template_contents]
-        mock_extract_template_definition.return_value = ('template/path',
-                                                         {})
+        mock_baymodel = mock.MagicMock()
+        mock_definition = mock.MagicMock()
+        mock_definition.get_scale_params.return_value = {
+            'number_of_minions': '2'}
+        mock_get_template_definition.return_value = (mock_baymodel,
+                                                     mock_definition)
         mock_heat_client = mock.MagicMock()
         mock_osc = mock.MagicMock()
         mock_osc.heat.return_value = mock_heat_client
         mock_bay = mock.MagicMock()
         mock_bay.stack_id = mock_stack_id
+        mock_scale_manager = mock.MagicMock()
 
-        bay_conductor._update_stack({}, mock_osc, mock_bay)
+        bay_conductor._update_stack({}, mock_osc, mock_bay,
+                                    mock_scale_manager)
 
         expected_args = {
-            'parameters': {},
-            'template': expected_template_contents,
-            'files': dict(exptected_files)
+            'parameters': {'number_of_minions': '2'},
+            'existing': True
         }
+        mock_definition.get_scale_params.assert_called_once_with(
+            {}, mock_baymodel, mock_bay, scale_manager=mock_scale_manager)
+        self.assertFalse(mock_get_template_contents.called)
         mock_heat_client.stacks.update.assert_called_once_with(mock_stack_id,
                                                                **expected_args)
 
@@ -780,6 +781,42 @@ class TestHandler(db_base.DbTestCase):
                           self.bay, timeout)
         mock_generate_certificates.assert_called_once_with(self.bay)
 
+    @patch('magnum.conductor.handlers.bay_conductor.Handler._create_bay')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_create_bulk(self, mock_openstack_client_class,
+                         mock_create_bay):
+        bay = mock.MagicMock()
+        mock_create_bay.return_value = bay
+
+        results = self.handler.bay_create_bulk(self.context, [bay], 15)
+
+        self.assertEqual([bay], results)
+        osc = mock_openstack_client_class.return_value
+        mock_create_bay.assert_called_once_with(self.context, osc, bay, 15)
+
+    @patch('magnum.conductor.handlers.bay_conductor.Handler._create_bay')
+    @patch('magnum.common.clients.OpenStackClients')
+    def test_create_bulk_failed(self, mock_openstack_client_class,
+                                mock_create_bay):
+        mock_create_bay.side_effect = exception.InvalidParameterValue(
+            err='invalid')
+        bay = mock.MagicMock()
+
+        results = self.handler.bay_create_bulk(self.context, [bay], 15)
+
+        self.assertEqual([bay], results)
+        self.assertEqual(bay_status.CREATE_FAILED, bay.status)
+        self.assertEqual('invalid', bay.status_reason)
+
+    @patch('magnum.conductor.handlers.bay_conductor.Handler._create_bay')
+    def test_create_bulk_several_bays(self, mock_create_bay):
+        bays = [mock.MagicMock(), mock.MagicMock()]
+
+        self.assertRaises(exception.InvalidParameterValue,
+                          self.handler.bay_create_bulk, self.context, bays,
+                          15)
+        self.assertFalse(mock_create_bay.called)
+
     @patch('magnum.common.clients.OpenStackClients')
     def test_bay_delete(self, mock_openstack_client_class):
         osc = mock.MagicMock()
@@ -40,6 +40,25 @@ class TestSignConductor(base.TestCase):
         )
         self.assertEqual(actual_cert.pem, 'fake-pem')
 
+    @patch.object(ca_conductor, 'cert_manager')
+    def test_sign_certificates(self, mock_cert_manager):
+        mock_bay = mock.MagicMock()
+        certificates = [mock.MagicMock(csr='csr1'),
+                        mock.MagicMock(csr='csr2')]
+        mock_cert_manager.sign_node_certificates.return_value = [
+            ('pem1', None), (None, ValueError('invalid csr'))]
+
+        actual_certs = self.ca_handler.sign_certificates(self.context,
+                                                         mock_bay,
+                                                         certificates)
+
+        mock_cert_manager.sign_node_certificates.assert_called_once_with(
+            mock_bay, ['csr1', 'csr2'])
+        self.assertEqual('pem1', actual_certs[0].pem)
+        self.assertIsNone(actual_certs[0].error)
+        self.assertIsNone(actual_certs[1].pem)
+        self.assertEqual('invalid csr', actual_certs[1].error)
+
     @patch.object(ca_conductor, 'cert_manager')
     def test_get_ca_certificate(self, mock_cert_manager):
         mock_bay = mock.MagicMock()
@@ -0,0 +1,106 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+from oslo_config import cfg
+
+from magnum.common import exception
+from magnum.conductor import discovery
+from magnum.tests import base
+
+
+class DiscoveryURLPoolTestCase(base.TestCase):
+
+    def setUp(self):
+        super(DiscoveryURLPoolTestCase, self).setUp()
+        cfg.CONF.set_override('discovery_pool_size', 2, group='bay')
+        self.fetch = mock.Mock(side_effect=['url1', 'url2', 'url3', 'url4'])
+        self.pool = discovery.DiscoveryURLPool(self.fetch)
+
+    @mock.patch('eventlet.spawn_n')
+    def test_get_fetches_when_empty(self, mock_spawn_n):
+        self.assertEqual('url1', self.pool.get())
+        mock_spawn_n.assert_called_once_with(self.pool._refill)
+
+    @mock.patch('eventlet.spawn_n')
+    def test_get_from_pool(self, mock_spawn_n):
+        self.pool._refill()
+        self.assertEqual(2, len(self.pool))
+
+        self.assertEqual('url1', self.pool.get())
+        self.assertEqual(2, self.fetch.call_count)
+        mock_spawn_n.assert_called_once_with(self.pool._refill)
+
+    @mock.patch('eventlet.spawn_n')
+    def test_get_skips_expired(self, mock_spawn_n):
+        self.pool._refill()
+        cfg.CONF.set_override('discovery_url_ttl', -1, group='bay')
+
+        self.assertEqual('url3', self.pool.get())
+
+    @mock.patch('eventlet.spawn_n')
+    def test_refill_disabled(self, mock_spawn_n):
+        cfg.CONF.set_override('discovery_pool_size', 0, group='bay')
+        self.assertEqual('url1', self.pool.get())
+        self.assertFalse(mock_spawn_n.called)
+
+    def test_refill_failure(self):
+        self.fetch.side_effect = exception.InvalidDiscoveryURL(
+            discovery_url='', discovery_endpoint='fake')
+        self.pool._refilling = True
+        self.pool._refill()
+        self.assertEqual(0, len(self.pool))
+        self.assertFalse(self.pool._refilling)
+
+
+class EtcdDiscoveryBackendTestCase(base.TestCase):
+
+    @mock.patch('requests.get')
+    def test_public_new_discovery_url(self, mock_get):
+        cfg.CONF.set_override('etcd_discovery_service_endpoint_format',
+                              'http://etcd/test?size=%(size)d',
+                              group='bay')
+        mock_get.return_value = mock.MagicMock(text='http://etcd/token')
+
+        backend = discovery.PublicEtcdDiscoveryBackend()
+        self.assertEqual('http://etcd/token', backend.new_discovery_url(3))
+        mock_get.assert_called_once_with('http://etcd/test?size=3',
+                                         timeout=10)
+
+    @mock.patch('uuid.uuid4')
+    @mock.patch('requests.put')
+    def test_self_hosted_new_discovery_url(self, mock_put, mock_uuid):
+        cfg.CONF.set_override('etcd_discovery_url', 'http://etcd:2379/',
+                              group='bay')
+        mock_uuid.return_value = mock.MagicMock(hex='token')
+
+        backend = discovery.SelfHostedEtcdDiscoveryBackend()
+        url = backend.new_discovery_url(3)
+
+        self.assertEqual('http://etcd:2379/v2/keys/discovery/token', url)
+        mock_put.assert_called_once_with(url + '/_config/size',
+                                         data={'value': 3}, timeout=10)
+
+    @mock.patch('requests.put')
+    def test_self_hosted_new_discovery_url_failure(self, mock_put):
+        cfg.CONF.set_override('etcd_discovery_url', 'http://etcd:2379',
+                              group='bay')
+        mock_put.return_value = mock.MagicMock(ok=False)
+
+        backend = discovery.SelfHostedEtcdDiscoveryBackend()
+        self.assertRaises(exception.InvalidDiscoveryURL,
+                          backend.new_discovery_url, 3)
+
+    def test_self_hosted_new_discovery_url_no_endpoint(self):
+        backend = discovery.SelfHostedEtcdDiscoveryBackend()
+        self.assertRaises(exception.ConfigInvalid,
+                          backend.new_discovery_url, 3)
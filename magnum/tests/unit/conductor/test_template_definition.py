@@ -85,6 +85,27 @@ class TemplateDefinitionTestCase(base.TestCase):
         self.assertIsInstance(definition,
                               tdef.UbuntuMesosTemplateDefinition)
 
+    def test_get_definition_shared(self):
+        definition = tdef.TemplateDefinition.get_template_definition(
+            'vm', 'fedora-atomic', 'kubernetes')
+        self.assertIs(definition,
+                      tdef.TemplateDefinition.get_template_definition(
+                          'vm', 'fedora-atomic', 'kubernetes'))
+
+        cfg.CONF.set_override('enabled_definitions',
+                              ['magnum_vm_atomic_k8s'],
+                              group='bay')
+        self.assertIsNot(definition,
+                         tdef.TemplateDefinition.get_template_definition(
+                             'vm', 'fedora-atomic', 'kubernetes'))
+
+    def test_get_output(self):
+        definition = tdef.AtomicK8sTemplateDefinition()
+
+        output = definition.get_output('api_address')
+        self.assertEqual('api_address', output.bay_attr)
+        self.assertIsNone(definition.get_output('not_an_output'))
+
     def test_get_definition_not_supported(self):
         self.assertRaises(exception.BayTypeNotSupported,
                           tdef.TemplateDefinition.get_template_definition,
@@ -136,6 +157,20 @@ class TemplateDefinitionTestCase(base.TestCase):
         value = output.get_output_value(mock_stack)
         self.assertIsNone(value)
 
+    def test_get_stack_outputs(self):
+        mock_stack = mock.MagicMock()
+        mock_stack.outputs = [
+            {"output_value": "value1", "output_key": "key1"},
+            {"output_value": "value2", "output_key": "key2"},
+            {"output_value": "duplicate", "output_key": "key1"},
+        ]
+
+        outputs = tdef.get_stack_outputs(mock_stack)
+        self.assertEqual({'key1': 'value1', 'key2': 'value2'}, outputs)
+
+        output = tdef.OutputMapping('key2')
+        self.assertEqual('value2', output.get_output_value(None, outputs))
+
     def test_update_outputs(self):
         definition = tdef.TemplateDefinition.get_template_definition(
             'vm',
@@ -211,10 +246,29 @@ class AtomicK8sTemplateDefinitionTestCase(base.TestCase):
         k8s_def = tdef.AtomicK8sTemplateDefinition()
         discovery_url = k8s_def.get_discovery_url(mock_bay)
 
-        mock_get.assert_called_once_with('http://etcd/test?size=10')
+        mock_get.assert_called_once_with('http://etcd/test?size=10',
+                                         timeout=10)
         self.assertEqual(mock_bay.discovery_url, expected_discovery_url)
         self.assertEqual(discovery_url, expected_discovery_url)
 
+    @mock.patch('magnum.conductor.template_definition'
+                '.AtomicK8sTemplateDefinition.get_discovery_url')
+    def test_k8s_get_scale_params(self, mock_get_discovery_url):
+        k8s_def = tdef.AtomicK8sTemplateDefinition()
+        mock_baymodel = mock.MagicMock()
+        mock_bay = mock.MagicMock(node_count=3)
+        mock_scale_manager = mock.MagicMock()
+        mock_scale_manager.get_removal_nodes.return_value = ['node1']
+
+        params = k8s_def.get_scale_params(None, mock_baymodel, mock_bay,
+                                          scale_manager=mock_scale_manager)
+
+        self.assertEqual({'number_of_minions': '3',
+                          'minions_to_remove': ['node1']}, params)
+        mock_scale_manager.get_removal_nodes.assert_called_once_with(
+            k8s_def.get_output('kube_minions'))
+        self.assertFalse(mock_get_discovery_url.called)
+
     def test_k8s_get_heat_param(self):
         k8s_def = tdef.AtomicK8sTemplateDefinition()
 
@@ -295,6 +349,14 @@ class AtomicSwarmTemplateDefinitionTestCase(base.TestCase):
 
         self.assertEqual(mock_bay.discovery_url, actual_url)
 
+    def test_swarm_get_scale_params(self):
+        swarm_def = tdef.AtomicSwarmTemplateDefinition()
+        mock_bay = mock.MagicMock(node_count=2)
+
+        params = swarm_def.get_scale_params(None, mock.MagicMock(), mock_bay)
+
+        self.assertEqual({'number_of_nodes': '2'}, params)
+
     def test_swarm_get_heat_param(self):
         k8s_def = tdef.AtomicSwarmTemplateDefinition()
 
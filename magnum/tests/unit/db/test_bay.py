@@ -15,11 +15,18 @@
 
 """Tests for manipulating Bays via the DB API"""
 
+import datetime
+
+import mock
+from oslo_utils import timeutils
 import six
+import sqlalchemy
 
 from magnum.common import context
 from magnum.common import exception
 from magnum.common import utils as magnum_utils
+from magnum.db.sqlalchemy import api as sqla_api
+from magnum.db.sqlalchemy import models
 from magnum.objects.fields import BayStatus as bay_status
 from magnum.tests.unit.db import base
 from magnum.tests.unit.db import utils
@@ -74,6 +81,16 @@ class DbBayTestCase(base.DbTestCase):
         res_uuids = [r.uuid for r in res]
         self.assertEqual(sorted(uuids), sorted(res_uuids))
 
+    def test_get_bay_list_with_columns(self):
+        bay = utils.create_test_bay()
+        res = self.dbapi.get_bay_list(self.context,
+                                      columns=['uuid', 'status'])
+        self.assertEqual([bay.uuid], [r.uuid for r in res])
+        unloaded = sqlalchemy.inspect(res[0]).unloaded
+        self.assertNotIn('status', unloaded)
+        self.assertIn('status_reason', unloaded)
+        self.assertIn('node_addresses', unloaded)
+
     def test_get_bay_list_sorted(self):
         uuids = []
         for _ in range(5):
@@ -88,6 +105,20 @@ class DbBayTestCase(base.DbTestCase):
                           self.context,
                           sort_key='foo')
 
+    @mock.patch.object(sqla_api, 'get_session', wraps=sqla_api.get_session)
+    def test_get_bay_list_uses_slave(self, mock_get_session):
+        self.config(use_slave_for_lists=True, group='database')
+        bay = utils.create_test_bay()
+        res = self.dbapi.get_bay_list(self.context)
+        self.assertEqual([bay.id], [r.id for r in res])
+        mock_get_session.assert_called_with(use_slave=True)
+
+    @mock.patch.object(sqla_api, 'get_session', wraps=sqla_api.get_session)
+    def test_get_bay_by_uuid_uses_master_by_default(self, mock_get_session):
+        bay = utils.create_test_bay()
+        self.dbapi.get_bay_by_uuid(self.context, bay.uuid)
+        mock_get_session.assert_called_with(use_slave=False)
+
     def test_get_bay_list_with_filters(self):
         bm1 = utils.get_test_baymodel(id=1, uuid=magnum_utils.generate_uuid())
         bm2 = utils.get_test_baymodel(id=2, uuid=magnum_utils.generate_uuid())
@@ -227,6 +258,38 @@ class DbBayTestCase(base.DbTestCase):
                           self.dbapi.get_service_by_id,
                           self.context, service.id)
 
+    def test_destroy_bay_is_soft_delete(self):
+        bay = utils.create_test_bay()
+        pod = utils.create_test_pod(bay_uuid=bay.uuid)
+        self.dbapi.destroy_bay(bay.id)
+
+        query = sqla_api.model_query(models.Bay, read_deleted=True)
+        bay_ref = query.filter_by(id=bay.id).one()
+        self.assertNotEqual(0, bay_ref.deleted)
+        self.assertIsNotNone(bay_ref.deleted_at)
+
+        query = sqla_api.model_query(models.Pod, read_deleted=True)
+        pod_ref = query.filter_by(id=pod.id).one()
+        self.assertNotEqual(0, pod_ref.deleted)
+
+    def test_purge_deleted_rows(self):
+        bay = utils.create_test_bay()
+        utils.create_test_pod(bay_uuid=bay.uuid)
+        live_bay = utils.create_test_bay(id=2,
+                                         uuid=magnum_utils.generate_uuid())
+        self.dbapi.destroy_bay(bay.id)
+
+        before = timeutils.utcnow() - datetime.timedelta(days=1)
+        self.assertEqual(0, self.dbapi.purge_deleted_rows(before, 1))
+
+        before = timeutils.utcnow() + datetime.timedelta(days=1)
+        self.assertEqual(2, self.dbapi.purge_deleted_rows(before, 1))
+
+        query = sqla_api.model_query(models.Bay, read_deleted=True)
+        self.assertEqual([live_bay.id], [b.id for b in query.all()])
+        query = sqla_api.model_query(models.Pod, read_deleted=True)
+        self.assertEqual([], query.all())
+
     def test_destroy_bay_that_has_rc(self):
         bay = utils.create_test_bay()
         rc = utils.create_test_rc(bay_uuid=bay.uuid)
@@ -140,6 +140,32 @@ class DbPodTestCase(base.DbTestCase):
                                       filters={'status': 'status2'})
         self.assertEqual([pod2.id], [r.id for r in res])
 
+    def test_get_pod_list_with_labels_filter(self):
+        pod1 = utils.create_test_pod(
+            uuid=magnum_utils.generate_uuid(),
+            labels={'app': 'web', 'tier': 'front-end'})
+        pod2 = utils.create_test_pod(
+            uuid=magnum_utils.generate_uuid(),
+            labels={'app': 'db'})
+
+        res = self.dbapi.get_pod_list(self.context,
+                                      filters={'labels': {'app': 'web'}})
+        self.assertEqual([pod1.id], [r.id for r in res])
+
+        res = self.dbapi.get_pod_list(
+            self.context,
+            filters={'labels': {'app': 'web', 'tier': 'front-end'}})
+        self.assertEqual([pod1.id], [r.id for r in res])
+
+        res = self.dbapi.get_pod_list(self.context,
+                                      filters={'labels': {'app': 'db'}})
+        self.assertEqual([pod2.id], [r.id for r in res])
+
+        # '_' must not act as a wildcard
+        res = self.dbapi.get_pod_list(
+            self.context, filters={'labels': {'tier': 'front_end'}})
+        self.assertEqual([], [r.id for r in res])
+
     def test_get_pod_list_bay_not_exist(self):
         res = self.dbapi.get_pod_list(self.context,
                                       {'bay_uuid': self.bay.uuid})
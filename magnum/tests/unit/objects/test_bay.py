@@ -78,7 +78,7 @@ class TestBayObject(base.DbTestCase):
             bays = objects.Bay.list(self.context)
             mock_get_list.assert_called_once_with(
                 self.context, limit=None, marker=None, filters=None,
-                sort_dir=None, sort_key=None)
+                sort_dir=None, sort_key=None, columns=None)
             self.assertEqual(mock_get_list.call_count, 1)
             self.assertThat(bays, HasLength(1))
             self.assertIsInstance(bays[0], objects.Bay)
@@ -94,12 +94,49 @@ class TestBayObject(base.DbTestCase):
             mock_get_list.assert_called_once_with(self.context, sort_key=None,
                                                   sort_dir=None,
                                                   filters=filters, limit=None,
-                                                  marker=None)
+                                                  marker=None, columns=None)
             self.assertEqual(mock_get_list.call_count, 1)
             self.assertThat(bays, HasLength(1))
             self.assertIsInstance(bays[0], objects.Bay)
             self.assertEqual(self.context, bays[0]._context)
 
+    def test_list_with_columns(self):
+        with mock.patch.object(self.dbapi, 'get_bay_list',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [self.fake_bay]
+            columns = ['uuid', 'status']
+            bays = objects.Bay.list(self.context, columns=columns)
+
+            mock_get_list.assert_called_once_with(self.context, sort_key=None,
+                                                  sort_dir=None,
+                                                  filters=None, limit=None,
+                                                  marker=None, columns=columns)
+            self.assertThat(bays, HasLength(1))
+            self.assertEqual({'uuid': self.fake_bay['uuid'],
+                              'status': self.fake_bay['status']},
+                             bays[0].as_dict())
+
+    def test_list_views(self):
+        with mock.patch.object(self.dbapi, 'get_bay_list',
+                               autospec=True) as mock_get_list:
+            mock_get_list.return_value = [self.fake_bay]
+            bays = objects.Bay.list_views(self.context, columns=['uuid'])
+            mock_get_list.assert_called_once_with(
+                self.context, limit=None, marker=None, filters=None,
+                sort_dir=None, sort_key=None, columns=['uuid'])
+            self.assertThat(bays, HasLength(1))
+            self.assertIsInstance(bays[0], objects.bay.BayView)
+            self.assertEqual({'uuid': self.fake_bay['uuid']},
+                             bays[0].as_dict())
+            self.assertFalse(hasattr(bays[0], 'status'))
+
+    def test_view_is_read_only(self):
+        bay = objects.bay.BayView(self.fake_bay)
+        self.assertEqual(self.fake_bay['uuid'], bay.uuid)
+        self.assertEqual(self.fake_bay['uuid'], bay['uuid'])
+        self.assertRaises(AttributeError, setattr, bay, 'name', 'foo')
+        self.assertRaises(AttributeError, setattr, bay, 'foo', 'bar')
+
     def test_create(self):
         with mock.patch.object(self.dbapi, 'create_bay',
                                autospec=True) as mock_create_bay:
@@ -16,6 +16,7 @@
 import mock
 from testtools.matchers import HasLength
 
+from magnum.common import context
 from magnum.common import exception
 from magnum.common import utils as magnum_utils
 from magnum import objects
@@ -48,6 +49,42 @@ class TestBayModelObject(base.DbTestCase):
             mock_get_baymodel.assert_called_once_with(self.context, uuid)
             self.assertEqual(self.context, baymodel._context)
 
+    def test_get_by_uuid_is_cached(self):
+        uuid = self.fake_baymodel['uuid']
+        with mock.patch.object(self.dbapi, 'get_baymodel_by_uuid',
+                               autospec=True) as mock_get_baymodel:
+            mock_get_baymodel.return_value = self.fake_baymodel
+            bm1 = objects.BayModel.get_by_uuid(self.context, uuid)
+            bm2 = objects.BayModel.get_by_uuid(self.context, uuid)
+            mock_get_baymodel.assert_called_once_with(self.context, uuid)
+            self.assertIsNot(bm1, bm2)
+            self.assertEqual(bm1.as_dict(), bm2.as_dict())
+
+    def test_get_by_uuid_cache_checks_tenant(self):
+        uuid = self.fake_baymodel['uuid']
+        other_context = context.RequestContext(project_id='other_project',
+                                               user_id='other_user')
+        with mock.patch.object(self.dbapi, 'get_baymodel_by_uuid',
+                               autospec=True) as mock_get_baymodel:
+            mock_get_baymodel.return_value = self.fake_baymodel
+            objects.BayModel.get_by_uuid(self.context, uuid)
+            mock_get_baymodel.side_effect = exception.BayModelNotFound(
+                baymodel=uuid)
+            self.assertRaises(exception.BayModelNotFound,
+                              objects.BayModel.get_by_uuid,
+                              other_context, uuid)
+            self.assertEqual(2, mock_get_baymodel.call_count)
+
+    def test_get_by_uuid_cache_disabled(self):
+        self.config(cache_ttl=0, group='baymodel')
+        uuid = self.fake_baymodel['uuid']
+        with mock.patch.object(self.dbapi, 'get_baymodel_by_uuid',
+                               autospec=True) as mock_get_baymodel:
+            mock_get_baymodel.return_value = self.fake_baymodel
+            objects.BayModel.get_by_uuid(self.context, uuid)
+            objects.BayModel.get_by_uuid(self.context, uuid)
+            self.assertEqual(2, mock_get_baymodel.call_count)
+
     def test_get_bad_id_and_uuid(self):
         self.assertRaises(exception.InvalidIdentity,
                           objects.BayModel.get, self.context, 'not-a-uuid')
@@ -109,6 +146,19 @@ class TestBayModelObject(base.DbTestCase):
                     uuid, {'image_id': 'test-image'})
                 self.assertEqual(self.context, bm._context)
 
+    def test_save_invalidates_cache(self):
+        uuid = self.fake_baymodel['uuid']
+        with mock.patch.object(self.dbapi, 'get_baymodel_by_uuid',
+                               autospec=True) as mock_get_baymodel:
+            mock_get_baymodel.return_value = self.fake_baymodel
+            with mock.patch.object(self.dbapi, 'update_baymodel',
+                                   autospec=True):
+                bm = objects.BayModel.get_by_uuid(self.context, uuid)
+                bm.image_id = 'test-image'
+                bm.save()
+                objects.BayModel.get_by_uuid(self.context, uuid)
+                self.assertEqual(2, mock_get_baymodel.call_count)
+
     def test_refresh(self):
         uuid = self.fake_baymodel['uuid']
         new_uuid = magnum_utils.generate_uuid()
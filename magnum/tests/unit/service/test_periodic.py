@@ -134,3 +134,21 @@ class PeriodicTestCase(base.TestCase):
         self.assertEqual(self.bay3.status, bay_status.UPDATE_FAILED)
         self.assertEqual(self.bay3.status_reason, 'Stack with id 33 not '
                          'found in Heat.')
+
+    @mock.patch.object(dbapi.Connection, 'purge_deleted_rows')
+    def test_purge_deleted_rows(self, mock_purge):
+        self.config(purge_deleted_after_days=3, purge_batch_size=50,
+                    group='database')
+        mock_purge.return_value = 0
+
+        periodic.MagnumPeriodicTasks(CONF).purge_deleted_rows(None)
+
+        mock_purge.assert_called_once_with(mock.ANY, 50)
+
+    @mock.patch.object(dbapi.Connection, 'purge_deleted_rows')
+    def test_purge_deleted_rows_disabled(self, mock_purge):
+        self.config(purge_deleted_after_days=0, group='database')
+
+        periodic.MagnumPeriodicTasks(CONF).purge_deleted_rows(None)
+
+        self.assertFalse(mock_purge.called)